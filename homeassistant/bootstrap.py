@@ -15,6 +15,7 @@ import voluptuous as vol
 from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     REQUIRED_NEXT_PYTHON_DATE,
     REQUIRED_NEXT_PYTHON_VER,
@@ -24,9 +25,12 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
     DATA_SETUP_STARTED,
+    async_finish_setup_timeline,
+    async_get_setup_trace,
     async_set_domains_to_be_loaded,
     async_setup_component,
 )
+from homeassistant.util.json import save_json
 from homeassistant.util.logging import async_activate_log_queue_handler
 from homeassistant.util.package import async_get_user_site, is_virtual_env
 from homeassistant.util.yaml import clear_secret_cache
@@ -34,6 +38,7 @@ from homeassistant.util.yaml import clear_secret_cache
 _LOGGER = logging.getLogger(__name__)
 
 ERROR_LOG_FILENAME = "home-assistant.log"
+SETUP_TRACE_FILENAME = "home-assistant.setup_trace.json"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
@@ -98,6 +103,7 @@ async def async_setup_hass(
 
     if not safe_mode:
         await hass.async_add_executor_job(conf_util.process_ha_config_upgrade, hass)
+        conf_util.async_enable_yaml_node_cache(hass)
 
         try:
             config_dict = await conf_util.async_hass_config_yaml(hass)
@@ -153,9 +159,36 @@ async def async_setup_hass(
             {"safe_mode": {}, "http": http_conf}, hass,
         )
 
+    async def write_setup_trace(event: core.Event) -> None:
+        """Write the setup trace once Home Assistant has started."""
+        async_finish_setup_timeline(hass)
+        await _async_write_setup_trace(hass)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, write_setup_trace)
+
     return hass
 
 
+async def _async_write_setup_trace(hass: core.HomeAssistant) -> None:
+    """Write the setup timeline of the integrations as a Chrome trace file.
+
+    The file is only written when debug logging is enabled, the setup_timeline
+    websocket command serves the trace as well.
+    """
+    if not _LOGGER.isEnabledFor(logging.DEBUG):
+        return
+
+    path = hass.config.path(SETUP_TRACE_FILENAME)
+
+    try:
+        await hass.async_add_executor_job(save_json, path, async_get_setup_trace(hass))
+    except HomeAssistantError as err:
+        _LOGGER.warning("Unable to write the setup trace: %s", err)
+        return
+
+    _LOGGER.info("Setup trace written to %s", path)
+
+
 async def async_from_config_dict(
     config: ConfigType, hass: core.HomeAssistant
 ) -> Optional[core.HomeAssistant]:
@@ -428,6 +461,11 @@ async def _async_set_up_integrations(
 
     _LOGGER.info("Domains to be set up: %s", domains_to_setup)
 
+    # Import the integrations in the executor while the first ones are set up
+    hass.async_create_task(
+        loader.async_preload_integrations(hass, integration_cache.values())
+    )
+
     logging_domains = domains_to_setup & LOGGING_INTEGRATIONS
 
     # Load logging as soon as possible
@@ -489,3 +527,15 @@ async def _async_set_up_integrations(
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     await hass.async_block_till_done()
+
+    import_times: Optional[Dict[str, float]] = hass.data.get(loader.DATA_IMPORT_TIMES)
+    if import_times and _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Integration import times: %s",
+            ", ".join(
+                f"{domain}: {elapsed:.3f}s"
+                for domain, elapsed in sorted(
+                    import_times.items(), key=lambda item: item[1], reverse=True
+                )
+            ),
+        )
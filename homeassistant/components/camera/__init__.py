@@ -4,6 +4,7 @@ import base64
 import collections
 from contextlib import suppress
 from datetime import timedelta
+from functools import partial
 import hashlib
 import logging
 from random import SystemRandom
@@ -51,6 +52,7 @@ from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
 from .const import DATA_CAMERA_PREFS, DOMAIN
+from .frame_broker import FrameBroker
 from .prefs import CameraPreferences
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -153,7 +155,7 @@ async def async_get_image(hass, entity_id, timeout=10):
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            image = await camera.async_camera_frame()
 
             if image:
                 return Image(camera.content_type, image)
@@ -330,6 +332,7 @@ class Camera(Entity):
         self.stream_options = {}
         self.content_type = DEFAULT_CONTENT_TYPE
         self.access_tokens: collections.deque = collections.deque([], 2)
+        self.frame_broker = FrameBroker(self)
         self.async_update_token()
 
     @property
@@ -384,10 +387,23 @@ class Camera(Entity):
         """Return bytes of camera image."""
         return await self.hass.async_add_executor_job(self.camera_image)
 
+    async def async_camera_frame(self, max_age=None):
+        """Return bytes of camera image shared with all viewers of the camera.
+
+        A new image is only fetched from the camera when the last one is older
+        than max_age seconds, which defaults to the frame interval.
+        """
+        if max_age is None:
+            max_age = self.frame_interval
+        return await self.frame_broker.async_get_frame(max_age)
+
     async def handle_async_still_stream(self, request, interval):
         """Generate an HTTP MJPEG stream from camera images."""
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request,
+            partial(self.async_camera_frame, interval),
+            self.content_type,
+            interval,
         )
 
     async def handle_async_mjpeg_stream(self, request):
@@ -513,7 +529,7 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
-                image = await camera.async_camera_image()
+                image = await camera.async_camera_frame()
 
             if image:
                 return web.Response(body=image, content_type=camera.content_type)
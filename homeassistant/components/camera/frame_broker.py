@@ -0,0 +1,55 @@
+"""Share camera frames between all viewers of a camera."""
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+import homeassistant.util.dt as dt_util
+
+if TYPE_CHECKING:
+    from . import Camera
+
+# mypy: allow-untyped-calls
+
+
+class FrameBroker:
+    """Fetch frames from a camera once and share them with all viewers.
+
+    A frame is served to every request while it is younger than the maximum
+    age of the request. Otherwise a single fetch from the camera is started,
+    and all requests arriving while it runs wait for its result.
+    """
+
+    def __init__(self, camera: "Camera") -> None:
+        """Initialize the frame broker."""
+        self.camera = camera
+        self.fetches = 0
+        self._frame: Optional[bytes] = None
+        self._frame_time = dt_util.utcnow()
+        self._fetch: Optional[asyncio.Future] = None
+
+    async def async_get_frame(self, max_age: float) -> Optional[bytes]:
+        """Return a frame of the camera that is at most max_age seconds old."""
+        if self._frame is not None:
+            age = dt_util.utcnow() - self._frame_time
+            if age.total_seconds() < max_age:
+                return self._frame
+            self._frame = None
+
+        if self._fetch is None:
+            self._fetch = self.camera.hass.async_create_task(self._async_fetch())
+
+        # A viewer that gives up must not cancel the fetch of the others.
+        return await asyncio.shield(self._fetch)
+
+    async def _async_fetch(self) -> Optional[bytes]:
+        """Fetch a frame from the camera."""
+        self.fetches += 1
+        try:
+            frame = await self.camera.async_camera_image()
+        finally:
+            self._fetch = None
+
+        if frame:
+            self._frame = frame
+            self._frame_time = dt_util.utcnow()
+
+        return frame
@@ -1,8 +1,8 @@
 """Allows the creation of a sensor that filters state property."""
+import asyncio
 from collections import Counter, deque
 from copy import copy
 from datetime import timedelta
-from functools import partial
 import logging
 from numbers import Number
 import statistics
@@ -10,7 +10,7 @@ from typing import Optional
 
 import voluptuous as vol
 
-from homeassistant.components import history
+from homeassistant.components.recorder.warm_up import async_load_recent_states
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     ATTR_ENTITY_ID,
@@ -21,7 +21,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
-from homeassistant.core import callback
+from homeassistant.core import State, callback
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_state_change
@@ -233,46 +233,49 @@ class SensorFilter(Entity):
                     largest_window_time = filt.window_size
 
             # Retrieve the largest window_size of each type
+            requests = []
             if largest_window_items > 0:
-                filter_history = await self.hass.async_add_job(
-                    partial(
-                        history.get_last_state_changes,
+                requests.append(
+                    async_load_recent_states(
                         self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
+                        self._entity,
+                        limit=largest_window_items,
+                        changes_only=True,
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
-                start = dt_util.utcnow() - largest_window_time
-                filter_history = await self.hass.async_add_job(
-                    partial(
-                        history.state_changes_during_period,
+                requests.append(
+                    async_load_recent_states(
                         self.hass,
-                        start,
-                        entity_id=self._entity,
+                        self._entity,
+                        start_time=dt_util.utcnow() - largest_window_time,
+                        changes_only=True,
+                        include_start_state=True,
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
+            for recent_states in await asyncio.gather(*requests):
+                history_list.extend(
+                    [item for item in recent_states if item not in history_list]
+                )
 
             # Sort the window states
-            history_list = sorted(history_list, key=lambda s: s.last_updated)
-            _LOGGER.debug(
-                "Loading from history: %s",
-                [(s.state, s.last_updated) for s in history_list],
-            )
-
-            # Replay history through the filter chain
+            history_list = sorted(history_list, key=lambda item: item[1])
+            _LOGGER.debug("Loading from history: %s", history_list)
+
+            # Replay history through the filter chain. Only the values are
+            # loaded, so the replayed states carry the current attributes of
+            # the source (such as its unit) instead of the recorded ones.
+            source_state = self.hass.states.get(self._entity)
+            attributes = source_state.attributes if source_state else None
             prev_state = None
-            for state in history_list:
+            for value, last_updated in history_list:
+                state = State(
+                    self._entity,
+                    value,
+                    attributes,
+                    last_changed=last_updated,
+                    last_updated=last_updated,
+                )
                 filter_sensor_state_listener(self._entity, prev_state, state, False)
                 prev_state = state
 
@@ -14,11 +14,12 @@ import voluptuous as vol
 from homeassistant.components import recorder
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
+    StateCheckpoints,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
-from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.components.recorder.util import execute, execute_pages, session_scope
 from homeassistant.const import (
     CONF_DOMAINS,
     CONF_ENTITIES,
@@ -77,6 +78,8 @@ NEED_ATTRIBUTE_DOMAINS = {
     "water_heater",
 }
 SCRIPT_DOMAIN = "script"
+# Stay below the bound parameter limit of SQLite
+STATE_IDS_CHUNK_SIZE = 500
 ATTR_CAN_CANCEL = "can_cancel"
 
 QUERY_STATES = [
@@ -116,6 +119,32 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
+    query = _significant_states_query(
+        session, start_time, end_time, entity_ids, filters, significant_changes_only
+    ).order_by(States.entity_id, States.last_updated)
+
+    states = execute(query)
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_json(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+    )
+
+
+def _significant_states_query(
+    session, start_time, end_time, entity_ids, filters, significant_changes_only
+):
+    """Return the query of the significant states during a period."""
     if significant_changes_only:
         query = session.query(*QUERY_STATES).filter(
             (
@@ -133,24 +162,71 @@ def _get_significant_states(
     if end_time is not None:
         query = query.filter(States.last_updated < end_time)
 
-    query = query.order_by(States.entity_id, States.last_updated)
+    return query
 
-    states = execute(query)
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
+def _stream_significant_states(
+    hass,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """Yield the significant states during a period as a list per entity.
 
-    return _sorted_states_to_json(
-        hass,
-        session,
-        states,
-        start_time,
-        entity_ids,
-        filters,
-        include_start_time_state,
-        minimal_response,
-    )
+    The rows are read a page at a time with a session per page, so a slow
+    client does not hold on to a database connection and only the states
+    of one entity are built at a time. The lists are in the same order as
+    from get_significant_states.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        with session_scope(hass=hass) as session:
+            initial_states = _get_initial_states(
+                session, start_time, entity_ids, run, filters
+            )
+
+    def entity_rows(entity_id=None):
+        """Yield the rows of the significant states in pages."""
+
+        def build_query(session):
+            """Return the query of the significant states."""
+            query = _significant_states_query(
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                filters,
+                significant_changes_only,
+            ).add_columns(States.state_id)
+            if entity_id is not None:
+                query = query.filter(States.entity_id == entity_id)
+            return query
+
+        return execute_pages(
+            hass, build_query, (States.entity_id, States.last_updated, States.state_id)
+        )
+
+    if entity_ids is None:
+        groups = groupby(entity_rows(), lambda row: row.entity_id)
+    else:
+        groups = ((ent_id, entity_rows(ent_id)) for ent_id in entity_ids)
+
+    for ent_id, group in groups:
+        ent_results = []
+        if ent_id in initial_states:
+            ent_results.append(initial_states.pop(ent_id))
+        _append_entity_states(ent_results, ent_id, group, minimal_response)
+        if ent_results:
+            yield ent_results
+
+    # Entities without significant states during the period come last
+    for state in initial_states.values():
+        yield [state]
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
@@ -246,25 +322,50 @@ def _get_states_with_session(
             return []
 
     # We have more than one entity to look at (most commonly we want
-    # all entities,) so we need to do a search on all states since the
-    # last recorder run started.
+    # all entities,) so we start from the last checkpoint of the latest
+    # state ids and only search the states recorded since then.
+    search_start = run.start
+    state_ids = {}
+
+    checkpoint_time = (
+        session.query(func.max(StateCheckpoints.created))
+        .filter(
+            (StateCheckpoints.created >= run.start)
+            & (StateCheckpoints.created < utc_point_in_time)
+        )
+        .scalar()
+    )
+
+    if checkpoint_time is not None:
+        search_start = checkpoint_time
+        checkpoint_query = session.query(
+            StateCheckpoints.entity_id, StateCheckpoints.state_id
+        ).filter(StateCheckpoints.created == checkpoint_time)
+        if entity_ids:
+            checkpoint_query = checkpoint_query.filter(
+                StateCheckpoints.entity_id.in_(entity_ids)
+            )
+        state_ids.update(execute(checkpoint_query))
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
         func.max(States.last_updated).label("max_last_updated"),
     ).filter(
-        (States.last_updated >= run.start) & (States.last_updated < utc_point_in_time)
+        (States.last_updated >= search_start)
+        & (States.last_updated < utc_point_in_time)
     )
 
     if entity_ids:
-        most_recent_states_by_date.filter(States.entity_id.in_(entity_ids))
+        most_recent_states_by_date = most_recent_states_by_date.filter(
+            States.entity_id.in_(entity_ids)
+        )
 
     most_recent_states_by_date = most_recent_states_by_date.group_by(States.entity_id)
 
     most_recent_states_by_date = most_recent_states_by_date.subquery()
 
     most_recent_state_ids = session.query(
-        func.max(States.state_id).label("max_state_id")
+        States.entity_id, func.max(States.state_id).label("max_state_id")
     ).join(
         most_recent_states_by_date,
         and_(
@@ -275,16 +376,22 @@ def _get_states_with_session(
 
     most_recent_state_ids = most_recent_state_ids.group_by(States.entity_id)
 
-    most_recent_state_ids = most_recent_state_ids.subquery()
+    state_ids.update(execute(most_recent_state_ids))
 
-    query = query.join(
-        most_recent_state_ids, States.state_id == most_recent_state_ids.c.max_state_id,
-    ).filter(~States.domain.in_(IGNORE_DOMAINS))
+    ids = list(state_ids.values())
+    states = []
 
-    if filters:
-        query = filters.apply(query, entity_ids)
+    for idx in range(0, len(ids), STATE_IDS_CHUNK_SIZE):
+        chunk_query = query.filter(
+            States.state_id.in_(ids[idx : idx + STATE_IDS_CHUNK_SIZE])
+        ).filter(~States.domain.in_(IGNORE_DOMAINS))
+
+        if filters:
+            chunk_query = filters.apply(chunk_query, entity_ids)
 
-    return [LazyState(row) for row in execute(query)]
+        states.extend(LazyState(row) for row in execute(chunk_query))
+
+    return states
 
 
 def _sorted_states_to_json(
@@ -316,76 +423,102 @@ def _sorted_states_to_json(
 
     # Get the states at the start time
     timer_start = time.perf_counter()
+    initial_states = {}
     if include_start_time_state:
         run = recorder.run_information_from_instance(hass, start_time)
-        for state in _get_states_with_session(
-            session, start_time, entity_ids, run=run, filters=filters
-        ):
-            state.last_changed = start_time
-            state.last_updated = start_time
-            result[state.entity_id].append(state)
+        initial_states = _get_initial_states(
+            session, start_time, entity_ids, run, filters
+        )
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
-
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+        _LOGGER.debug(
+            "getting %d first datapoints took %fs", len(initial_states), elapsed
+        )
 
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
         ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(
-                [
-                    native_state
-                    for native_state in (LazyState(db_state) for db_state in group)
-                    if (
-                        domain != SCRIPT_DOMAIN
-                        or native_state.attributes.get(ATTR_CAN_CANCEL)
-                    )
-                ]
-            )
-            continue
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
-
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
+        if ent_id in initial_states:
+            ent_results.append(initial_states.pop(ent_id))
+        _append_entity_states(ent_results, ent_id, group, minimal_response)
 
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
+    # Entities without significant states during the period come last
+    for ent_id, state in initial_states.items():
+        result[ent_id].append(state)
 
     # Filter out the empty lists if some states had 0 results.
     return {key: val for key, val in result.items() if val}
 
 
+def _get_initial_states(session, start_time, entity_ids, run, filters):
+    """Return the states at the start time by entity id."""
+    initial_states = {}
+    for state in _get_states_with_session(
+        session, start_time, entity_ids, run=run, filters=filters
+    ):
+        state.last_changed = start_time
+        state.last_updated = start_time
+        initial_states[state.entity_id] = state
+    return initial_states
+
+
+def _append_entity_states(ent_results, ent_id, group, minimal_response):
+    """Append the states of a single entity to its results."""
+    domain = split_entity_id(ent_id)[0]
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
+
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(
+            [
+                native_state
+                for native_state in (LazyState(db_state) for db_state in group)
+                if (
+                    domain != SCRIPT_DOMAIN
+                    or native_state.attributes.get(ATTR_CAN_CANCEL)
+                )
+            ]
+        )
+        return
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        first_state = next(group, None)
+        if first_state is None:
+            return
+        ent_results.append(LazyState(first_state))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
+
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
+
+
 def get_state(hass, utc_point_in_time, entity_id, run=None):
     """Return a state at a specific point in time."""
     states = list(get_states(hass, utc_point_in_time, (entity_id,), run))
@@ -428,7 +561,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: Optional[str] = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime:
@@ -469,6 +602,19 @@ class HistoryPeriodView(HomeAssistantView):
 
         hass = request.app["hass"]
 
+        if not self.use_include_order:
+            return await self.json_stream(
+                request,
+                self._stream_significant_states_json,
+                hass,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+            )
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -529,6 +675,37 @@ class HistoryPeriodView(HomeAssistantView):
 
         return self.json(result)
 
+    def _stream_significant_states_json(
+        self,
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+    ):
+        """Yield the significant states from the database one entity at a time."""
+        timer_start = time.perf_counter()
+        count = 0
+
+        for ent_results in _stream_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            self.filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+        ):
+            count += len(ent_results)
+            yield ent_results
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d states in %fs", count, elapsed)
+
 
 class Filters:
     """Container for the configured include and exclude filters."""
@@ -1,7 +1,9 @@
 """Component to make instant statistics about your history."""
+import bisect
 import datetime
 import logging
 import math
+import threading
 
 import voluptuous as vol
 
@@ -105,6 +107,7 @@ class HistoryStatsSensor(Entity):
         self, hass, entity_id, entity_state, start, end, duration, sensor_type, name
     ):
         """Initialize the HistoryStats sensor."""
+        self.hass = hass
         self._entity_id = entity_id
         self._entity_state = entity_state
         self._duration = duration
@@ -118,6 +121,14 @@ class HistoryStatsSensor(Entity):
         self.value = None
         self.count = None
 
+        # Timestamps at which the entity started or stopped matching the
+        # state, loaded from the recorder once and then kept up to date from
+        # state changes. The first item holds the state at the start of the
+        # covered time range.
+        self._changes = None
+        self._pending_changes = []
+        self._lock = threading.Lock()
+
         @callback
         def start_refresh(*args):
             """Register state tracking."""
@@ -127,8 +138,21 @@ class HistoryStatsSensor(Entity):
                 """Force the component to refresh."""
                 self.async_schedule_update_ha_state(True)
 
+            @callback
+            def state_changed(entity_id, old_state, new_state):
+                """Record the state change and refresh."""
+                if new_state is not None:
+                    with self._lock:
+                        self._pending_changes.append(
+                            (
+                                new_state.last_changed.timestamp(),
+                                new_state.state == self._entity_state,
+                            )
+                        )
+                force_refresh()
+
             force_refresh()
-            async_track_state_change(self.hass, self._entity_id, force_refresh)
+            async_track_state_change(self.hass, self._entity_id, state_changed)
 
         # Delay first refresh to keep startup fast
         hass.bus.listen_once(EVENT_HOMEASSISTANT_START, start_refresh)
@@ -200,34 +224,38 @@ class HistoryStatsSensor(Entity):
         p_end_timestamp = math.floor(dt_util.as_timestamp(p_end))
         now_timestamp = math.floor(dt_util.as_timestamp(now))
 
+        changed = self._merge_pending_changes()
+
         # If period has not changed and current time after the period end...
         if (
-            start_timestamp == p_start_timestamp
+            not changed
+            and start_timestamp == p_start_timestamp
             and end_timestamp == p_end_timestamp
             and end_timestamp <= now_timestamp
         ):
             # Don't compute anything as the value cannot have changed
             return
 
-        # Get history between start and end
-        history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
-        )
-
-        if self._entity_id not in history_list.keys():
-            return
+        # Load the history when the period starts before the covered range
+        if not self._changes or start_timestamp < self._changes[0][0]:
+            if not self._load_history(start, start_timestamp):
+                return
+            # Add the changes that were not recorded yet
+            self._merge_pending_changes()
 
-        # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state == self._entity_state
+        last_state = False
         last_time = start_timestamp
         elapsed = 0
         count = 0
 
         # Make calculations
-        for item in history_list.get(self._entity_id):
-            current_state = item.state == self._entity_state
-            current_time = item.last_changed.timestamp()
+        for current_time, current_state in self._changes:
+            if current_time <= start_timestamp:
+                # State at the start of the period
+                last_state = current_state
+                continue
+            if current_time > end_timestamp:
+                break
 
             if last_state:
                 elapsed += current_time - last_time
@@ -248,6 +276,84 @@ class HistoryStatsSensor(Entity):
         # Save counter
         self.count = count
 
+        # Forget the changes before the period, except the state at its start,
+        # and the changes that did not change whether the state matches
+        first = 0
+        while (
+            first + 1 < len(self._changes)
+            and self._changes[first + 1][0] <= start_timestamp
+        ):
+            first += 1
+        changes = self._changes[first:]
+        self._changes = [changes[0]]
+        for change in changes[1:]:
+            if change[1] != self._changes[-1][1]:
+                self._changes.append(change)
+
+    def _load_history(self, start, start_timestamp):
+        """Load the state changes from the start of the period until now."""
+        history_list = history.state_changes_during_period(
+            self.hass, start, None, str(self._entity_id)
+        )
+
+        if self._entity_id not in history_list.keys():
+            self._changes = None
+            # The changes will be loaded together with the history
+            with self._lock:
+                self._pending_changes = []
+            return False
+
+        # The history starts with the state at the start of the period
+        self._changes = [(start_timestamp, False)]
+        for item in history_list.get(self._entity_id):
+            change_time = item.last_changed.timestamp()
+            matches = item.state == self._entity_state
+            if change_time <= start_timestamp:
+                self._changes[0] = (start_timestamp, matches)
+            else:
+                self._add_change(change_time, matches)
+
+        # The recorder commits with a delay, so the latest change of the
+        # entity may not be in the history yet
+        current_state = self.hass.states.get(self._entity_id)
+        if current_state is not None:
+            self._add_change(
+                current_state.last_changed.timestamp(),
+                current_state.state == self._entity_state,
+            )
+
+        return True
+
+    def _merge_pending_changes(self):
+        """Add the state changes recorded since the last update.
+
+        Return if any change was added.
+        """
+        if self._changes is None:
+            # Keep the changes until the history is loaded
+            return False
+
+        with self._lock:
+            pending, self._pending_changes = self._pending_changes, []
+
+        changed = False
+        for change_time, matches in pending:
+            changed |= self._add_change(change_time, matches)
+        return changed
+
+    def _add_change(self, change_time, matches):
+        """Add a state change in time order.
+
+        The changes that are not recorded yet can be older than the current
+        state added with the history. Return if the change was added.
+        """
+        index = bisect.bisect_right(self._changes, (change_time, True))
+        if index == 0 or self._changes[index - 1][0] == change_time:
+            # Before the covered time range or already known
+            return False
+        self._changes.insert(index, (change_time, matches))
+        return True
+
     def update_period(self):
         """Parse the templates and store a datetime tuple in _period."""
         start = None
@@ -2,7 +2,8 @@
 import asyncio
 import json
 import logging
-from typing import Any, Callable, List, Optional
+import threading
+from typing import Any, Callable, Iterable, List, Optional
 
 from aiohttp import web
 from aiohttp.typedefs import LooseHeaders
@@ -22,6 +23,9 @@ from .const import KEY_AUTHENTICATED, KEY_HASS, KEY_REAL_IP
 
 _LOGGER = logging.getLogger(__name__)
 
+# Max number of encoded items waiting to be written in a streamed response
+STREAM_QUEUE_SIZE = 16
+
 
 class HomeAssistantView:
     """Base view for all views."""
@@ -62,6 +66,86 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    @staticmethod
+    async def json_stream(
+        request: web.Request,
+        target: Callable[..., Iterable[Any]],
+        *args: Any,
+        status_code: int = HTTP_OK,
+    ) -> web.StreamResponse:
+        """Return a JSON list response that is streamed to the client.
+
+        Target is called in the executor and every item of the iterable it
+        returns is encoded and written as soon as it is produced, so the
+        whole result is never held in memory.
+        """
+        hass = request.app[KEY_HASS]
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        cancelled = threading.Event()
+
+        def put(item: Any) -> None:
+            """Put an item on the queue from the executor."""
+            asyncio.run_coroutine_threadsafe(queue.put(item), hass.loop).result()
+
+        def produce() -> None:
+            """Encode the items in the executor."""
+            items = target(*args)
+            try:
+                for item in items:
+                    if cancelled.is_set():
+                        return
+                    put(
+                        json.dumps(
+                            item, sort_keys=True, cls=JSONEncoder, allow_nan=False
+                        ).encode("UTF-8")
+                    )
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while streaming %s", request.path)
+                put(err)
+            finally:
+                close = getattr(items, "close", None)
+                if close is not None:
+                    close()
+                put(None)
+
+        producer = hass.async_add_executor_job(produce)
+        response = web.StreamResponse(status=status_code)
+        response.content_type = CONTENT_TYPE_JSON
+        response.enable_compression()
+        separator = b"["
+
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                if isinstance(chunk, Exception):
+                    if not response.prepared:
+                        raise HTTPInternalServerError
+                    # Headers are sent, close the connection after what we have
+                    response.force_close()
+                    return response
+                if not response.prepared:
+                    await response.prepare(request)
+                await response.write(separator + chunk)
+                separator = b","
+
+            if not response.prepared:
+                await response.prepare(request)
+            await response.write(b"]" if separator == b"," else b"[]")
+            await response.write_eof()
+        finally:
+            cancelled.set()
+            # Drain the queue so a producer waiting on it can finish
+            while not producer.done():
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait(
+                    [producer, getter], return_when=asyncio.FIRST_COMPLETED
+                )
+                getter.cancel()
+
+        return response
+
     def json_message(
         self,
         message: str,
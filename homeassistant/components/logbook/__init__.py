@@ -21,6 +21,7 @@ from homeassistant.components.recorder.models import (
 from homeassistant.components.recorder.util import (
     QUERY_RETRY_WAIT,
     RETRIES,
+    execute_pages,
     session_scope,
 )
 from homeassistant.const import (
@@ -188,13 +189,9 @@ class LogbookView(HomeAssistantView):
 
         hass = request.app["hass"]
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(hass, self.config, start_day, end_day, entity_id)
-            )
-
-        return await hass.async_add_job(json_events)
+        return await self.json_stream(
+            request, _stream_events, hass, self.config, start_day, end_day, entity_id
+        )
 
 
 def humanify(hass, events, entity_attr_cache, prev_states=None):
@@ -360,30 +357,35 @@ def _all_entities_filter(_):
 
 def _get_events(hass, config, start_day, end_day, entity_id=None):
     """Get events for a period of time."""
-    entity_attr_cache = EntityAttributeCache(hass)
+    return list(_stream_events(hass, config, start_day, end_day, entity_id))
 
-    def yield_events(query):
-        """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
-            event = LazyEventPartialState(row)
-            if _keep_event(hass, event, entities_filter, entity_attr_cache):
-                yield event
 
-    with session_scope(hass=hass) as session:
-        if entity_id is not None:
-            entity_ids = [entity_id.lower()]
-            entities_filter = generate_filter([], entity_ids, [], [])
-        elif config.get(CONF_EXCLUDE) or config.get(CONF_INCLUDE):
-            entities_filter = convert_include_exclude_filter(config)
+def _stream_events(hass, config, start_day, end_day, entity_id=None):
+    """Yield the events for a period of time as they are read.
+
+    The events are read a page at a time with a session per page, so a slow
+    client does not hold on to a database connection.
+    """
+    entity_attr_cache = EntityAttributeCache(hass)
+
+    if entity_id is not None:
+        entity_ids = [entity_id.lower()]
+        entities_filter = generate_filter([], entity_ids, [], [])
+    elif config.get(CONF_EXCLUDE) or config.get(CONF_INCLUDE):
+        entities_filter = convert_include_exclude_filter(config)
+        with session_scope(hass=hass) as session:
             entity_ids = _get_related_entity_ids(session, entities_filter)
-        else:
-            entities_filter = _all_entities_filter
-            entity_ids = None
+    else:
+        entities_filter = _all_entities_filter
+        entity_ids = None
 
+    def build_query(session):
+        """Return the query of the events during the period."""
         old_state = aliased(States, name="old_state")
 
         query = (
             session.query(
+                Events.event_id,
                 Events.event_type,
                 Events.event_data,
                 Events.time_fired,
@@ -393,9 +395,10 @@ def _get_events(hass, config, start_day, end_day, entity_id=None):
                 States.entity_id,
                 States.domain,
                 States.attributes,
+                States.has_unit_of_measurement,
+                States.device_class,
                 old_state.state_id.label("old_state_id"),
             )
-            .order_by(Events.time_fired)
             .outerjoin(States, (Events.event_id == States.event_id))
             .outerjoin(old_state, (States.old_state_id == old_state.state_id))
             # The below filter, removes state change events that do not have
@@ -420,10 +423,20 @@ def _get_events(hass, config, start_day, end_day, entity_id=None):
             # Prefilter out continuous domains that have
             # ATTR_UNIT_OF_MEASUREMENT as its much faster in sql.
             #
+            # States stored before v10 schema do not have the
+            # has_unit_of_measurement column set, so we match their
+            # attributes instead.
+            #
             .filter(
                 (Events.event_type != EVENT_STATE_CHANGED)
                 | sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS))
-                | sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON))
+                | States.has_unit_of_measurement.is_(False)
+                | (
+                    States.has_unit_of_measurement.is_(None)
+                    & sqlalchemy.not_(
+                        States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)
+                    )
+                )
             )
             .filter(
                 Events.event_type.in_(ALL_EVENT_TYPES + list(hass.data.get(DOMAIN, {})))
@@ -445,9 +458,20 @@ def _get_events(hass, config, start_day, end_day, entity_id=None):
                 | (States.state_id.is_(None))
             )
 
-        # When all data is schema v8 or later, prev_states can be removed
-        prev_states = {}
-        return list(humanify(hass, yield_events(query), entity_attr_cache, prev_states))
+        return query
+
+    def yield_events():
+        """Yield Events that are not filtered away."""
+        for row in execute_pages(
+            hass, build_query, (Events.time_fired, Events.event_id)
+        ):
+            event = LazyEventPartialState(row)
+            if _keep_event(hass, event, entities_filter, entity_attr_cache):
+                yield event
+
+    # When all data is schema v8 or later, prev_states can be removed
+    prev_states = {}
+    yield from humanify(hass, yield_events(), entity_attr_cache, prev_states)
 
 
 def _keep_event(hass, event, entities_filter, entity_attr_cache):
@@ -614,6 +638,15 @@ class LazyEventPartialState:
                 self._attributes = json.loads(self._row.attributes)
         return self._attributes
 
+    @property
+    def device_class(self):
+        """Device class of the state."""
+        # States stored before v10 schema do not have the
+        # device_class column set.
+        if self._row.has_unit_of_measurement is None:
+            return self.attributes.get(ATTR_DEVICE_CLASS)
+        return self._row.device_class
+
     @property
     def data(self):
         """Event data."""
@@ -694,6 +727,10 @@ class EntityAttributeCache:
             self._cache[entity_id][attribute] = current_state.attributes.get(
                 attribute, None
             )
+        elif attribute == ATTR_DEVICE_CLASS:
+            # The device class is stored in its own column, so the
+            # attributes do not need to be decoded
+            self._cache[entity_id][attribute] = event.device_class
         else:
             # If the entity has been removed, decode the attributes
             # instead
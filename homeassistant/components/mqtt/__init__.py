@@ -8,7 +8,7 @@ import logging
 from operator import attrgetter
 import os
 import ssl
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 
 import attr
 import certifi
@@ -578,11 +578,16 @@ class MQTT:
         # We don't import on the top because some integrations
         # should be able to optionally rely on MQTT.
         import paho.mqtt.client as mqtt  # pylint: disable=import-outside-toplevel
+        from paho.mqtt.matcher import (  # pylint: disable=import-outside-toplevel
+            MQTTMatcher,
+        )
 
         self.hass = hass
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: List[Subscription] = []
+        # Topic filter trie, each filter maps to the list of its subscriptions
+        self._matcher = MQTTMatcher()
         self.connected = False
         self._mqttc: mqtt.Client = None
         self._paho_lock = asyncio.Lock()
@@ -740,6 +745,10 @@ class MQTT:
 
         subscription = Subscription(topic, msg_callback, qos, encoding)
         self.subscriptions.append(subscription)
+        try:
+            self._matcher[topic].append(subscription)
+        except KeyError:
+            self._matcher[topic] = [subscription]
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -752,9 +761,12 @@ class MQTT:
                 raise HomeAssistantError("Can't remove subscription twice")
             self.subscriptions.remove(subscription)
 
-            if any(other.topic == topic for other in self.subscriptions):
+            topic_subscriptions = self._matcher[topic]
+            topic_subscriptions.remove(subscription)
+            if topic_subscriptions:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
+            del self._matcher[topic]
 
             # Only unsubscribe if currently connected.
             if self.connected:
@@ -843,36 +855,48 @@ class MQTT:
             msg.payload,
         )
         timestamp = dt_util.utcnow()
+        # Decode the payload only once per requested encoding
+        decoded_payloads: Dict[Optional[str], Optional[SubscribePayloadType]] = {
+            None: msg.payload
+        }
 
-        for subscription in self.subscriptions:
-            if not _match_topic(subscription.topic, msg.topic):
-                continue
-
-            payload: SubscribePayloadType = msg.payload
-            if subscription.encoding is not None:
-                try:
-                    payload = msg.payload.decode(subscription.encoding)
-                except (AttributeError, UnicodeDecodeError):
+        # Materialize the matches, callbacks may (un)subscribe while we iterate
+        matches = [
+            list(topic_subscriptions)
+            for topic_subscriptions in self._matcher.iter_match(msg.topic)
+        ]
+
+        for topic_subscriptions in matches:
+            for subscription in topic_subscriptions:
+                encoding = subscription.encoding
+                if encoding not in decoded_payloads:
+                    try:
+                        decoded_payloads[encoding] = msg.payload.decode(encoding)
+                    except (AttributeError, UnicodeDecodeError):
+                        decoded_payloads[encoding] = None
+
+                payload = decoded_payloads[encoding]
+                if payload is None:
                     _LOGGER.warning(
                         "Can't decode payload %s on %s with encoding %s (for %s)",
                         msg.payload,
                         msg.topic,
-                        subscription.encoding,
+                        encoding,
                         subscription.callback,
                     )
                     continue
 
-            self.hass.async_run_job(
-                subscription.callback,
-                Message(
-                    msg.topic,
-                    payload,
-                    msg.qos,
-                    msg.retain,
-                    subscription.topic,
-                    timestamp,
-                ),
-            )
+                self.hass.async_run_job(
+                    subscription.callback,
+                    Message(
+                        msg.topic,
+                        payload,
+                        msg.qos,
+                        msg.retain,
+                        subscription.topic,
+                        timestamp,
+                    ),
+                )
 
     def _mqtt_on_disconnect(self, _mqttc, _userdata, result_code: int) -> None:
         """Disconnected callback."""
@@ -897,20 +921,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _match_topic(subscription: str, topic: str) -> bool:
-    """Test if topic matches subscription."""
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-    try:
-        next(matcher.iter_match(topic))
-        return True
-    except StopIteration:
-        return False
-
-
 class MqttAttributes(Entity):
     """Mixin used for platforms that support JSON attributes."""
 
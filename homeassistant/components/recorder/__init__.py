@@ -2,14 +2,14 @@
 import asyncio
 from collections import namedtuple
 import concurrent.futures
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import queue
 import threading
 import time
 from typing import Any, Callable, List, Optional
 
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select
+from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select, text
 from sqlalchemy.orm import scoped_session, sessionmaker
 from sqlalchemy.pool import StaticPool
 import voluptuous as vol
@@ -17,6 +17,7 @@ import voluptuous as vol
 from homeassistant.components import persistent_notification
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_NOW,
     CONF_EXCLUDE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
@@ -36,7 +37,7 @@ import homeassistant.util.dt as dt_util
 
 from . import migration, purge
 from .const import DATA_INSTANCE
-from .models import Base, Events, RecorderRuns, States
+from .models import Base, Events, RecorderRuns, StateCheckpoints, States
 from .util import session_scope
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,6 +61,9 @@ DEFAULT_DB_FILE = "home-assistant_v2.db"
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 KEEPALIVE_TIME = 30
+# How often the latest state id of every entity is written to the
+# state_checkpoints table to bound point in time state lookups
+CHECKPOINT_INTERVAL = timedelta(hours=1)
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
@@ -69,6 +73,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_BATCH_WRITES = "batch_writes"
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
     {vol.Optional(CONF_EVENT_TYPES): vol.All(cv.ensure_list, [cv.string])}
@@ -95,6 +100,7 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(CONF_COMMIT_INTERVAL, default=1): vol.All(
                         vol.Coerce(int), vol.Range(min=0)
                     ),
+                    vol.Optional(CONF_BATCH_WRITES, default=False): cv.boolean,
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -156,6 +162,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    batch_writes = conf[CONF_BATCH_WRITES]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
 
@@ -174,6 +181,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        batch_writes=batch_writes,
     )
     instance.async_initialize()
     instance.start()
@@ -206,6 +214,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: List[str],
+        batch_writes: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -225,10 +234,33 @@ class Recorder(threading.Thread):
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
+        self.batch_writes = batch_writes
+
+        # Rows waiting for the next commit when batch_writes is enabled
+        self._pending_events: List[dict] = []
+        self._pending_states: List[dict] = []
+        self._pending_checkpoints: List[dict] = []
+        self._last_checkpoint = self.recording_start
+        # Progress of the purge that is being processed in batches
+        self.purge_progress: Optional[purge.PurgeProgress] = None
+        self._next_event_id: Optional[int] = None
+        self._next_state_id: Optional[int] = None
+        # Metrics about the last commit
+        self.queue_depth = 0
+        self.last_commit_rows = 0
 
         self._timechanges_seen = 0
         self._keepalive_count = 0
         self._old_state_ids = {}
+        # Committed old state ids of the entities changed since the last
+        # commit, restored when the rows of the session are rolled back
+        self._committed_old_state_ids = {}
+        # Latest state id of every entity recorded in this run, split in the
+        # committed rows and the rows of the current session
+        self._checkpoint_state_ids = {}
+        self._session_state_ids = {}
+        # Last attributes and their JSON per entity, see States.from_event
+        self._attributes_json = {}
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = False
@@ -355,6 +387,10 @@ class Recorder(threading.Thread):
                 if self._keepalive_count >= KEEPALIVE_TIME:
                     self._keepalive_count = 0
                     self._send_keep_alive()
+                now = event.data[ATTR_NOW]
+                if now - self._last_checkpoint >= CHECKPOINT_INTERVAL:
+                    self._last_checkpoint = now
+                    self._queue_checkpoint(now)
                 if self.commit_interval:
                     self._timechanges_seen += 1
                     if self._timechanges_seen >= self.commit_interval:
@@ -371,10 +407,18 @@ class Recorder(threading.Thread):
                     self.queue.task_done()
                     continue
 
+            if self.batch_writes:
+                self._queue_event_rows(event)
+                if not self.commit_interval:
+                    self._commit_event_session_or_retry()
+                self.queue.task_done()
+                continue
+
             try:
-                dbevent = Events.from_event(event)
                 if event.event_type == EVENT_STATE_CHANGED:
-                    dbevent.event_data = "{}"
+                    dbevent = Events.from_event(event, event_data="{}")
+                else:
+                    dbevent = Events.from_event(event)
                 self.event_session.add(dbevent)
                 self.event_session.flush()
             except (TypeError, ValueError):
@@ -385,15 +429,12 @@ class Recorder(threading.Thread):
 
             if dbevent and event.event_type == EVENT_STATE_CHANGED:
                 try:
-                    dbstate = States.from_event(event)
+                    dbstate = States.from_event(event, self._attributes_json)
                     dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
                     dbstate.event_id = dbevent.event_id
                     self.event_session.add(dbstate)
                     self.event_session.flush()
-                    if "new_state" in event.data:
-                        self._old_state_ids[dbstate.entity_id] = dbstate.state_id
-                    elif dbstate.entity_id in self._old_state_ids:
-                        del self._old_state_ids[dbstate.entity_id]
+                    self._track_state_id(event, dbstate)
                 except (TypeError, ValueError):
                     _LOGGER.warning(
                         "State is not JSON serializable: %s",
@@ -410,6 +451,129 @@ class Recorder(threading.Thread):
 
             self.queue.task_done()
 
+    def _queue_event_rows(self, event):
+        """Queue the event and its state change for a bulk insert on commit.
+
+        Primary keys are assigned here instead of being read back from the
+        database so the linkage between events and states is known without
+        flushing every row.
+        """
+        if self._next_event_id is None:
+            self._load_next_ids()
+
+        try:
+            if event.event_type == EVENT_STATE_CHANGED:
+                dbevent = Events.from_event(event, event_data="{}")
+            else:
+                dbevent = Events.from_event(event)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Event is not JSON serializable: %s", event)
+            return
+
+        now = dt_util.utcnow()
+        dbevent.event_id = self._next_event_id
+        dbevent.created = now
+
+        dbstate = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            try:
+                dbstate = States.from_event(event, self._attributes_json)
+            except (TypeError, ValueError):
+                _LOGGER.warning(
+                    "State is not JSON serializable: %s", event.data.get("new_state"),
+                )
+
+        self._next_event_id += 1
+        self._pending_events.append(_row_to_dict(dbevent))
+
+        if dbstate is None:
+            return
+
+        dbstate.state_id = self._next_state_id
+        dbstate.event_id = dbevent.event_id
+        dbstate.old_state_id = self._old_state_ids.get(dbstate.entity_id)
+        dbstate.created = now
+        self._next_state_id += 1
+        self._pending_states.append(_row_to_dict(dbstate))
+        self._track_state_id(event, dbstate)
+
+    def _track_state_id(self, event, dbstate):
+        """Remember the state id for the next state and the checkpoints."""
+        entity_id = dbstate.entity_id
+        self._session_state_ids[entity_id] = dbstate.state_id
+        if entity_id not in self._committed_old_state_ids:
+            self._committed_old_state_ids[entity_id] = self._old_state_ids.get(
+                entity_id
+            )
+
+        if "new_state" in event.data:
+            self._old_state_ids[entity_id] = dbstate.state_id
+        elif entity_id in self._old_state_ids:
+            del self._old_state_ids[entity_id]
+
+    def _restore_old_state_ids(self):
+        """Link new states to the committed rows again after a rollback."""
+        self._session_state_ids = {}
+        for entity_id, state_id in self._committed_old_state_ids.items():
+            if state_id is None:
+                self._old_state_ids.pop(entity_id, None)
+            else:
+                self._old_state_ids[entity_id] = state_id
+        self._committed_old_state_ids = {}
+
+    def _queue_checkpoint(self, now):
+        """Queue a checkpoint of the latest state id of every entity.
+
+        The checkpoint is committed together with the rows of the session,
+        so it covers the committed rows and the rows waiting in the session.
+        """
+        state_ids = {**self._checkpoint_state_ids, **self._session_state_ids}
+        self._pending_checkpoints.extend(
+            {"created": now, "entity_id": entity_id, "state_id": state_id}
+            for entity_id, state_id in state_ids.items()
+        )
+
+    def _load_next_ids(self):
+        """Load the next free event and state ids from the database."""
+        session = self.event_session
+        self._next_event_id = (
+            session.query(func.max(Events.event_id)).scalar() or 0
+        ) + 1
+        self._next_state_id = (
+            session.query(func.max(States.state_id)).scalar() or 0
+        ) + 1
+
+    def _sync_id_sequences(self):
+        """Advance the id sequences past the ids assigned by batched writes.
+
+        PostgreSQL does not advance the sequence of a serial column when a
+        row is inserted with an explicit id, so the database would hand out
+        ids that are already taken once batched writes are turned off.
+        """
+        if self.engine.dialect.name != "postgresql":
+            return
+
+        for table, column, pending, next_id in (
+            ("events", "event_id", self._pending_events, self._next_event_id),
+            ("states", "state_id", self._pending_states, self._next_state_id),
+        ):
+            if not pending:
+                continue
+            self.event_session.execute(
+                text(
+                    "SELECT setval(pg_get_serial_sequence(:table, :column), :last_id)"
+                ),
+                {"table": table, "column": column, "last_id": next_id - 1},
+            )
+
+    def _clear_pending_rows(self):
+        """Drop the queued rows and reload the ids on the next write."""
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_checkpoints = []
+        self._next_event_id = None
+        self._next_state_id = None
+
     def _send_keep_alive(self):
         try:
             _LOGGER.debug("Sending keepalive")
@@ -451,6 +615,9 @@ class Recorder(threading.Thread):
             except Exception as err:  # pylint: disable=broad-except
                 # Must catch the exception to prevent the loop from collapsing
                 _LOGGER.exception("Error saving events: %s", err)
+                # Drop the rows that failed, inserting them again would fail
+                # on every following commit as well
+                self._reopen_event_session()
                 return
 
         _LOGGER.error(
@@ -460,6 +627,11 @@ class Recorder(threading.Thread):
         self._reopen_event_session()
 
     def _reopen_event_session(self):
+        self._pending_checkpoints = []
+        if self.batch_writes:
+            self._clear_pending_rows()
+        self._restore_old_state_ids()
+
         try:
             self.event_session.rollback()
         except Exception as err:  # pylint: disable=broad-except
@@ -479,13 +651,43 @@ class Recorder(threading.Thread):
             _LOGGER.exception("Error while creating new event session: %s", err)
 
     def _commit_event_session(self):
+        rows = len(self._pending_events) + len(self._pending_states)
         try:
+            for table, pending in (
+                (Events.__table__, self._pending_events),
+                (States.__table__, self._pending_states),
+                (StateCheckpoints.__table__, self._pending_checkpoints),
+            ):
+                if pending:
+                    self.event_session.execute(table.insert(), pending)
+            if self.batch_writes and rows:
+                self._sync_id_sequences()
             self.event_session.commit()
         except Exception as err:
             _LOGGER.error("Error executing query: %s", err)
             self.event_session.rollback()
+            # The pending rows of batched writes are inserted again on retry,
+            # the rows added to the session are gone with the rollback
+            if not self.batch_writes:
+                self._restore_old_state_ids()
             raise
 
+        self._committed_old_state_ids = {}
+        self._checkpoint_state_ids.update(self._session_state_ids)
+        self._session_state_ids = {}
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_checkpoints = []
+
+        if not self.batch_writes or not rows:
+            return
+
+        self.queue_depth = self.queue.qsize()
+        self.last_commit_rows = rows
+        _LOGGER.debug(
+            "Committed %d rows, %d events waiting in the queue", rows, self.queue_depth,
+        )
+
     @callback
     def event_listener(self, event):
         """Listen for new events and put them in the process queue."""
@@ -573,3 +775,8 @@ class Recorder(threading.Thread):
             self.event_session.close()
 
         self.run_info = None
+
+
+def _row_to_dict(row) -> dict:
+    """Return the column values of a model instance for a bulk insert."""
+    return {column.key: getattr(row, column.key) for column in row.__table__.columns}
@@ -287,6 +287,12 @@ def _apply_update(engine, new_version, old_version):
         _drop_index(engine, "states", "ix_states_entity_id")
         _create_index(engine, "events", "ix_events_event_type_time_fired")
         _drop_index(engine, "events", "ix_events_event_type")
+    elif new_version == 10:
+        _add_columns(
+            engine,
+            "states",
+            ["has_unit_of_measurement BOOLEAN", "device_class VARCHAR(64)"],
+        )
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
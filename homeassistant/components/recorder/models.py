@@ -16,6 +16,7 @@ from sqlalchemy import (
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm.session import Session
 
+from homeassistant.const import ATTR_DEVICE_CLASS, ATTR_UNIT_OF_MEASUREMENT
 from homeassistant.core import Context, Event, EventOrigin, State, split_entity_id
 from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
@@ -24,12 +25,14 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 9
+SCHEMA_VERSION = 10
 
 _LOGGER = logging.getLogger(__name__)
 
 DB_TIMEZONE = "+00:00"
 
+MAX_LENGTH_DEVICE_CLASS = 64
+
 
 class Events(Base):  # type: ignore
     """Event history data."""
@@ -52,11 +55,11 @@ class Events(Base):  # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
+    def from_event(event, event_data=None):
         """Create an event database object from a native event."""
         return Events(
             event_type=event.event_type,
-            event_data=json.dumps(event.data, cls=JSONEncoder),
+            event_data=event_data or json.dumps(event.data, cls=JSONEncoder),
             origin=str(event.origin),
             time_fired=event.time_fired,
             context_id=event.context.id,
@@ -99,6 +102,10 @@ class States(Base):  # type: ignore
     last_updated = Column(DateTime(timezone=True), default=dt_util.utcnow, index=True)
     created = Column(DateTime(timezone=True), default=dt_util.utcnow)
     old_state_id = Column(Integer)
+    # Attributes the logbook filters on, so it does not need to match the
+    # JSON of the attributes. Not set on states recorded before schema v10.
+    has_unit_of_measurement = Column(Boolean)
+    device_class = Column(String(MAX_LENGTH_DEVICE_CLASS))
 
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
@@ -107,8 +114,13 @@ class States(Base):  # type: ignore
     )
 
     @staticmethod
-    def from_event(event):
-        """Create object from a state_changed event."""
+    def from_event(event, attributes_cache=None):
+        """Create object from a state_changed event.
+
+        The attributes_cache maps entity_id to the last attributes mapping
+        and its JSON, so attributes shared with the previous state are not
+        encoded again.
+        """
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
@@ -116,15 +128,40 @@ class States(Base):  # type: ignore
 
         # State got deleted
         if state is None:
+            if attributes_cache is not None:
+                attributes_cache.pop(entity_id, None)
             dbstate.state = ""
             dbstate.domain = split_entity_id(entity_id)[0]
             dbstate.attributes = "{}"
+            dbstate.has_unit_of_measurement = False
             dbstate.last_changed = event.time_fired
             dbstate.last_updated = event.time_fired
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
+            cached = None
+            if attributes_cache is not None:
+                cached = attributes_cache.get(entity_id)
+            if cached is not None and cached[0] is state.attributes:
+                dbstate.attributes = cached[1]
+            else:
+                dbstate.attributes = json.dumps(dict(state.attributes), cls=JSONEncoder)
+                if attributes_cache is not None:
+                    attributes_cache[entity_id] = (
+                        state.attributes,
+                        dbstate.attributes,
+                    )
+            dbstate.has_unit_of_measurement = (
+                ATTR_UNIT_OF_MEASUREMENT in state.attributes
+            )
+            device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+            # Longer device classes of custom integrations do not fit the
+            # column, the logbook only needs the classes it has messages for
+            if (
+                isinstance(device_class, str)
+                and len(device_class) <= MAX_LENGTH_DEVICE_CLASS
+            ):
+                dbstate.device_class = device_class
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -150,6 +187,16 @@ class States(Base):  # type: ignore
             return None
 
 
+class StateCheckpoints(Base):  # type: ignore
+    """Latest recorded state of every entity at a point in time."""
+
+    __tablename__ = "state_checkpoints"
+    checkpoint_id = Column(Integer, primary_key=True)
+    created = Column(DateTime(timezone=True), index=True)
+    entity_id = Column(String(255))
+    state_id = Column(Integer)
+
+
 class RecorderRuns(Base):  # type: ignore
     """Representation of recorder run."""
 
@@ -3,24 +3,47 @@ from datetime import timedelta
 import logging
 import time
 
+import attr
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 import homeassistant.util.dt as dt_util
 
-from .models import Events, RecorderRuns, States
+from .models import Events, RecorderRuns, StateCheckpoints, States
 from .util import execute, session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# Max number of rows deleted per table in one batch, this also keeps us
+# below the limit of bound parameters in SQLite
+MAX_ROWS_TO_PURGE = 998
+
+
+@attr.s(slots=True)
+class PurgeProgress:
+    """Progress of a purge that is spread over several batches."""
+
+    keep_days = attr.ib(type=int)
+    started = attr.ib(type=float, factory=time.monotonic)
+    batches = attr.ib(type=int, default=0)
+    states = attr.ib(type=int, default=0)
+    events = attr.ib(type=int, default=0)
+
 
 def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
     """Purge events and states older than purge_days ago.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Cleans up an timeframe of an hour, based on the oldest record, and at
+    most MAX_ROWS_TO_PURGE rows per table. Returns False when the purge has
+    to be continued, the recorder processes the queued events in between.
     """
     purge_before = dt_util.utcnow() - timedelta(days=purge_days)
     _LOGGER.debug("Purging states and events before target %s", purge_before)
 
+    progress = instance.purge_progress
+    if progress is None or progress.keep_days != purge_days:
+        progress = instance.purge_progress = PurgeProgress(purge_days)
+    progress.batches += 1
+
     try:
         with session_scope(session=instance.get_session()) as session:
             # Purge a max of 1 hour, based on the oldest states or events record
@@ -42,24 +65,52 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
 
             _LOGGER.debug("Purging states and events before %s", batch_purge_before)
 
-            deleted_rows = (
-                session.query(States)
+            state_ids = [
+                state.state_id
+                for state in session.query(States.state_id)
                 .filter(States.last_updated < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
+                .limit(MAX_ROWS_TO_PURGE)
+            ]
+            deleted_rows = 0
+            if state_ids:
+                deleted_rows = (
+                    session.query(States)
+                    .filter(States.state_id.in_(state_ids))
+                    .delete(synchronize_session=False)
+                )
+            progress.states += deleted_rows
             _LOGGER.debug("Deleted %s states", deleted_rows)
 
-            deleted_rows = (
-                session.query(Events)
+            if len(state_ids) == MAX_ROWS_TO_PURGE:
+                # The states have to be gone before their events
+                _log_purge_progress(progress)
+                return False
+
+            event_ids = [
+                event.event_id
+                for event in session.query(Events.event_id)
                 .filter(Events.time_fired < batch_purge_before)
-                .delete(synchronize_session=False)
-            )
+                .limit(MAX_ROWS_TO_PURGE)
+            ]
+            deleted_rows = 0
+            if event_ids:
+                deleted_rows = (
+                    session.query(Events)
+                    .filter(Events.event_id.in_(event_ids))
+                    .delete(synchronize_session=False)
+                )
+            progress.events += deleted_rows
             _LOGGER.debug("Deleted %s events", deleted_rows)
 
+            if len(event_ids) == MAX_ROWS_TO_PURGE:
+                _log_purge_progress(progress)
+                return False
+
             # If states or events purging isn't processing the purge_before yet,
             # return false, as we are not done yet.
             if batch_purge_before != purge_before:
                 _LOGGER.debug("Purging hasn't fully completed yet.")
+                _log_purge_progress(progress)
                 return False
 
             # Recorder runs is small, no need to batch run it
@@ -70,6 +121,13 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
             )
             _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
+            deleted_rows = (
+                session.query(StateCheckpoints)
+                .filter(StateCheckpoints.created < purge_before)
+                .delete(synchronize_session=False)
+            )
+            _LOGGER.debug("Deleted %s state_checkpoints", deleted_rows)
+
         if repack:
             # Execute sqlite or postgresql vacuum command to free up space on disk
             if instance.engine.driver in ("pysqlite", "postgresql"):
@@ -97,4 +155,25 @@ def purge_old_data(instance, purge_days: int, repack: bool) -> bool:
         _LOGGER.warning("Error purging history: %s.", err)
     except SQLAlchemyError as err:
         _LOGGER.warning("Error purging history: %s.", err)
+
+    instance.purge_progress = None
+    elapsed = time.monotonic() - progress.started
+    _LOGGER.debug(
+        "Purged %s states and %s events in %s batches and %.1fs (%.1f rows/s)",
+        progress.states,
+        progress.events,
+        progress.batches,
+        elapsed,
+        (progress.states + progress.events) / elapsed if elapsed else 0,
+    )
     return True
+
+
+def _log_purge_progress(progress: PurgeProgress) -> None:
+    """Log the progress of a purge that is not completed yet."""
+    _LOGGER.debug(
+        "Purge progress: %s states and %s events deleted in %s batches",
+        progress.states,
+        progress.events,
+        progress.batches,
+    )
@@ -3,6 +3,7 @@ from contextlib import contextmanager
 import logging
 import time
 
+from sqlalchemy import and_, or_
 from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 from .const import DATA_INSTANCE
@@ -11,6 +12,7 @@ _LOGGER = logging.getLogger(__name__)
 
 RETRIES = 3
 QUERY_RETRY_WAIT = 0.1
+PAGE_SIZE = 1000
 
 
 @contextmanager
@@ -94,3 +96,35 @@ def execute(qry, to_native=False, validate_entity_ids=True):
             if tryno == RETRIES - 1:
                 raise
             time.sleep(QUERY_RETRY_WAIT)
+
+
+def execute_pages(hass, build_query, keys, page_size=PAGE_SIZE):
+    """Yield the rows of a query that is read a page at a time.
+
+    The rows are ordered by the keys, which must identify a row, and every
+    page continues after the last row of the previous page. A session is
+    only open while a page is read, so the rows can be handed to a slow
+    consumer without holding on to a database connection.
+    """
+    last_row = None
+    while True:
+        with session_scope(hass=hass) as session:
+            query = build_query(session)
+            if last_row is not None:
+                query = query.filter(_after_row(keys, last_row))
+            rows = execute(query.order_by(*keys).limit(page_size))
+
+        yield from rows
+
+        if len(rows) < page_size:
+            return
+        last_row = rows[-1]
+
+
+def _after_row(keys, row):
+    """Return the filter for the rows ordered after a row."""
+    key, *other_keys = keys
+    value = getattr(row, key.key)
+    if not other_keys:
+        return key > value
+    return or_(key > value, and_(key == value, _after_row(other_keys, row)))
@@ -0,0 +1,216 @@
+"""Load the recent states of many entities with a single query.
+
+Sensors that rebuild their state from history when Home Assistant starts
+request their window through async_load_recent_states. Requests that are
+made while a query runs are batched into the next query, so all sensors
+starting at the same time share one round trip to the database.
+"""
+import asyncio
+from datetime import datetime
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import attr
+from sqlalchemy import literal_column, select, union_all
+
+from homeassistant.core import callback
+from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.loader import bind_hass
+
+from .models import States, process_timestamp
+from .util import session_scope
+
+# mypy: allow-untyped-defs, no-check-untyped-defs
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_WARM_UP_LOADER = "recorder_warm_up_loader"
+
+# Stay below the limits of SQLite on compound selects (500) and bound
+# parameters (999 before SQLite 3.32)
+MAX_REQUESTS_PER_QUERY = 100
+MAX_BIND_PARAMETERS = 900
+
+RecentStates = List[Tuple[str, datetime]]
+
+
+@attr.s(slots=True, frozen=True)
+class WarmUpRequest:
+    """A window of recent states of an entity."""
+
+    entity_id: str = attr.ib()
+    # Only states updated at or after the start time
+    start_time: Optional[datetime] = attr.ib(default=None)
+    # Only the latest states
+    limit: Optional[int] = attr.ib(default=None)
+    # Skip updates that only changed attributes
+    changes_only: bool = attr.ib(default=False)
+    # Include the state at the start time, reported at the start time
+    include_start_state: bool = attr.ib(default=False)
+
+
+def _request_queries(index: int, request: WarmUpRequest) -> list:
+    """Return the selects of the rows of a request."""
+    # The request index and start flag are rendered in the statement, so
+    # they do not use up bound parameters
+    columns = [
+        literal_column(str(int(index))).label("request"),
+        States.state,
+        States.last_updated,
+    ]
+    entity_filter = States.entity_id == request.entity_id.lower()
+    changes_filter = States.last_changed == States.last_updated
+
+    query = select(columns + [literal_column("0").label("start")]).where(entity_filter)
+    if request.start_time is not None:
+        query = query.where(States.last_updated >= request.start_time)
+    if request.changes_only:
+        query = query.where(changes_filter)
+    query = query.order_by(States.last_updated.desc())
+    if request.limit is not None:
+        query = query.limit(request.limit)
+    queries = [query]
+
+    if request.start_time is not None and request.include_start_state:
+        query = (
+            select(columns + [literal_column("1").label("start")])
+            .where(entity_filter)
+            .where(States.last_updated < request.start_time)
+        )
+        if request.changes_only:
+            query = query.where(changes_filter)
+        queries.append(query.order_by(States.last_updated.desc()).limit(1))
+
+    # Wrap the selects so every part of the union can be ordered and limited
+    return [
+        query.alias(f"r{index}_{part}").select() for part, query in enumerate(queries)
+    ]
+
+
+def _chunk_queries(requests: List[WarmUpRequest], dialect) -> Iterator[list]:
+    """Yield the selects of the requests in chunks that fit in one query."""
+    queries: list = []
+    chunk_requests = 0
+    chunk_parameters = 0
+
+    for index, request in enumerate(requests):
+        request_queries = _request_queries(index, request)
+        parameters = sum(
+            len(query.compile(dialect=dialect).params) for query in request_queries
+        )
+        if queries and (
+            chunk_requests == MAX_REQUESTS_PER_QUERY
+            or chunk_parameters + parameters > MAX_BIND_PARAMETERS
+        ):
+            yield queries
+            queries = []
+            chunk_requests = 0
+            chunk_parameters = 0
+
+        queries.extend(request_queries)
+        chunk_requests += 1
+        chunk_parameters += parameters
+
+    if queries:
+        yield queries
+
+
+def load_recent_states(
+    hass: HomeAssistantType, requests: List[WarmUpRequest]
+) -> List[RecentStates]:
+    """Return the (state, last_updated) tuples of each request, oldest first."""
+    results: List[RecentStates] = [[] for _ in requests]
+
+    with session_scope(hass=hass) as session:
+        dialect = session.bind.dialect
+        for queries in _chunk_queries(requests, dialect):
+            for index, state, last_updated, start in session.execute(
+                union_all(*queries)
+            ):
+                if start:
+                    last_updated = requests[index].start_time
+                results[index].append((state, process_timestamp(last_updated)))
+
+    for result in results:
+        result.sort(key=lambda item: item[1])
+
+    return results
+
+
+class WarmUpLoader:
+    """Batch the recent state requests of sensors into single queries."""
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the loader."""
+        self.hass = hass
+        self._queue: Dict[WarmUpRequest, List[asyncio.Future]] = {}
+        self._running = False
+
+    async def async_load(self, request: WarmUpRequest) -> RecentStates:
+        """Return the recent states of a request."""
+        future = self.hass.loop.create_future()
+        self._queue.setdefault(request, []).append(future)
+
+        if not self._running:
+            self._running = True
+            self.hass.async_create_task(self._async_run())
+
+        return await future
+
+    async def _async_run(self) -> None:
+        """Run queries until no more requests are waiting."""
+        # Let other sensors that start at the same time queue their requests
+        await asyncio.sleep(0)
+
+        while self._queue:
+            batch, self._queue = self._queue, {}
+            requests = list(batch)
+            _LOGGER.debug("Loading recent states of %d requests", len(requests))
+
+            try:
+                results = await self.hass.async_add_executor_job(
+                    load_recent_states, self.hass, requests
+                )
+            except Exception as err:  # pylint: disable=broad-except
+                for futures in batch.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(err)
+                continue
+
+            for request, result in zip(requests, results):
+                for future in batch[request]:
+                    if not future.done():
+                        future.set_result(result)
+
+        self._running = False
+
+
+@callback
+def async_get_warm_up_loader(hass: HomeAssistantType) -> WarmUpLoader:
+    """Return the warm up loader of Home Assistant."""
+    loader: Optional[WarmUpLoader] = hass.data.get(DATA_WARM_UP_LOADER)
+
+    if loader is None:
+        loader = hass.data[DATA_WARM_UP_LOADER] = WarmUpLoader(hass)
+
+    return loader
+
+
+@bind_hass
+async def async_load_recent_states(
+    hass: HomeAssistantType,
+    entity_id: str,
+    *,
+    start_time: Optional[datetime] = None,
+    limit: Optional[int] = None,
+    changes_only: bool = False,
+    include_start_state: bool = False,
+) -> RecentStates:
+    """Return (state, last_updated) tuples of an entity, oldest first.
+
+    The request is loaded together with the requests of other sensors.
+    """
+    return await async_get_warm_up_loader(hass).async_load(
+        WarmUpRequest(entity_id, start_time, limit, changes_only, include_start_state)
+    )
@@ -5,8 +5,7 @@ import statistics
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
-from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.components.recorder.warm_up import async_load_recent_states
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
@@ -130,21 +129,25 @@ class StatisticsSensor(Entity):
 
     def _add_state_to_queue(self, new_state):
         """Add the state to the queue."""
-        if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+        self._add_value_to_queue(new_state.state, new_state.last_updated)
+
+    def _add_value_to_queue(self, state, last_updated):
+        """Add a state value and the time it was updated to the queue."""
+        if state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                self.states.append(state)
             else:
-                self.states.append(float(new_state.state))
+                self.states.append(float(state))
 
-            self.ages.append(new_state.last_updated)
+            self.ages.append(last_updated)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
-                new_state.state,
+                state,
             )
 
     @property
@@ -299,9 +302,8 @@ class StatisticsSensor(Entity):
     async def _async_initialize_from_database(self):
         """Initialize the list of states from the database.
 
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
+        The latest self._sampling_size states are loaded together with the
+        states of other sensors that start at the same time.
 
         If MaxAge is provided then query will restrict to entries younger then
         current datetime - MaxAge.
@@ -309,29 +311,26 @@ class StatisticsSensor(Entity):
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
-        with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
-            )
-
-            if self._max_age is not None:
-                records_older_then = dt_util.utcnow() - self._max_age
-                _LOGGER.debug(
-                    "%s: retrieve records not older then %s",
-                    self.entity_id,
-                    records_older_then,
-                )
-                query = query.filter(States.last_updated >= records_older_then)
-            else:
-                _LOGGER.debug("%s: retrieving all records.", self.entity_id)
-
-            query = query.order_by(States.last_updated.desc()).limit(
-                self._sampling_size
+        records_older_then = None
+        if self._max_age is not None:
+            records_older_then = dt_util.utcnow() - self._max_age
+            _LOGGER.debug(
+                "%s: retrieve records not older then %s",
+                self.entity_id,
+                records_older_then,
             )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+        else:
+            _LOGGER.debug("%s: retrieving all records.", self.entity_id)
+
+        states = await async_load_recent_states(
+            self.hass,
+            self._entity_id,
+            start_time=records_older_then,
+            limit=self._sampling_size,
+        )
 
-        for state in reversed(states):
-            self._add_state_to_queue(state)
+        for state, last_updated in states:
+            self._add_value_to_queue(state, last_updated)
 
         self.async_schedule_update_ha_state(True)
 
@@ -13,10 +13,14 @@ from homeassistant.loader import bind_hass
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_SETTINGS,
     ATTR_STREAMS,
     CONF_DURATION,
     CONF_LOOKBACK,
+    CONF_MAX_SEGMENT_BYTES,
+    CONF_MAX_SEGMENTS,
     CONF_STREAM_SOURCE,
+    DEFAULT_MAX_SEGMENTS,
     DOMAIN,
     SERVICE_RECORD,
 )
@@ -25,7 +29,21 @@ from .hls import async_setup_hls
 
 _LOGGER = logging.getLogger(__name__)
 
-CONFIG_SCHEMA = vol.Schema({DOMAIN: vol.Schema({})}, extra=vol.ALLOW_EXTRA)
+CONFIG_SCHEMA = vol.Schema(
+    {
+        DOMAIN: vol.Schema(
+            {
+                vol.Optional(CONF_MAX_SEGMENTS, default=DEFAULT_MAX_SEGMENTS): vol.All(
+                    vol.Coerce(int), vol.Range(min=1)
+                ),
+                vol.Optional(CONF_MAX_SEGMENT_BYTES): vol.All(
+                    vol.Coerce(int), vol.Range(min=0)
+                ),
+            }
+        )
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 STREAM_SERVICE_SCHEMA = vol.Schema({vol.Required(CONF_STREAM_SOURCE): cv.string})
 
@@ -87,6 +105,7 @@ async def async_setup(hass, config):
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = {}
+    hass.data[DOMAIN][ATTR_SETTINGS] = config.get(DOMAIN, {})
 
     # Setup HLS
     hls_endpoint = async_setup_hls(hass)
@@ -138,6 +157,11 @@ class Stream:
         """Return stream outputs."""
         return self._outputs
 
+    @property
+    def buffer_size(self):
+        """Return the number of bytes held by the segments of all outputs."""
+        return sum(output.buffer_size for output in self._outputs.values())
+
     def add_provider(self, fmt):
         """Add provider output stream."""
         if not self._outputs.get(fmt):
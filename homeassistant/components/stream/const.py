@@ -4,10 +4,13 @@ DOMAIN = "stream"
 CONF_STREAM_SOURCE = "stream_source"
 CONF_LOOKBACK = "lookback"
 CONF_DURATION = "duration"
+CONF_MAX_SEGMENTS = "max_segments"
+CONF_MAX_SEGMENT_BYTES = "max_segment_bytes"
 
 ATTR_ENDPOINTS = "endpoints"
 ATTR_STREAMS = "streams"
 ATTR_KEEPALIVE = "keepalive"
+ATTR_SETTINGS = "settings"
 
 SERVICE_RECORD = "record"
 
@@ -16,3 +19,5 @@ OUTPUT_FORMATS = ["hls"]
 FORMAT_CONTENT_TYPE = {"hls": "application/vnd.apple.mpegurl"}
 
 AUDIO_SAMPLE_RATE = 44100
+
+DEFAULT_MAX_SEGMENTS = 3
@@ -2,7 +2,8 @@
 import asyncio
 from collections import deque
 import io
-from typing import Any, List
+import logging
+from typing import Any, List, Optional
 
 from aiohttp import web
 import attr
@@ -12,7 +13,16 @@ from homeassistant.core import callback
 from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
-from .const import ATTR_STREAMS, DOMAIN
+from .const import (
+    ATTR_SETTINGS,
+    ATTR_STREAMS,
+    CONF_MAX_SEGMENT_BYTES,
+    CONF_MAX_SEGMENTS,
+    DEFAULT_MAX_SEGMENTS,
+    DOMAIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
 
 PROVIDERS = Registry()
 
@@ -35,11 +45,27 @@ class Segment:
     segment = attr.ib(type=io.BytesIO)
     duration = attr.ib(type=float)
 
+    @property
+    def data(self) -> memoryview:
+        """Return the contents of the finished segment without copying them."""
+        return self.segment.getbuffer()
+
+    @property
+    def size(self) -> int:
+        """Return the size of the segment in bytes."""
+        return self.segment.getbuffer().nbytes
+
 
 class StreamOutput:
-    """Represents a stream output."""
+    """Represents a stream output.
+
+    The output keeps a ring of the latest segments, limited to
+    ``num_segments`` segments and, if set, ``max_segment_bytes`` bytes. The
+    latest segment is always kept.
+    """
 
-    num_segments = 3
+    num_segments = DEFAULT_MAX_SEGMENTS
+    max_segment_bytes: Optional[int] = None
 
     def __init__(self, stream, timeout: int = 300) -> None:
         """Initialize a stream output."""
@@ -48,9 +74,15 @@ class StreamOutput:
         self._stream = stream
         self._cursor = None
         self._event = asyncio.Event()
-        self._segments = deque(maxlen=self.num_segments)
+        self._segments = deque()
         self._unsub = None
 
+        settings = stream.hass.data.get(DOMAIN, {}).get(ATTR_SETTINGS, {})
+        if CONF_MAX_SEGMENTS in settings:
+            self.num_segments = settings[CONF_MAX_SEGMENTS]
+        if CONF_MAX_SEGMENT_BYTES in settings:
+            self.max_segment_bytes = settings[CONF_MAX_SEGMENT_BYTES]
+
     @property
     def name(self) -> str:
         """Return provider name."""
@@ -85,6 +117,11 @@ class StreamOutput:
         durations = [s.duration for s in self._segments]
         return round(sum(durations) // segment_length) or 1
 
+    @property
+    def buffer_size(self) -> int:
+        """Return the number of bytes held by the segments of the output."""
+        return sum(s.size for s in self._segments)
+
     def get_segment(self, sequence: int = None) -> Any:
         """Retrieve a specific segment, or the whole list."""
         self.idle = False
@@ -132,9 +169,29 @@ class StreamOutput:
             return
 
         self._segments.append(segment)
+        self._trim_segments()
         self._event.set()
         self._event.clear()
 
+    def _trim_segments(self) -> None:
+        """Drop the oldest segments that do not fit in the ring."""
+        segments = self._segments
+        size = self.buffer_size
+
+        while len(segments) > 1 and (
+            len(segments) > self.num_segments
+            or (self.max_segment_bytes is not None and size > self.max_segment_bytes)
+        ):
+            size -= segments.popleft().size
+
+        _LOGGER.debug(
+            "Output %s of %s holds %d segments in %d bytes",
+            self.name,
+            self._stream.source,
+            len(segments),
+            size,
+        )
+
     @callback
     def _timeout(self, _now=None):
         """Handle stream timeout."""
@@ -147,7 +204,7 @@ class StreamOutput:
 
     def cleanup(self):
         """Handle cleanup."""
-        self._segments = deque(maxlen=self.num_segments)
+        self._segments = deque()
         self._stream.remove_provider(self)
 
 
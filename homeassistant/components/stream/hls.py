@@ -51,7 +51,7 @@ class HlsSegmentView(StreamView):
         if not segment:
             return web.HTTPNotFound()
         headers = {"Content-Type": "video/mp2t"}
-        return web.Response(body=segment.segment.getvalue(), headers=headers)
+        return web.Response(body=segment.data, headers=headers)
 
 
 class M3U8Renderer:
@@ -85,6 +85,9 @@ class RecorderOutput(StreamOutput):
         segments = [s for s in segments if s.sequence not in own_segments]
         self._segments = segments + self._segments
 
+    def _trim_segments(self) -> None:
+        """Keep all segments of the recording."""
+
     @callback
     def _timeout(self, _now=None):
         """Handle recorder timeout."""
@@ -9,8 +9,10 @@ from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceNotFound, Unauthorized
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.event import async_track_state_change
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
 from homeassistant.helpers.service import async_get_all_descriptions
 from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.setup import async_get_setup_timeline, async_get_setup_trace
 
 from . import const, decorators, messages
 
@@ -30,6 +32,8 @@ def async_register_commands(hass, async_reg):
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_manifest_get)
+    async_reg(hass, handle_setup_timeline)
+    async_reg(hass, handle_poll_stats)
 
 
 def pong_message(iden):
@@ -65,7 +69,7 @@ def handle_subscribe_events(hass, connection, msg):
             ):
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event))
+            connection.send_message(messages.cached_event_message(msg["id"], event))
 
     else:
 
@@ -75,7 +79,7 @@ def handle_subscribe_events(hass, connection, msg):
             if event.event_type == EVENT_TIME_CHANGED:
                 return
 
-            connection.send_message(messages.event_message(msg["id"], event.as_dict()))
+            connection.send_message(messages.cached_event_message(msg["id"], event))
 
     connection.subscriptions[msg["id"]] = hass.bus.async_listen(
         event_type, forward_events
@@ -219,6 +223,32 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "setup_timeline",
+        vol.Optional("format", default="timeline"): vol.In(
+            ["timeline", "chrome_trace"]
+        ),
+    }
+)
+def handle_setup_timeline(hass, connection, msg):
+    """Handle setup timeline command."""
+    if msg["format"] == "chrome_trace":
+        connection.send_result(msg["id"], async_get_setup_trace(hass))
+    else:
+        connection.send_result(msg["id"], async_get_setup_timeline(hass))
+
+
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "poll_stats"})
+def handle_poll_stats(hass, connection, msg):
+    """Handle poll stats command."""
+    connection.send_result(msg["id"], async_get_poll_scheduler(hass).async_stats())
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
@@ -1,13 +1,27 @@
 """Message templates for websocket commands."""
 
+from collections import OrderedDict
+from typing import Any, Dict, Tuple, Union
+
 import voluptuous as vol
 
+from homeassistant.core import Event
 from homeassistant.helpers import config_validation as cv
 
 from . import const
 
 # mypy: allow-untyped-defs
 
+# Placeholder id used to serialize an event message once for all subscribers
+IDEN_TEMPLATE = "__IDEN__"
+IDEN_JSON_TEMPLATE = '"__IDEN__"'
+
+# Number of recently fired events we keep a serialized message for
+EVENT_MESSAGE_CACHE_SIZE = 128
+
+# A fired event and its serialized message
+_CachedEventMessage = Tuple[Event, str]
+
 # Minimal requirements of a message
 MINIMAL_MESSAGE_SCHEMA = vol.Schema(
     {vol.Required("id"): cv.positive_int, vol.Required("type"): cv.string},
@@ -33,6 +47,47 @@ def error_message(iden, code, message):
     }
 
 
-def event_message(iden, event):
+def event_message(iden: Union[int, str], event: Any) -> Dict[str, Any]:
     """Return an event message."""
     return {"id": iden, "type": "event", "event": event}
+
+
+def cached_event_message(iden: int, event: Event) -> Union[str, Dict[str, Any]]:
+    """Return an event message.
+
+    The event is serialized only once, no matter how many subscriptions
+    receive it; only the message id is spliced in for each subscription.
+    """
+    try:
+        message = _EVENT_MESSAGE_CACHE.get(event)
+    except (ValueError, TypeError):
+        # Let the writer report the data that can't be serialized
+        return event_message(iden, event)
+    return message.replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+
+
+class _EventMessageCache:
+    """Cache the serialized message of recently fired events."""
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize the cache."""
+        self._maxsize = maxsize
+        # Keyed by id(), the event is kept to guard against id reuse
+        self._messages: "OrderedDict[int, _CachedEventMessage]" = OrderedDict()
+
+    def get(self, event: Event) -> str:
+        """Return the serialized event message with a placeholder id."""
+        key = id(event)
+        cached = self._messages.get(key)
+        if cached is not None and cached[0] is event:
+            self._messages.move_to_end(key)
+            return cached[1]
+
+        message = const.JSON_DUMP(event_message(IDEN_TEMPLATE, event))
+        self._messages[key] = (event, message)
+        if len(self._messages) > self._maxsize:
+            self._messages.popitem(last=False)
+        return message
+
+
+_EVENT_MESSAGE_CACHE = _EventMessageCache(EVENT_MESSAGE_CACHE_SIZE)
@@ -56,6 +56,7 @@ from homeassistant.requirements import (
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
 from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml.loader import NODE_CACHE_VERSION, YamlNodeCache
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +67,8 @@ YAML_CONFIG_FILE = "configuration.yaml"
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
+DATA_YAML_NODE_CACHE = "yaml_node_cache"
+YAML_NODE_CACHE_FILE = f".yaml_node_cache.v{NODE_CACHE_VERSION}"
 
 GROUP_CONFIG_PATH = "groups.yaml"
 AUTOMATION_CONFIG_PATH = "automations.yaml"
@@ -303,21 +306,44 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     """
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
+        None,
+        load_yaml_config_file,
+        hass.config.path(YAML_CONFIG_FILE),
+        hass.data.get(DATA_YAML_NODE_CACHE),
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
-def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
+@callback
+def async_enable_yaml_node_cache(hass: HomeAssistant) -> None:
+    """Keep parsed YAML files of the configuration between loads and restarts.
+
+    Only files that changed since they were last loaded are parsed again.
+    The cache is not JSON, so it is kept next to the storage directory
+    instead of in it.
+    """
+    hass.data[DATA_YAML_NODE_CACHE] = YamlNodeCache(
+        hass.config.path(YAML_NODE_CACHE_FILE)
+    )
+
+
+def load_yaml_config_file(
+    config_path: str, node_cache: Optional[YamlNodeCache] = None
+) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
     Raises FileNotFoundError or HomeAssistantError.
 
     This method needs to run in an executor.
     """
-    conf_dict = load_yaml(config_path)
+    if node_cache is None:
+        conf_dict = load_yaml(config_path)
+    else:
+        with node_cache.activate():
+            conf_dict = load_yaml(config_path)
+        node_cache.save()
 
     if not isinstance(conf_dict, dict):
         msg = (
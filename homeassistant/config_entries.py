@@ -14,7 +14,12 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import entity_registry
 from homeassistant.helpers.event import Event
-from homeassistant.setup import async_process_deps_reqs, async_setup_component
+from homeassistant.setup import (
+    PHASE_SETUP_ENTRY,
+    async_process_deps_reqs,
+    async_setup_component,
+    timeline_phase,
+)
 from homeassistant.util.decorator import Registry
 
 _LOGGER = logging.getLogger(__name__)
@@ -216,9 +221,10 @@ class ConfigEntry:
                 return
 
         try:
-            result = await component.async_setup_entry(  # type: ignore
-                hass, self
-            )
+            with timeline_phase(hass, integration.domain, PHASE_SETUP_ENTRY):
+                result = await component.async_setup_entry(  # type: ignore
+                    hass, self
+                )
 
             if not isinstance(result, bool):
                 _LOGGER.error(
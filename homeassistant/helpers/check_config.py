@@ -11,6 +11,7 @@ from homeassistant.config import (
     CONF_CORE,
     CONF_PACKAGES,
     CORE_CONFIG_SCHEMA,
+    DATA_YAML_NODE_CACHE,
     YAML_CONFIG_FILE,
     _format_config_error,
     config_per_platform,
@@ -83,7 +84,9 @@ async def async_check_ha_config_file(hass: HomeAssistant) -> HomeAssistantConfig
     try:
         if not await hass.async_add_executor_job(os.path.isfile, config_path):
             return result.add_error("File configuration.yaml not found.")
-        config = await hass.async_add_executor_job(load_yaml_config_file, config_path)
+        config = await hass.async_add_executor_job(
+            load_yaml_config_file, config_path, hass.data.get(DATA_YAML_NODE_CACHE),
+        )
     except FileNotFoundError:
         return result.add_error(f"File not found: {config_path}")
     except HomeAssistantError as err:
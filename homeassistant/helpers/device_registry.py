@@ -1,5 +1,4 @@
 """Provide a way to connect entities belonging to one device."""
-from collections import OrderedDict
 import logging
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
 import uuid
@@ -10,6 +9,7 @@ from homeassistant.const import EVENT_HOMEASSISTANT_STARTED
 from homeassistant.core import Event, callback
 
 from .debounce import Debouncer
+from .registry_items import IndexedRegistryItems, attribute_key, attribute_keys
 from .singleton import singleton
 from .typing import HomeAssistantType
 
@@ -97,11 +97,42 @@ def format_mac(mac: str) -> str:
     return mac
 
 
+class DeviceRegistryItems(IndexedRegistryItems):
+    """Registry entries by device id, indexed by identifier and connection."""
+
+    INDEXES = {
+        "identifiers": attribute_keys("identifiers"),
+        "connections": attribute_keys("connections"),
+        "area_id": attribute_key("area_id"),
+        "config_entries": attribute_keys("config_entries"),
+    }
+
+    def get_by_identifiers_or_connections(
+        self, identifiers: set, connections: set
+    ) -> Optional[Any]:
+        """Return the first entry that has any of the identifiers or connections."""
+        device_ids: Set[str] = set()
+        for name, keys in (("identifiers", identifiers), ("connections", connections)):
+            for key in keys:
+                device_ids.update(self.get_ids(name, key))
+
+        if not device_ids:
+            return None
+
+        if len(device_ids) == 1:
+            return self.data[device_ids.pop()]
+
+        # Several devices match, prefer the one that was registered first
+        return next(
+            device for device_id, device in self.data.items() if device_id in device_ids
+        )
+
+
 class DeviceRegistry:
     """Class to hold a registry of devices."""
 
-    devices: Dict[str, DeviceEntry]
-    deleted_devices: Dict[str, DeletedDeviceEntry]
+    devices: DeviceRegistryItems
+    deleted_devices: DeviceRegistryItems
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
@@ -118,24 +149,16 @@ class DeviceRegistry:
         self, identifiers: set, connections: set
     ) -> Optional[DeviceEntry]:
         """Check if device is registered."""
-        for device in self.devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or any(
-                conn in device.connections for conn in connections
-            ):
-                return device
-        return None
+        return self.devices.get_by_identifiers_or_connections(identifiers, connections)
 
     @callback
     def _async_get_deleted_device(
         self, identifiers: set, connections: set
     ) -> Optional[DeletedDeviceEntry]:
         """Check if device has previously been registered."""
-        for device in self.deleted_devices.values():
-            if any(iden in device.identifiers for iden in identifiers) or any(
-                conn in device.connections for conn in connections
-            ):
-                return device
-        return None
+        return self.deleted_devices.get_by_identifiers_or_connections(
+            identifiers, connections
+        )
 
     @callback
     def async_get_or_create(
@@ -339,8 +362,8 @@ class DeviceRegistry:
 
         data = await self._store.async_load()
 
-        devices = OrderedDict()
-        deleted_devices = OrderedDict()
+        devices = DeviceRegistryItems()
+        deleted_devices = DeviceRegistryItems()
 
         if data is not None:
             for device in data["devices"]:
@@ -418,12 +441,12 @@ class DeviceRegistry:
     @callback
     def async_clear_config_entry(self, config_entry_id: str) -> None:
         """Clear config entry from registry entries."""
-        for device in list(self.devices.values()):
-            self._async_update_device(device.id, remove_config_entry_id=config_entry_id)
-        for deleted_device in list(self.deleted_devices.values()):
+        for device_id in self.devices.get_ids("config_entries", config_entry_id):
+            self._async_update_device(device_id, remove_config_entry_id=config_entry_id)
+        for deleted_device in self.deleted_devices.get_entries(
+            "config_entries", config_entry_id
+        ):
             config_entries = deleted_device.config_entries
-            if config_entry_id not in config_entries:
-                continue
             if config_entries == {config_entry_id}:
                 # Permanently remove the device from the device registry.
                 del self.deleted_devices[deleted_device.id]
@@ -437,9 +460,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in self.devices.get_ids("area_id", area_id):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @singleton(DATA_REGISTRY)
@@ -453,7 +475,7 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> List[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    return registry.devices.get_entries("area_id", area_id)
 
 
 @callback
@@ -461,11 +483,7 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> List[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    return registry.devices.get_entries("config_entries", config_entry_id)
 
 
 @callback
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 from timeit import default_timer as timer
-from typing import Any, Awaitable, Dict, Iterable, List, Optional, Union
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple, Union
 
 from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import (
@@ -117,6 +117,11 @@ class Entity(ABC):
     _context: Optional[Context] = None
     _context_set: Optional[datetime] = None
 
+    # Cached capability and static attributes with the key they are valid for
+    _static_attributes: Optional[
+        Tuple[Tuple[str, Any], Optional[Dict[str, Any]], Dict[str, Any]]
+    ] = None
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -216,6 +221,17 @@ class Entity(ABC):
         """
         return False
 
+    @property
+    def cache_static_attributes(self) -> bool:
+        """Return True if the attributes not derived from the state are cached.
+
+        If True, the capability attributes, unit, name, icon, entity picture,
+        assumed state, supported features, device class and customization are
+        only read on the first write and after
+        async_invalidate_static_attributes is called.
+        """
+        return False
+
     @property
     def supported_features(self) -> Optional[int]:
         """Flag supported features."""
@@ -305,8 +321,29 @@ class Entity(ABC):
 
         start = timer()
 
-        attr = self.capability_attributes
-        attr = dict(attr) if attr else {}
+        assert self.hass is not None
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+
+        static_attr: Optional[Dict[str, Any]]
+        if self.cache_static_attributes:
+            cache_key = (self.entity_id, customize)
+            cached = self._static_attributes
+            if cached is None or cached[0] != cache_key:
+                new_static_attr = self._async_static_attributes()
+                # Overwrite properties that have been set in the config file.
+                if customize is not None:
+                    new_static_attr.update(customize.get(self.entity_id))
+                cached = self._static_attributes = (
+                    cache_key,
+                    self.capability_attributes,
+                    new_static_attr,
+                )
+            _, capability_attr, static_attr = cached
+        else:
+            capability_attr = self.capability_attributes
+            static_attr = None
+
+        attr = dict(capability_attr) if capability_attr else {}
 
         if not self.available:
             state = STATE_UNAVAILABLE
@@ -316,35 +353,14 @@ class Entity(ABC):
             attr.update(self.state_attributes or {})
             attr.update(self.device_state_attributes or {})
 
-        unit_of_measurement = self.unit_of_measurement
-        if unit_of_measurement is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        entry = self.registry_entry
-        # pylint: disable=consider-using-ternary
-        name = (entry and entry.name) or self.name
-        if name is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        icon = (entry and entry.icon) or self.icon
-        if icon is not None:
-            attr[ATTR_ICON] = icon
-
-        entity_picture = self.entity_picture
-        if entity_picture is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        assumed_state = self.assumed_state
-        if assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        supported_features = self.supported_features
-        if supported_features is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+        if static_attr is not None:
+            attr.update(static_attr)
+        else:
+            attr.update(self._async_static_attributes())
 
-        device_class = self.device_class
-        if device_class is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
+            # Overwrite properties that have been set in the config file.
+            if customize is not None:
+                attr.update(customize.get(self.entity_id))
 
         end = timer()
 
@@ -371,11 +387,6 @@ class Entity(ABC):
                 extra,
             )
 
-        # Overwrite properties that have been set in the config file.
-        assert self.hass is not None
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
-
         # Convert temperature if we detect one
         try:
             unit_of_measure = attr.get(ATTR_UNIT_OF_MEASUREMENT)
@@ -403,6 +414,48 @@ class Entity(ABC):
             self.entity_id, state, attr, self.force_update, self._context
         )
 
+    @callback
+    def _async_static_attributes(self) -> Dict[str, Any]:
+        """Return the attributes that are not derived from the state."""
+        attr: Dict[str, Any] = {}
+
+        unit_of_measurement = self.unit_of_measurement
+        if unit_of_measurement is not None:
+            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
+
+        entry = self.registry_entry
+        # pylint: disable=consider-using-ternary
+        name = (entry and entry.name) or self.name
+        if name is not None:
+            attr[ATTR_FRIENDLY_NAME] = name
+
+        icon = (entry and entry.icon) or self.icon
+        if icon is not None:
+            attr[ATTR_ICON] = icon
+
+        entity_picture = self.entity_picture
+        if entity_picture is not None:
+            attr[ATTR_ENTITY_PICTURE] = entity_picture
+
+        assumed_state = self.assumed_state
+        if assumed_state:
+            attr[ATTR_ASSUMED_STATE] = assumed_state
+
+        supported_features = self.supported_features
+        if supported_features is not None:
+            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+
+        device_class = self.device_class
+        if device_class is not None:
+            attr[ATTR_DEVICE_CLASS] = str(device_class)
+
+        return attr
+
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Recalculate the cached static attributes on the next state write."""
+        self._static_attributes = None
+
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
 
@@ -553,6 +606,8 @@ class Entity(ABC):
             return
 
         assert old is not None
+        self.async_invalidate_static_attributes()
+
         if self.registry_entry.entity_id == old.entity_id:
             self.async_write_ha_state()
             return
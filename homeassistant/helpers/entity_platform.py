@@ -1,7 +1,7 @@
 """Class to manage the entities for a single platform."""
 import asyncio
 from contextvars import ContextVar
-from datetime import datetime, timedelta
+from datetime import timedelta
 from logging import Logger
 from types import ModuleType
 from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
@@ -11,10 +11,12 @@ from homeassistant.core import CALLBACK_TYPE, callback, split_entity_id, valid_e
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
 from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.setup import PHASE_SETUP_PLATFORM, timeline_phase
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
-from .event import async_call_later, async_track_time_interval
+from .event import async_call_later
+from .poll_scheduler import PollStats, async_get_poll_scheduler
 
 if TYPE_CHECKING:
     from .entity import Entity
@@ -52,11 +54,9 @@ class EntityPlatform:
         self.config_entry = None
         self.entities: Dict[str, Entity] = {}  # pylint: disable=used-before-assignment
         self._tasks: List[asyncio.Future] = []
-        # Method to cancel the state change listener
-        self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
-        self._process_updates: Optional[asyncio.Lock] = None
+        self.poll_stats = PollStats()
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
@@ -173,17 +173,20 @@ class EntityPlatform:
         )
 
         try:
-            task = async_create_setup_task()
+            with timeline_phase(
+                hass, self.platform_name, PHASE_SETUP_PLATFORM, self.domain
+            ):
+                task = async_create_setup_task()
 
-            await asyncio.wait_for(asyncio.shield(task), SLOW_SETUP_MAX_WAIT)
+                await asyncio.wait_for(asyncio.shield(task), SLOW_SETUP_MAX_WAIT)
 
-            # Block till all entities are done
-            if self._tasks:
-                pending = [task for task in self._tasks if not task.done()]
-                self._tasks.clear()
+                # Block till all entities are done
+                if self._tasks:
+                    pending = [task for task in self._tasks if not task.done()]
+                    self._tasks.clear()
 
-                if pending:
-                    await asyncio.gather(*pending)
+                    if pending:
+                        await asyncio.gather(*pending)
 
             hass.config.components.add(full_name)
             return True
@@ -291,15 +294,6 @@ class EntityPlatform:
 
         await asyncio.gather(*tasks)
 
-        if self._async_unsub_polling is not None or not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            return
-
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass, self._update_entity_states, self.scan_interval,
-        )
-
     async def _async_add_entity(
         self, entity, update_before_add, entity_registry, device_registry
     ):
@@ -443,7 +437,17 @@ class EntityPlatform:
 
         entity_id = entity.entity_id
         self.entities[entity_id] = entity
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        poll_scheduler = async_get_poll_scheduler(self.hass)
+        # should_poll is checked on every tick, entities can start or stop
+        # polling after they are added.
+        poll_scheduler.async_add(self, entity)
+
+        def async_entity_removed() -> None:
+            """Forget the removed entity."""
+            self.entities.pop(entity_id)
+            poll_scheduler.async_remove(entity)
+
+        entity.async_on_remove(async_entity_removed)
 
         await entity.async_internal_added_to_hass()
         await entity.async_added_to_hass()
@@ -466,10 +470,6 @@ class EntityPlatform:
 
         await asyncio.gather(*tasks)
 
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
-
     async def async_destroy(self) -> None:
         """Destroy an entity platform.
 
@@ -482,12 +482,11 @@ class EntityPlatform:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
 
-        # Clean up polling job if no longer needed
-        if self._async_unsub_polling is not None and not any(
-            entity.should_poll for entity in self.entities.values()
-        ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+    @callback
+    def async_invalidate_static_attributes(self) -> None:
+        """Recalculate the cached static attributes of all entities."""
+        for entity in self.entities.values():
+            entity.async_invalidate_static_attributes()
 
     async def async_extract_from_service(self, service_call, expand_group=True):
         """Extract all known and available entities from a service call.
@@ -526,35 +525,6 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
-        """Update the states of all the polling entities.
-
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
-
-        This method must be run in the event loop.
-        """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
-            return
-
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
-
-            if tasks:
-                await asyncio.gather(*tasks)
-
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
     "current_platform", default=None
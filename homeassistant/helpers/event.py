@@ -1,9 +1,21 @@
 """Helpers for listening to events."""
 from datetime import datetime, timedelta
 import functools as ft
+import heapq
+import itertools
 import logging
 import time
-from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 
 import attr
 
@@ -17,14 +29,16 @@ from homeassistant.const import (
     SUN_EVENT_SUNSET,
 )
 from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.sun import get_astral_event_next
-from homeassistant.helpers.template import Template
+from homeassistant.helpers.template import RenderInfo, Template
 from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
 TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
+TRACK_TIME_PATTERN_SCHEDULER = "track_time_pattern_scheduler"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -149,7 +163,8 @@ def async_track_state_change_event(
             if entity_id not in entity_callbacks:
                 return
 
-            for action in entity_callbacks[entity_id]:
+            # Copy the list, a callback may resubscribe while we iterate
+            for action in entity_callbacks[entity_id][:]:
                 try:
                     hass.async_run_job(action, event)
                 except Exception:  # pylint: disable=broad-except
@@ -203,28 +218,184 @@ def async_track_template(
     variables: Optional[Dict[str, Any]] = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that track state changes with template condition."""
-    from . import condition  # pylint: disable=import-outside-toplevel
-
     # Local variable to keep track of if the action has already been triggered
     already_triggered = False
 
     @callback
-    def template_condition_listener(entity_id: str, from_s: State, to_s: State) -> None:
+    def template_condition_listener(
+        event: Event,
+        updated_template: Template,
+        last_result: Union[str, TemplateError, None],
+        result: Union[str, TemplateError],
+    ) -> None:
         """Check if condition is correct and run action."""
         nonlocal already_triggered
-        template_result = condition.async_template(hass, template, variables)
+
+        if isinstance(result, TemplateError):
+            _LOGGER.error("Error during template condition: %s", result)
+            template_result = False
+        else:
+            template_result = result.lower() == "true"
 
         # Check to see if template returns true
         if template_result and not already_triggered:
             already_triggered = True
-            hass.async_run_job(action, entity_id, from_s, to_s)
+            hass.async_run_job(
+                action,
+                event.data.get("entity_id"),
+                event.data.get("old_state"),
+                event.data.get("new_state"),
+            )
         elif not template_result:
             already_triggered = False
 
-    return async_track_state_change(
-        hass, template.extract_entities(variables), template_condition_listener
+    info = async_track_template_result(
+        hass, template, template_condition_listener, variables
     )
 
+    return info.async_remove
+
+
+@callback
+@bind_hass
+def async_track_template_result(
+    hass: HomeAssistant,
+    template: Template,
+    action: Callable[
+        [Event, Template, Union[str, TemplateError, None], Union[str, TemplateError]],
+        None,
+    ],
+    variables: Optional[Dict[str, Any]] = None,
+) -> "TrackTemplateResultInfo":
+    """Render a template again when the states it accessed change.
+
+    The template is rendered right away to find the entities and domains it
+    accesses. Every render subscribes to exactly those, so only the state
+    changes that can change the result cause another render. The action is
+    called after each of those renders with the event, the template, the
+    previous result and the new result. Results are a TemplateError when
+    the render failed.
+
+    Must be run within the event loop.
+    """
+    info = TrackTemplateResultInfo(hass, template, action, variables)
+    info.async_setup()
+    return info
+
+
+class TrackTemplateResultInfo:
+    """Track the entities and domains accessed by the renders of a template."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        template: Template,
+        action: Callable,
+        variables: Optional[Dict[str, Any]],
+    ):
+        """Initialize the tracker."""
+        self.hass = hass
+        self._template = template
+        self._action = action
+        self._variables = variables
+        self._info: Optional[RenderInfo] = None
+        self._last_result: Union[str, TemplateError, None] = None
+        self._entities: FrozenSet[str] = frozenset()
+        self._unsub_entities: Optional[CALLBACK_TYPE] = None
+        self._unsub_all: Optional[CALLBACK_TYPE] = None
+
+    @property
+    def last_result(self) -> Union[str, TemplateError, None]:
+        """Return the result of the last render."""
+        return self._last_result
+
+    @callback
+    def async_setup(self) -> None:
+        """Render the template and subscribe to what it accessed."""
+        self._last_result = self._render()
+        self._update_listeners()
+
+    @callback
+    def async_remove(self) -> None:
+        """Remove the state change listeners."""
+        if self._unsub_entities is not None:
+            self._unsub_entities()
+            self._unsub_entities = None
+        if self._unsub_all is not None:
+            self._unsub_all()
+            self._unsub_all = None
+
+    @callback
+    def async_refresh(self, event: Optional[Event] = None) -> None:
+        """Render the template again and call the action."""
+        result = self._render()
+        self._update_listeners()
+
+        last_result = self._last_result
+        self._last_result = result
+        self.hass.async_run_job(
+            self._action, event, self._template, last_result, result
+        )
+
+    def _render(self) -> Union[str, TemplateError]:
+        """Render the template and keep its render info."""
+        self._info = self._template.async_render_to_info(self._variables)
+        try:
+            return self._info.result
+        except TemplateError as ex:
+            return ex
+
+    @callback
+    def _update_listeners(self) -> None:
+        """Subscribe to the entities and domains of the last render."""
+        assert self._info is not None
+        entities = self._info.entities
+
+        if entities != self._entities:
+            if self._unsub_entities is not None:
+                self._unsub_entities()
+                self._unsub_entities = None
+            self._entities = entities
+            if entities:
+                self._unsub_entities = async_track_state_change_event(
+                    self.hass, entities, self.async_refresh
+                )
+
+        # A render that accessed no state at all, for example one that only
+        # depends on the time, keeps rendering on every state change.
+        track_all = self._info.tracks_lifecycle or (
+            not entities and not self._template.is_static
+        )
+        if track_all and self._unsub_all is None:
+            self._unsub_all = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed_listener
+            )
+        elif not track_all and self._unsub_all is not None:
+            self._unsub_all()
+            self._unsub_all = None
+
+    @callback
+    def _async_state_changed_listener(self, event: Event) -> None:
+        """Render again on the state changes the template may depend on."""
+        assert self._info is not None
+        entity_id = event.data["entity_id"]
+
+        if self._unsub_all is None or entity_id in self._entities:
+            # Unsubscribed after the event was fired or handled by the
+            # entity listener
+            return
+
+        if self._info.tracks_lifecycle and (
+            (
+                event.data.get("old_state") is not None
+                and event.data.get("new_state") is not None
+            )
+            or not self._info.filter_lifecycle(entity_id)
+        ):
+            return
+
+        self.async_refresh(event)
+
 
 track_template = threaded_listener_factory(async_track_template)
 
@@ -472,6 +643,141 @@ def async_track_sunset(
 track_sunset = threaded_listener_factory(async_track_sunset)
 
 
+@attr.s(slots=True)
+class TimePattern:
+    """A time pattern tracked by the TimePatternScheduler."""
+
+    action: Callable[..., None] = attr.ib()
+    matching_seconds: List[int] = attr.ib()
+    matching_minutes: List[int] = attr.ib()
+    matching_hours: List[int] = attr.ib()
+    local: bool = attr.ib()
+    next_time: Optional[datetime] = attr.ib(default=None)
+    removed: bool = attr.ib(default=False)
+
+    def calculate_next(self, now: datetime) -> None:
+        """Calculate and set the next time the pattern should fire."""
+        localized_now = dt_util.as_local(now) if self.local else now
+        self.next_time = dt_util.find_next_time_expression_time(
+            localized_now,
+            self.matching_seconds,
+            self.matching_minutes,
+            self.matching_hours,
+        )
+
+
+class TimePatternScheduler:
+    """Fire time patterns from a single time changed listener.
+
+    Patterns are kept in a heap ordered on the next time they fire, so a
+    time changed event only touches the patterns that are due instead of
+    running a listener per pattern every second.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._heap: List[Any] = []
+        # Patterns added since the last time changed event, their next time
+        # is calculated from the first event they see.
+        self._pending: List[TimePattern] = []
+        self._count = 0
+        self._sequence = itertools.count()
+        self._unsub: Optional[CALLBACK_TYPE] = None
+        # Make sure rolling back the clock doesn't prevent the patterns from
+        # triggering.
+        self._last_now: Optional[datetime] = None
+
+    @callback
+    def async_add(self, pattern: TimePattern) -> CALLBACK_TYPE:
+        """Add a pattern and return a callback to remove it."""
+        if self._unsub is None:
+            # We can't use async_track_point_in_utc_time here because it would
+            # break in the case that the system time abruptly jumps backwards.
+            # Our custom last_now logic takes care of resolving that scenario.
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_TIME_CHANGED, self._async_time_changed
+            )
+
+        self._pending.append(pattern)
+        self._count += 1
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the time pattern."""
+            if pattern.removed:
+                return
+            pattern.removed = True
+            self._count -= 1
+            if self._count:
+                if len(self._heap) > 2 * self._count:
+                    # Compact the heap when most entries were removed. This
+                    # happens in place as a time changed event that is being
+                    # processed can hold on to the heap.
+                    self._heap[:] = [
+                        entry for entry in self._heap if not entry[2].removed
+                    ]
+                    heapq.heapify(self._heap)
+                return
+            # Nothing left to track, stop listening to time changes
+            assert self._unsub is not None
+            self._unsub()
+            self._unsub = None
+            self._heap.clear()
+            self._pending = []
+            self._last_now = None
+            del self.hass.data[TRACK_TIME_PATTERN_SCHEDULER]
+
+        return remove_listener
+
+    @callback
+    def _push(self, pattern: TimePattern) -> None:
+        """Push a pattern with a calculated next time on the heap."""
+        heapq.heappush(self._heap, (pattern.next_time, next(self._sequence), pattern))
+
+    @callback
+    def _async_time_changed(self, event: Event) -> None:
+        """Fire the patterns that are due."""
+        now = event.data[ATTR_NOW]
+
+        if self._last_now is not None and now < self._last_now:
+            # Time rolled back, recalculate all patterns
+            patterns = [entry[2] for entry in self._heap]
+            self._heap = []
+            self._pending.extend(patterns)
+
+        self._last_now = now
+
+        if self._pending:
+            pending = self._pending
+            self._pending = []
+            for pattern in pending:
+                if pattern.removed:
+                    continue
+                pattern.calculate_next(now)
+                self._push(pattern)
+
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            pattern = heapq.heappop(heap)[2]
+            if pattern.removed:
+                continue
+            try:
+                self.hass.async_run_job(
+                    pattern.action, dt_util.as_local(now) if pattern.local else now
+                )
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error while processing time pattern")
+            if pattern.removed:
+                continue
+            pattern.calculate_next(now + timedelta(seconds=1))
+            self._push(pattern)
+
+        # Drop removed patterns that are not due yet
+        while heap and heap[0][2].removed:
+            heapq.heappop(heap)
+
+
 @callback
 @bind_hass
 def async_track_utc_time_change(
@@ -498,42 +804,16 @@ def async_track_utc_time_change(
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
 
-    next_time = None
-
-    def calculate_next(now: datetime) -> None:
-        """Calculate and set the next time the trigger should fire."""
-        nonlocal next_time
-
-        localized_now = dt_util.as_local(now) if local else now
-        next_time = dt_util.find_next_time_expression_time(
-            localized_now, matching_seconds, matching_minutes, matching_hours
-        )
-
-    # Make sure rolling back the clock doesn't prevent the timer from
-    # triggering.
-    last_now: Optional[datetime] = None
-
-    @callback
-    def pattern_time_change_listener(event: Event) -> None:
-        """Listen for matching time_changed events."""
-        nonlocal next_time, last_now
-
-        now = event.data[ATTR_NOW]
-
-        if last_now is None or now < last_now:
-            # Time rolled back or next time not yet calculated
-            calculate_next(now)
-
-        last_now = now
-
-        if next_time <= now:
-            hass.async_run_job(action, dt_util.as_local(now) if local else now)
-            calculate_next(now + timedelta(seconds=1))
+    scheduler: Optional[TimePatternScheduler] = hass.data.get(
+        TRACK_TIME_PATTERN_SCHEDULER
+    )
+    if scheduler is None:
+        scheduler = hass.data[TRACK_TIME_PATTERN_SCHEDULER] = TimePatternScheduler(hass)
 
-    # We can't use async_track_point_in_utc_time here because it would
-    # break in the case that the system time abruptly jumps backwards.
-    # Our custom last_now logic takes care of resolving that scenario.
-    return hass.bus.async_listen(EVENT_TIME_CHANGED, pattern_time_change_listener)
+    pattern = TimePattern(
+        action, matching_seconds, matching_minutes, matching_hours, local
+    )
+    return scheduler.async_add(pattern)
 
 
 track_utc_time_change = threaded_listener_factory(async_track_utc_time_change)
@@ -0,0 +1,222 @@
+"""Spread the polling of entities over their scan interval."""
+from datetime import datetime, timedelta
+import heapq
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import zlib
+
+import attr
+
+from homeassistant.const import ATTR_NOW, EVENT_TIME_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, callback
+from homeassistant.helpers.typing import HomeAssistantType
+import homeassistant.util.dt as dt_util
+
+if TYPE_CHECKING:
+    from .entity import Entity
+    from .entity_platform import EntityPlatform
+
+# mypy: allow-untyped-defs, no-check-untyped-defs
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_POLL_SCHEDULER = "poll_scheduler"
+
+
+@attr.s(slots=True)
+class PollStats:
+    """Poll statistics of an entity platform."""
+
+    polls: int = attr.ib(default=0)
+    skipped: int = attr.ib(default=0)
+    last_latency: float = attr.ib(default=0.0)
+    max_latency: float = attr.ib(default=0.0)
+    total_latency: float = attr.ib(default=0.0)
+
+    @property
+    def mean_latency(self) -> float:
+        """Return the mean duration of a poll."""
+        return self.total_latency / self.polls if self.polls else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a dictionary."""
+        return {
+            "polls": self.polls,
+            "skipped": self.skipped,
+            "last_latency": self.last_latency,
+            "mean_latency": self.mean_latency,
+            "max_latency": self.max_latency,
+        }
+
+
+@attr.s(slots=True)
+class _PollEntry:
+    """A polling entity and its place in the schedule."""
+
+    platform: "EntityPlatform" = attr.ib()
+    entity: "Entity" = attr.ib()
+    due: datetime = attr.ib()
+    seq: int = attr.ib(default=0)
+    polling: bool = attr.ib(default=False)
+    removed: bool = attr.ib(default=False)
+
+
+def poll_offset(entity_id: str, scan_interval: timedelta) -> timedelta:
+    """Return the stable offset of an entity within its scan interval.
+
+    The offset is derived from the entity id so polls of a platform are spread
+    over the interval, and an entity keeps its slot across restarts.
+    """
+    return scan_interval * (zlib.crc32(entity_id.encode()) / 2 ** 32)
+
+
+class PollScheduler:
+    """Poll entities of all platforms from a single time listener.
+
+    Every entity is polled once per scan interval of its platform, each in its
+    own slot of the interval instead of all entities of a platform at once.
+    The first poll happens within one scan interval after the entity is added.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the poll scheduler."""
+        self.hass = hass
+        self._queue: List[Tuple[datetime, int, _PollEntry]] = []
+        self._entries: Dict[int, _PollEntry] = {}
+        self._seq = 0
+        self._unsub_time_changed: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def async_add(self, platform: "EntityPlatform", entity: "Entity") -> None:
+        """Start polling an entity."""
+        scan_interval = platform.scan_interval
+        due = (
+            dt_util.utcnow()
+            + scan_interval
+            - poll_offset(entity.entity_id, scan_interval)
+        )
+        entry = self._entries[id(entity)] = _PollEntry(platform, entity, due)
+        self._schedule(entry, due)
+
+        if self._unsub_time_changed is None:
+            self._unsub_time_changed = self.hass.bus.async_listen(
+                EVENT_TIME_CHANGED, self._async_time_changed
+            )
+
+    @callback
+    def async_remove(self, entity: "Entity") -> None:
+        """Stop polling an entity."""
+        entry = self._entries.pop(id(entity), None)
+
+        if entry is None:
+            return
+
+        entry.removed = True
+
+        if not self._entries and self._unsub_time_changed is not None:
+            self._unsub_time_changed()
+            self._unsub_time_changed = None
+            self._queue.clear()
+
+    @callback
+    def async_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return the poll statistics of all platforms with polled entities."""
+        return {
+            f"{entry.platform.domain}.{entry.platform.platform_name}": (
+                entry.platform.poll_stats.as_dict()
+            )
+            for entry in self._entries.values()
+            if entry.platform.poll_stats.polls or entry.platform.poll_stats.skipped
+        }
+
+    @callback
+    def _schedule(self, entry: _PollEntry, due: datetime) -> None:
+        """Schedule the next poll of an entity.
+
+        Earlier queue items of the entry are left in the queue and ignored.
+        """
+        self._seq += 1
+        entry.due = due
+        entry.seq = self._seq
+        heapq.heappush(self._queue, (due, self._seq, entry))
+
+    @callback
+    def _async_time_changed(self, event: Event) -> None:
+        """Poll the entities that are due."""
+        now = event.data[ATTR_NOW]
+        queue = self._queue
+        skipped_platforms = []
+
+        while queue and queue[0][0] <= now:
+            due, seq, entry = heapq.heappop(queue)
+
+            if entry.removed or entry.seq != seq:
+                continue
+
+            platform = entry.platform
+            scan_interval = platform.scan_interval
+            # Keep the slot of the entity when time jumped over several polls.
+            missed = (now - due) // scan_interval
+            self._schedule(entry, due + (missed + 1) * scan_interval)
+
+            if entry.polling:
+                platform.poll_stats.skipped += 1
+                if platform not in skipped_platforms:
+                    skipped_platforms.append(platform)
+                continue
+
+            if not entry.entity.should_poll:
+                continue
+
+            entry.polling = True
+            self.hass.async_create_task(self._async_poll(entry))
+
+        for platform in skipped_platforms:
+            platform.logger.warning(
+                "Updating %s %s took longer than the scheduled update interval %s",
+                platform.platform_name,
+                platform.domain,
+                platform.scan_interval,
+            )
+
+    async def _async_poll(self, entry: _PollEntry) -> None:
+        """Poll an entity and record how long it took."""
+        platform = entry.platform
+        stats = platform.poll_stats
+        start = self.hass.loop.time()
+
+        try:
+            await entry.entity.async_update_ha_state(True)
+        finally:
+            entry.polling = False
+            latency = self.hass.loop.time() - start
+            stats.polls += 1
+            stats.last_latency = latency
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+
+        scan_interval = platform.scan_interval
+
+        if entry.removed or latency <= scan_interval.total_seconds():
+            return
+
+        # The device could not keep up, give it a full interval of rest
+        # instead of polling it again right away.
+        _LOGGER.debug(
+            "Polling %s took %.3f seconds, longer than its scan interval %s",
+            entry.entity.entity_id,
+            latency,
+            scan_interval,
+        )
+        self._schedule(entry, max(entry.due, dt_util.utcnow() + scan_interval))
+
+
+@callback
+def async_get_poll_scheduler(hass: HomeAssistantType) -> PollScheduler:
+    """Return the poll scheduler of Home Assistant."""
+    scheduler: Optional[PollScheduler] = hass.data.get(DATA_POLL_SCHEDULER)
+
+    if scheduler is None:
+        scheduler = hass.data[DATA_POLL_SCHEDULER] = PollScheduler(hass)
+
+    return scheduler
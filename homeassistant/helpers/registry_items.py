@@ -0,0 +1,77 @@
+"""Indexed containers for registry entries."""
+from collections import UserDict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+IndexKeys = Callable[[Any], Iterable[Hashable]]
+
+
+def attribute_key(name: str) -> IndexKeys:
+    """Index entries by the value of an attribute, skipping None."""
+
+    def keys(entry: Any) -> Iterable[Hashable]:
+        value = getattr(entry, name, None)
+        return () if value is None else (value,)
+
+    return keys
+
+
+def attribute_keys(name: str) -> IndexKeys:
+    """Index entries by every item of a set attribute."""
+
+    def keys(entry: Any) -> Iterable[Hashable]:
+        return getattr(entry, name, None) or ()
+
+    return keys
+
+
+class IndexedRegistryItems(UserDict):
+    """Map of registry entries by id that keeps secondary indexes.
+
+    Subclasses declare ``INDEXES``, a map of index name to a function that
+    returns the keys an entry is reachable by. The indexes are updated on every
+    assignment and removal, so lookups do not need to scan all entries.
+    """
+
+    INDEXES: Dict[str, IndexKeys] = {}
+
+    def __init__(self, entries: Optional[Dict[str, Any]] = None) -> None:
+        """Initialize the container."""
+        self._indexes: Dict[str, Dict[Hashable, Dict[str, None]]] = {
+            name: {} for name in self.INDEXES
+        }
+        super().__init__(entries)
+
+    def __setitem__(self, item_id: str, entry: Any) -> None:
+        """Add or replace an entry."""
+        old = self.data.get(item_id)
+        self.data[item_id] = entry
+        self._reindex(item_id, old, entry)
+
+    def __delitem__(self, item_id: str) -> None:
+        """Remove an entry."""
+        old = self.data.pop(item_id)
+        self._reindex(item_id, old, None)
+
+    def _reindex(self, item_id: str, old: Any, new: Any) -> None:
+        """Move an item between index keys when its entry changes."""
+        for name, keys_for in self.INDEXES.items():
+            index = self._indexes[name]
+            old_keys = set(keys_for(old)) if old is not None else set()
+            new_keys = set(keys_for(new)) if new is not None else set()
+
+            for key in old_keys - new_keys:
+                item_ids = index[key]
+                del item_ids[item_id]
+                if not item_ids:
+                    del index[key]
+
+            for key in new_keys - old_keys:
+                index.setdefault(key, {})[item_id] = None
+
+    def get_ids(self, name: str, key: Hashable) -> List[str]:
+        """Return the ids of the entries reachable by key in an index."""
+        return list(self._indexes[name].get(key, ()))
+
+    def get_entries(self, name: str, key: Hashable) -> List[Any]:
+        """Return the entries reachable by key in an index."""
+        return [self.data[item_id] for item_id in self._indexes[name].get(key, ())]
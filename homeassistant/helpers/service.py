@@ -16,6 +16,7 @@ from typing import (
 
 import voluptuous as vol
 
+from homeassistant.auth import EVENT_USER_REMOVED
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_CONTROL
 from homeassistant.const import (
     ATTR_AREA_ID,
@@ -52,6 +53,7 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+SERVICE_USER_CACHE = "service_user_cache"
 
 
 @bind_hass
@@ -334,6 +336,35 @@ def async_set_service_schema(
     hass.data[SERVICE_DESCRIPTION_CACHE][f"{domain}.{service}"] = description
 
 
+async def _async_get_service_user(hass, user_id):
+    """Return the user calling a service.
+
+    Users are cached until they are removed, their permissions are cached on the
+    user object itself.
+    """
+    users = hass.data.get(SERVICE_USER_CACHE)
+
+    if users is None:
+        users = hass.data[SERVICE_USER_CACHE] = {}
+
+        @ha.callback
+        def _async_user_removed(event):
+            """Forget a removed user."""
+            users.pop(event.data["user_id"], None)
+
+        hass.bus.async_listen(EVENT_USER_REMOVED, _async_user_removed)
+
+    user = users.get(user_id)
+
+    if user is None:
+        user = await hass.auth.async_get_user(user_id)
+
+        if user is not None:
+            users[user_id] = user
+
+    return user
+
+
 @bind_hass
 async def entity_service_call(hass, platforms, func, call, required_features=None):
     """Handle an entity service call.
@@ -341,7 +372,7 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
     Calls all platforms simultaneously.
     """
     if call.context.user_id:
-        user = await hass.auth.async_get_user(call.context.user_id)
+        user = await _async_get_service_user(hass, call.context.user_id)
         if user is None:
             raise UnknownUser(context=call.context)
         entity_perms = user.permissions.check_entity
@@ -375,13 +406,7 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
             if target_all_entities:
                 entity_candidates.extend(platform.entities.values())
             else:
-                entity_candidates.extend(
-                    [
-                        entity
-                        for entity in platform.entities.values()
-                        if entity.entity_id in entity_ids
-                    ]
-                )
+                entity_candidates.extend(_platform_entities(platform, entity_ids))
 
     elif target_all_entities:
         # If we target all entities, we will select all entities the user
@@ -398,10 +423,7 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
     else:
         for platform in platforms:
             platform_entities = []
-            for entity in platform.entities.values():
-
-                if entity.entity_id not in entity_ids:
-                    continue
+            for entity in _platform_entities(platform, entity_ids):
 
                 if not entity_perms(entity.entity_id, POLICY_CONTROL):
                     raise Unauthorized(
@@ -471,6 +493,20 @@ async def entity_service_call(hass, platforms, func, call, required_features=Non
             future.result()  # pop exception if have
 
 
+def _platform_entities(platform, entity_ids):
+    """Return the targeted entities of a platform.
+
+    Looks the targets up in the entity_id to entity map of the platform, so the
+    cost does not grow with the number of entities on the platform.
+    """
+    platform_entities = platform.entities
+    return [
+        platform_entities[entity_id]
+        for entity_id in entity_ids
+        if entity_id in platform_entities
+    ]
+
+
 async def _handle_entity_call(hass, entity, func, data, context):
     """Handle calling service method."""
     entity.async_set_context(context)
@@ -1,5 +1,6 @@
 """Template helper methods for rendering strings with Home Assistant data."""
 import base64
+from collections import OrderedDict
 import collections.abc
 from datetime import datetime
 from functools import wraps
@@ -8,7 +9,8 @@ import logging
 import math
 import random
 import re
-from typing import Any, Dict, Iterable, List, Optional, Union
+import time
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Union
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -50,6 +52,9 @@ _RE_GET_ENTITIES = re.compile(
 )
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{")
 
+# Number of compiled templates kept by each template environment
+COMPILE_CACHE_SIZE = 2048
+
 
 @bind_hass
 def attach(hass: HomeAssistantType, obj: Any) -> None:
@@ -146,6 +151,20 @@ class RenderInfo:
             or entity_id in self._entities
         )
 
+    @property
+    def entities(self) -> FrozenSet[str]:
+        """Return the entities whose state the render accessed."""
+        return self._entities
+
+    @property
+    def tracks_lifecycle(self) -> bool:
+        """Return if entities being added or removed can change the result.
+
+        This is the case when the render iterated over all states or the
+        states of a domain.
+        """
+        return self._all_states or bool(getattr(self, "_domains", None))
+
     @property
     def result(self) -> str:
         """Results of the template computation."""
@@ -194,10 +213,15 @@ class Template:
             return
 
         try:
-            self._compiled_code = self._env.compile(self.template)
+            self._compiled_code = self._env.compile_cached(self.template)
         except jinja2.exceptions.TemplateSyntaxError as err:
             raise TemplateError(err)
 
+    @property
+    def is_static(self) -> bool:
+        """Return if the template is a plain string without jinja code."""
+        return _RE_JINJA_DELIMITERS.search(self.template) is None
+
     def extract_entities(
         self, variables: Optional[Dict[str, Any]] = None
     ) -> Union[str, List[str]]:
@@ -297,11 +321,7 @@ class Template:
 
         assert self.hass is not None, "hass variable not set on template"
 
-        env = self._env
-
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        self._compiled = self._env.from_code_cached(self.template, self._compiled_code)
 
         return self._compiled
 
@@ -398,8 +418,7 @@ class DomainStates:
             sorted(
                 (
                     _wrap_state(self._hass, state)
-                    for state in self._hass.states.async_all()
-                    if state.domain == self._domain
+                    for state in self._hass.states.async_all(self._domain)
                 ),
                 key=lambda state: state.entity_id,
             )
@@ -952,6 +971,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__()
         self.hass = hass
+        # Template source -> [compiled code, template bound to this environment]
+        self.template_cache: OrderedDict = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.compile_time = 0.0
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1027,6 +1051,47 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.globals["state_attr"] = hassfunction(state_attr)
         self.globals["states"] = AllStates(hass)
 
+    def _cache_entry(self, source):
+        """Return the cache entry of a source and mark it as recently used."""
+        entry = self.template_cache.get(source)
+        if entry is not None:
+            self.template_cache.move_to_end(source)
+        return entry
+
+    def _cache_insert(self, source, code):
+        """Add compiled code to the cache and evict the least recently used."""
+        entry = self.template_cache[source] = [code, None]
+        if len(self.template_cache) > COMPILE_CACHE_SIZE:
+            self.template_cache.popitem(last=False)
+        return entry
+
+    def compile_cached(self, source):
+        """Compile a template source, sharing the code between equal sources."""
+        entry = self._cache_entry(source)
+        if entry is not None:
+            self.cache_hits += 1
+            return entry[0]
+
+        start = time.perf_counter()
+        code = self.compile(source)
+        self.compile_time += time.perf_counter() - start
+        self.cache_misses += 1
+
+        return self._cache_insert(source, code)[0]
+
+    def from_code_cached(self, source, code):
+        """Return the template of a source bound to this environment.
+
+        The code may have been compiled by another environment, for example
+        while validating the configuration.
+        """
+        entry = self._cache_entry(source)
+        if entry is None:
+            entry = self._cache_insert(source, code)
+        if entry[1] is None:
+            entry[1] = jinja2.Template.from_code(self, entry[0], self.globals, None)
+        return entry[1]
+
     def is_safe_callable(self, obj):
         """Test if callback is safe."""
         return isinstance(obj, AllStates) or super().is_safe_callable(obj)
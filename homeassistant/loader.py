@@ -11,12 +11,14 @@ import json
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterable,
     List,
     Optional,
     Set,
@@ -36,6 +38,8 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_IMPORT_TIMES = "integration_import_times"
+DATA_PRELOAD = "integration_preload"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -310,7 +314,7 @@ class Integration:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import_module(self.pkg_path)
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -318,11 +322,65 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = importlib.import_module(
-                f"{self.pkg_path}.{platform_name}"
-            )
+            cache[full_name] = self._import_module(f"{self.pkg_path}.{platform_name}")
         return cache[full_name]  # type: ignore
 
+    def _import_module(self, name: str) -> ModuleType:
+        """Import a module of the integration and record the time it took."""
+        if name in sys.modules:
+            return importlib.import_module(name)
+
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self._record_import_time(name, time.perf_counter() - start)
+        return module
+
+    def _record_import_time(self, name: str, elapsed: float) -> None:
+        """Add the time spent importing a module to the integration."""
+        import_times = self.hass.data.setdefault(DATA_IMPORT_TIMES, {})
+        import_times[self.domain] = import_times.get(self.domain, 0) + elapsed
+        _LOGGER.debug("Imported %s in %.3fs", name, elapsed)
+
+    async def async_preload(self, platforms: Iterable[str] = ()) -> None:
+        """Import the component and platforms in the executor.
+
+        This keeps slow imports off the event loop. Errors are not raised
+        here, get_component and get_platform raise them when the module
+        is imported again on the event loop.
+        """
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        pending = self.hass.data.setdefault(DATA_PRELOAD, {})
+        tasks = []
+
+        modules = {self.domain: self.pkg_path}
+        for platform in platforms:
+            modules[f"{self.domain}.{platform}"] = f"{self.pkg_path}.{platform}"
+
+        for key, name in modules.items():
+            # A module that is still being imported in the executor is
+            # already in sys.modules, but only partly initialized.
+            task = pending.get(name)
+            if task is None:
+                if key in cache or name in sys.modules:
+                    continue
+                task = pending[name] = self.hass.async_create_task(
+                    self._async_preload_module(name)
+                )
+            tasks.append(task)
+
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def _async_preload_module(self, name: str) -> None:
+        """Import a module in the executor."""
+        try:
+            elapsed = await self.hass.async_add_executor_job(_preload_module, name)
+        finally:
+            del self.hass.data[DATA_PRELOAD][name]
+
+        if elapsed is not None:
+            self._record_import_time(name, elapsed)
+
     def __repr__(self) -> str:
         """Text representation of class."""
         return f"<Integration {self.domain}: {self.pkg_path}>"
@@ -388,6 +446,49 @@ async def async_get_integration(hass: "HomeAssistant", domain: str) -> Integrati
     return integration
 
 
+def _preload_module(name: str) -> Optional[float]:
+    """Import a module and return the time it took or None if it failed."""
+    start = time.perf_counter()
+    try:
+        importlib.import_module(name)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Unable to preload %s", name, exc_info=True)
+        return None
+    return time.perf_counter() - start
+
+
+async def async_preload_integrations(
+    hass: "HomeAssistant", integrations: Iterable[Integration]
+) -> None:
+    """Import integrations in parallel in the executor.
+
+    An integration is imported after the integrations it depends on, which
+    it usually imports itself. Integrations that have requirements, or
+    depend on one that has, are left to be imported by setup once the
+    requirements are processed.
+    """
+    tasks: Dict[str, asyncio.Future] = {}
+
+    async def preload(integration: Integration) -> bool:
+        """Import an integration once its dependencies are imported."""
+        dep_tasks = [tasks[dep] for dep in integration.dependencies if dep in tasks]
+        if dep_tasks:
+            await asyncio.wait(dep_tasks)
+            if not all(task.result() for task in dep_tasks):
+                return False
+        if integration.requirements and not hass.config.skip_pip:
+            return False
+        await integration.async_preload()
+        return True
+
+    for integration in integrations:
+        if integration.domain not in tasks:
+            tasks[integration.domain] = hass.async_create_task(preload(integration))
+
+    if tasks:
+        await asyncio.wait(tasks.values())
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -5,7 +5,7 @@ import os
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Union, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 import homeassistant.util.package as pkg_util
@@ -15,6 +15,9 @@ DATA_PKG_CACHE = "pkg_cache"
 DATA_INTEGRATIONS_WITH_REQS = "integrations_with_reqs"
 CONSTRAINT_FILE = "package_constraints.txt"
 PROGRESS_FILE = ".pip_progress"
+STORAGE_KEY = "core.requirements"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
 _LOGGER = logging.getLogger(__name__)
 DISCOVERY_INTEGRATIONS: Dict[str, Iterable[str]] = {
     "ssdp": ("ssdp",),
@@ -120,8 +123,14 @@ async def async_process_requirements(
     kwargs = pip_kwargs(hass.config.config_dir)
 
     async with pip_lock:
+        pkg_cache = await _async_get_pkg_cache(hass)
+
         for req in requirements:
-            if pkg_util.is_installed(req):
+            if req in pkg_cache.satisfied:
+                continue
+
+            if await hass.async_add_executor_job(pkg_util.is_installed, req):
+                pkg_cache.async_add_satisfied(req)
                 continue
 
             ret = await hass.async_add_executor_job(_install, hass, req, kwargs)
@@ -129,6 +138,73 @@ async def async_process_requirements(
             if not ret:
                 raise RequirementsNotFound(name, [req])
 
+            # Installing may have upgraded packages other requirements use
+            await pkg_cache.async_reset()
+            pkg_cache.async_add_satisfied(req)
+
+
+class PackageCache:
+    """Requirements known to be satisfied by the installed packages.
+
+    The requirements are stored together with a fingerprint of the package
+    directories. When the fingerprint changed the stored requirements are
+    dropped, so a warm start only checks the package metadata when packages
+    were installed or removed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.satisfied: Set[str] = set()
+        self._fingerprint: Optional[str] = None
+        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+
+    async def async_load(self) -> None:
+        """Load the requirements that were satisfied by the same packages."""
+        self._fingerprint = await self._async_fingerprint()
+        data = await self._store.async_load()
+
+        if data is not None and data.get("fingerprint") == self._fingerprint:
+            self.satisfied = set(data["requirements"])
+
+    async def async_reset(self) -> None:
+        """Forget the satisfied requirements after the packages changed."""
+        self._fingerprint = await self._async_fingerprint()
+        self.satisfied = set()
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    async def _async_fingerprint(self) -> str:
+        """Return the fingerprint of the installed packages."""
+        config_dir = self.hass.config.config_dir
+        deps_dir = None if config_dir is None else os.path.join(config_dir, "deps")
+        return await self.hass.async_add_executor_job(
+            pkg_util.environment_fingerprint, deps_dir
+        )
+
+    @callback
+    def async_add_satisfied(self, req: str) -> None:
+        """Add a requirement that is satisfied."""
+        self.satisfied.add(req)
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the data to store."""
+        return {
+            "fingerprint": self._fingerprint,
+            "requirements": sorted(self.satisfied),
+        }
+
+
+async def _async_get_pkg_cache(hass: HomeAssistant) -> PackageCache:
+    """Return the package cache, loading it on first use."""
+    pkg_cache = hass.data.get(DATA_PKG_CACHE)
+    if pkg_cache is None:
+        pkg_cache = PackageCache(hass)
+        await pkg_cache.async_load()
+        hass.data[DATA_PKG_CACHE] = pkg_cache
+    return cast(PackageCache, pkg_cache)
+
 
 def _install(hass: HomeAssistant, req: str, kwargs: Dict) -> bool:
     """Install requirement."""
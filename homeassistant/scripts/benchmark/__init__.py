@@ -6,14 +6,24 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
+from types import SimpleNamespace
 from typing import Callable, Dict, TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_NOW,
+    ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+)
+from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.service import entity_service_call
 from homeassistant.util import dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
@@ -84,6 +94,46 @@ async def fire_events(hass):
     return timer() - start
 
 
+@benchmark
+async def fire_events_many_listeners(hass):
+    """Fire a hundred events to a thousand listeners of each job type."""
+    count = 0
+    event_name = "benchmark_event"
+    listeners = 10 ** 3
+    events = 10 ** 2
+    expected = 2 * listeners * events
+    event = asyncio.Event()
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+        if count == expected:
+            event.set()
+
+    async def async_listener(_):
+        """Handle event in a coroutine."""
+        listener(None)
+
+    for _ in range(listeners):
+        hass.bus.async_listen(event_name, listener)
+        hass.bus.async_listen(event_name, async_listener)
+
+    start = timer()
+
+    for _ in range(events):
+        hass.bus.async_fire(event_name)
+
+    await event.wait()
+
+    runtime = timer() - start
+    print(f"{events / runtime:.0f} events/s to {2 * listeners} listeners")
+
+    return runtime
+
+
 @benchmark
 async def time_changed_helper(hass):
     """Run a million events through time changed helper."""
@@ -145,6 +195,53 @@ async def state_changed_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def entity_service_call_targeted(hass):
+    """Call a service on one entity of components of growing size."""
+    calls = 10 ** 3
+    runtime = 0
+    # Loading the group integration to expand the targets needs a config dir
+    config_dir = TemporaryDirectory()
+    hass.config.config_dir = config_dir.name
+
+    class BenchmarkEntity(Entity):
+        """Entity that is the target of the service calls."""
+
+        should_poll = False
+
+        def __init__(self, entity_id):
+            """Initialize the entity."""
+            self.hass = hass
+            self.entity_id = entity_id
+
+        async def async_turn_on(self):
+            """Handle the service call."""
+
+    for size in (10, 10 ** 2, 10 ** 3, 10 ** 4):
+        platform = SimpleNamespace(
+            entities={
+                f"light.bench_{idx}": BenchmarkEntity(f"light.bench_{idx}")
+                for idx in range(size)
+            }
+        )
+        call = core.ServiceCall(
+            "light", "turn_on", {"entity_id": f"light.bench_{size // 2}"}
+        )
+
+        start = timer()
+
+        for _ in range(calls):
+            await entity_service_call(hass, [platform], "async_turn_on", call)
+
+        size_runtime = timer() - start
+        runtime += size_runtime
+        print(f"{size} entities: {size_runtime / calls * 10 ** 6:.0f}µs per call")
+
+    config_dir.cleanup()
+
+    return runtime
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -289,10 +386,8 @@ def _create_state_changed_event_from_old_new(
     """Create a state changed event from a old and new state."""
     attributes = {}
     if new_state is not None:
-        attributes = new_state.get("attributes")
+        attributes = new_state.get("attributes") or {}
     attributes_json = json.dumps(attributes, cls=JSONEncoder)
-    if attributes_json == "null":
-        attributes_json = "{}"
     row = collections.namedtuple(
         "Row",
         [
@@ -313,6 +408,8 @@ def _create_state_changed_event_from_old_new(
     row.event_type = EVENT_STATE_CHANGED
     row.event_data = "{}"
     row.attributes = attributes_json
+    row.has_unit_of_measurement = ATTR_UNIT_OF_MEASUREMENT in attributes
+    row.device_class = attributes.get(ATTR_DEVICE_CLASS)
     row.time_fired = event_time_fired
     row.state = new_state and new_state.get("state")
     row.entity_id = entity_id
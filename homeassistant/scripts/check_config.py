@@ -9,7 +9,7 @@ from typing import Any, Callable, Dict, List, Tuple
 from unittest.mock import patch
 
 from homeassistant import bootstrap, core
-from homeassistant.config import get_default_config_dir
+from homeassistant.config import async_enable_yaml_node_cache, get_default_config_dir
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.check_config import async_check_ha_config_file
 import homeassistant.util.yaml.loader as yaml_loader
@@ -196,11 +196,12 @@ def check(config_dir, secrets=False):
 
     if secrets:
         # Ensure !secrets point to the patched function
-        yaml_loader.yaml.SafeLoader.add_constructor("!secret", yaml_loader.secret_yaml)
+        yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
 
     try:
         hass = core.HomeAssistant()
         hass.config.config_dir = config_dir
+        async_enable_yaml_node_cache(hass)
 
         res["components"] = hass.loop.run_until_complete(
             async_check_ha_config_file(hass)
@@ -222,9 +223,7 @@ def check(config_dir, secrets=False):
             pat.stop()
         if secrets:
             # Ensure !secrets point to the original function
-            yaml_loader.yaml.SafeLoader.add_constructor(
-                "!secret", yaml_loader.secret_yaml
-            )
+            yaml_loader.add_constructor("!secret", yaml_loader.secret_yaml)
         bootstrap.clear_secret_cache()
 
     return res
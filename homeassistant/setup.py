@@ -1,9 +1,10 @@
 """All methods needed to bootstrap a Home Assistant instance."""
 import asyncio
+from contextlib import contextmanager
 import logging.handlers
 from timeit import default_timer as timer
 from types import ModuleType
-from typing import Awaitable, Callable, Optional, Set
+from typing import Any, Awaitable, Callable, Dict, Generator, List, Optional, Set
 
 from homeassistant import config as conf_util, core, loader, requirements
 from homeassistant.config import async_notify_setup_error
@@ -20,6 +21,15 @@ DATA_SETUP_DONE = "setup_done"
 DATA_SETUP_STARTED = "setup_started"
 DATA_SETUP = "setup_tasks"
 DATA_DEPS_REQS = "deps_reqs_processed"
+DATA_SETUP_TIMELINE = "setup_timeline"
+DATA_SETUP_TIMELINE_FINISHED = "setup_timeline_finished"
+
+PHASE_MANIFEST = "manifest"
+PHASE_REQUIREMENTS = "requirements"
+PHASE_IMPORT = "import"
+PHASE_SETUP = "setup"
+PHASE_SETUP_ENTRY = "setup_entry"
+PHASE_SETUP_PLATFORM = "setup_platform"
 
 SLOW_SETUP_WARNING = 10
 
@@ -38,6 +48,111 @@ def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: Set[str])
     hass.data[DATA_SETUP_DONE] = {domain: asyncio.Event() for domain in domains}
 
 
+@contextmanager
+def timeline_phase(
+    hass: core.HomeAssistant, domain: str, phase: str, platform: Optional[str] = None
+) -> Generator[None, None, None]:
+    """Record how long a setup phase of an integration takes.
+
+    The phases of all integrations form the setup timeline of Home Assistant.
+    Nothing is recorded once the startup of Home Assistant has finished.
+    """
+    if hass.data.get(DATA_SETUP_TIMELINE_FINISHED):
+        yield
+        return
+
+    timeline = hass.data.get(DATA_SETUP_TIMELINE)
+
+    if timeline is None:
+        timeline = hass.data[DATA_SETUP_TIMELINE] = []
+
+    start = timer()
+    try:
+        yield
+    finally:
+        item = {"domain": domain, "phase": phase, "start": start, "end": timer()}
+        if platform is not None:
+            item["platform"] = platform
+        timeline.append(item)
+
+
+@core.callback
+def async_finish_setup_timeline(hass: core.HomeAssistant) -> None:
+    """Stop recording setup phases once Home Assistant has started.
+
+    Integrations that are set up later, for example on a retry or reload,
+    would otherwise grow the timeline for as long as Home Assistant runs.
+    """
+    hass.data[DATA_SETUP_TIMELINE_FINISHED] = True
+
+
+@core.callback
+def async_get_setup_timeline(hass: core.HomeAssistant) -> List[Dict[str, Any]]:
+    """Return the setup phases of all integrations.
+
+    Times are in seconds since the first recorded phase started.
+    """
+    timeline = hass.data.get(DATA_SETUP_TIMELINE)
+
+    if not timeline:
+        return []
+
+    offset = min(item["start"] for item in timeline)
+    return [
+        {
+            **item,
+            "start": round(item["start"] - offset, 6),
+            "end": round(item["end"] - offset, 6),
+        }
+        for item in sorted(timeline, key=lambda item: item["start"])
+    ]
+
+
+@core.callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> Dict[str, Any]:
+    """Return the setup timeline in the Chrome trace event format.
+
+    The result can be loaded in chrome://tracing or Perfetto. Every integration
+    is shown as a thread with its setup phases.
+    """
+    events: List[Dict[str, Any]] = []
+    thread_ids: Dict[str, int] = {}
+
+    for item in async_get_setup_timeline(hass):
+        domain = item["domain"]
+        tid = thread_ids.get(domain)
+
+        if tid is None:
+            tid = thread_ids[domain] = len(thread_ids) + 1
+            events.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"name": domain},
+                }
+            )
+
+        name = item["phase"]
+        if "platform" in item:
+            name = f"{name} {item['platform']}"
+
+        events.append(
+            {
+                "name": name,
+                "cat": item["phase"],
+                "ph": "X",
+                "pid": 1,
+                "tid": tid,
+                "ts": round(item["start"] * 1000000),
+                "dur": round((item["end"] - item["start"]) * 1000000),
+            }
+        )
+
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
     """Set up a component and all its dependencies."""
     return asyncio.run_coroutine_threadsafe(
@@ -122,7 +237,8 @@ async def _async_setup_component(
         async_notify_setup_error(hass, domain, link)
 
     try:
-        integration = await loader.async_get_integration(hass, domain)
+        with timeline_phase(hass, domain, PHASE_MANIFEST):
+            integration = await loader.async_get_integration(hass, domain)
     except loader.IntegrationNotFound:
         log_error("Integration not found.")
         return False
@@ -142,7 +258,10 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = integration.get_component()
+        with timeline_phase(hass, domain, PHASE_IMPORT):
+            # Import in the executor first so a slow import does not block the loop
+            await integration.async_preload()
+            component = integration.get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", integration.documentation)
         return False
@@ -190,7 +309,8 @@ async def _async_setup_component(
             hass.data[DATA_SETUP_STARTED].pop(domain)
             return False
 
-        result = await asyncio.wait_for(task, SLOW_SETUP_MAX_WAIT)
+        with timeline_phase(hass, domain, PHASE_SETUP):
+            result = await asyncio.wait_for(task, SLOW_SETUP_MAX_WAIT)
     except asyncio.TimeoutError:
         _LOGGER.error(
             "Setup of %s is taking longer than %s seconds."
@@ -274,6 +394,8 @@ async def async_prepare_setup_platform(
         log_error(str(err))
         return None
 
+    await integration.async_preload([domain])
+
     try:
         platform = integration.get_platform(domain)
     except ImportError as exc:
@@ -319,9 +441,10 @@ async def async_process_deps_reqs(
         raise HomeAssistantError("Could not set up all dependencies.")
 
     if not hass.config.skip_pip and integration.requirements:
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+        with timeline_phase(hass, integration.domain, PHASE_REQUIREMENTS):
+            await requirements.async_get_integration_with_requirements(
+                hass, integration.domain
+            )
 
     processed.add(integration.domain)
 
@@ -1,8 +1,10 @@
 """Helpers to install PyPi packages."""
 import asyncio
+import hashlib
 import logging
 import os
 from pathlib import Path
+import site
 from subprocess import PIPE, Popen
 import sys
 from typing import Optional
@@ -37,6 +39,33 @@ def is_docker_env() -> bool:
     return Path("/.dockerenv").exists()
 
 
+def environment_fingerprint(deps_dir: Optional[str] = None) -> str:
+    """Return a fingerprint of the directories packages are installed in.
+
+    Installing, upgrading or removing a package changes the modification
+    time of the directory it is installed in. Other directories on the path,
+    like the configuration directory, are left out because files in them
+    change all the time.
+    """
+    paths = list(getattr(site, "getsitepackages", list)())
+    paths.append(site.getusersitepackages())
+    paths.extend(
+        path
+        for path in sys.path
+        if os.path.basename(path) in ("site-packages", "dist-packages")
+    )
+    if deps_dir is not None:
+        paths.append(deps_dir)
+
+    parts = []
+    for path in sorted(set(paths)):
+        try:
+            parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            continue
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
 def is_installed(package: str) -> bool:
     """Check if a package is installed and will be loaded when we import it.
 
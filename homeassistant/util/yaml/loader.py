@@ -1,10 +1,29 @@
 """Custom loader."""
 from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
 import fnmatch
+import hashlib
+import io
 import logging
 import os
+import pickle
 import sys
-from typing import Dict, Iterator, List, TypeVar, Union, overload
+import tempfile
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
 
 import yaml
 
@@ -13,6 +32,14 @@ from homeassistant.exceptions import HomeAssistantError
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .objects import NodeListClass, NodeStrClass
 
+if TYPE_CHECKING:
+    # The stubs of the libyaml loader lack most of the loader methods
+    _BaseSafeLoader = yaml.SafeLoader
+else:
+    _BaseSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+HAS_C_LOADER = _BaseSafeLoader is not yaml.SafeLoader
+
 try:
     import keyring
 except ImportError:
@@ -32,6 +59,18 @@ DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 _LOGGER = logging.getLogger(__name__)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
 
+NODE_CACHE_VERSION = 2
+# Written before the pickled entries, which are only unpickled when the
+# header matches exactly
+NODE_CACHE_HEADER = (
+    f"home-assistant-yaml-node-cache {NODE_CACHE_VERSION} "
+    f"{'c' if HAS_C_LOADER else 'python'}\n"
+).encode()
+
+_ACTIVE_NODE_CACHE: ContextVar[Optional["YamlNodeCache"]] = ContextVar(
+    "yaml_node_cache", default=None
+)
+
 
 def clear_secret_cache() -> None:
     """Clear the secret cache.
@@ -41,24 +80,190 @@ def clear_secret_cache() -> None:
     __SECRET_CACHE.clear()
 
 
-class SafeLineLoader(yaml.SafeLoader):
-    """Loader class that keeps track of line numbers."""
+class FastSafeLoader(_BaseSafeLoader):
+    """Loader class that uses the libyaml parser when it is available.
+
+    Line numbers are taken from the start marks of the nodes, which libyaml
+    provides as well.
+    """
+
+    def __init__(self, stream: Union[str, io.TextIOBase]) -> None:
+        """Initialize the loader."""
+        super().__init__(stream)
+        self.name = getattr(stream, "name", "<file>")
+
+
+def add_constructor(tag: str, constructor: Callable) -> None:
+    """Register a constructor with all loaders of Home Assistant."""
+    yaml.SafeLoader.add_constructor(tag, constructor)
+    FastSafeLoader.add_constructor(tag, constructor)
+
+
+class YamlNodeCache:
+    """Persistent cache of parsed YAML files.
+
+    The cache holds the composed node graph of every file, which is the result
+    of the expensive parsing step. Constructing the configuration from the
+    nodes is cheap and still happens on every load, so tags like !secret,
+    !env_var and !include are resolved against their current values and the
+    objects keep their line annotations.
+
+    Entries are validated by the modification time and size of the file, and
+    by a hash of its contents when those changed. Secrets are never cached.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the cache."""
+        self.path = path
+        self._entries: Optional[
+            Dict[str, Tuple[int, int, str, Optional[yaml.Node]]]
+        ] = None
+        self._used: Set[str] = set()
+        self._dirty = False
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Use the cache for all files loaded in this context.
+
+        Entries of files that were not loaded in the context are dropped when
+        the cache is saved afterwards.
+        """
+        with self._lock:
+            if self._entries is None:
+                self._entries = self._load()
+            self._used = set()
+            token = _ACTIVE_NODE_CACHE.set(self)
+            try:
+                yield
+            finally:
+                _ACTIVE_NODE_CACHE.reset(token)
+
+    def compose(self, fname: str) -> Optional[yaml.Node]:
+        """Return the node graph of a file, parsing it only when it changed."""
+        assert self._entries is not None
+
+        if os.path.basename(fname) == SECRET_YAML:
+            return _compose(fname, _read(fname))
+
+        try:
+            stat = os.stat(fname)
+        except OSError:
+            return _compose(fname, _read(fname))
+
+        self._used.add(fname)
+        entry = self._entries.get(fname)
 
-    def compose_node(self, parent: yaml.nodes.Node, index: int) -> yaml.nodes.Node:
-        """Annotate a node with the first line it was seen."""
-        last_line: int = self.line
-        node: yaml.nodes.Node = super().compose_node(parent, index)
-        node.__line__ = last_line + 1  # type: ignore
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            return entry[3]
+
+        content = _read(fname)
+        digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+        if entry is not None and entry[2] == digest:
+            node = entry[3]
+        else:
+            _LOGGER.debug("Parsing %s", fname)
+            node = _compose(fname, content)
+
+        self._entries[fname] = (stat.st_mtime_ns, stat.st_size, digest, node)
+        self._dirty = True
         return node
 
+    def save(self) -> None:
+        """Write the cache to disk if it changed."""
+        with self._lock:
+            if self._entries is None:
+                return
+
+            for fname in set(self._entries) - self._used:
+                del self._entries[fname]
+                self._dirty = True
+
+            if not self._dirty:
+                return
+
+            tmp_filename = ""
+            try:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    mode="wb", dir=os.path.dirname(self.path), delete=False
+                ) as fdesc:
+                    tmp_filename = fdesc.name
+                    fdesc.write(NODE_CACHE_HEADER)
+                    pickle.dump(self._entries, fdesc, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_filename, self.path)
+                tmp_filename = ""
+                self._dirty = False
+            except (OSError, pickle.PicklingError, RecursionError) as err:
+                _LOGGER.warning("Unable to save YAML cache %s: %s", self.path, err)
+            finally:
+                if tmp_filename:
+                    try:
+                        os.remove(tmp_filename)
+                    except OSError:
+                        pass
+
+    def _load(self) -> Dict[str, Tuple[int, int, str, Optional[yaml.Node]]]:
+        """Read the cache from disk."""
+        try:
+            with open(self.path, "rb") as fdesc:
+                if fdesc.readline() != NODE_CACHE_HEADER:
+                    _LOGGER.debug("Discarding YAML cache %s: unknown format", self.path)
+                    return {}
+                entries = pickle.load(fdesc)
+        except FileNotFoundError:
+            return {}
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.debug("Discarding YAML cache %s: %s", self.path, err)
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+
+        return entries
+
+
+def _read(fname: str) -> str:
+    """Read the contents of a YAML file."""
+    with open(fname, encoding="utf-8") as conf_file:
+        return conf_file.read()
+
+
+def _compose(fname: str, content: str) -> Optional[yaml.Node]:
+    """Parse YAML into a node graph."""
+    stream = io.StringIO(content)
+    stream.name = fname
+    loader = FastSafeLoader(stream)
+    try:
+        return loader.get_single_node()
+    finally:
+        loader.dispose()
+
+
+def _construct(fname: str, node: yaml.Node) -> JSON_TYPE:
+    """Construct the configuration of a file from its node graph."""
+    loader = FastSafeLoader("")
+    loader.name = fname
+    try:
+        return loader.construct_document(node)
+    finally:
+        loader.dispose()
+
 
 def load_yaml(fname: str) -> JSON_TYPE:
     """Load a YAML file."""
+    cache = _ACTIVE_NODE_CACHE.get()
     try:
-        with open(fname, encoding="utf-8") as conf_file:
-            # If configuration file is empty YAML returns None
-            # We convert that to an empty dict
-            return yaml.load(conf_file, Loader=SafeLineLoader) or OrderedDict()
+        if cache is not None:
+            node = cache.compose(fname)
+        else:
+            node = _compose(fname, _read(fname))
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        if node is None:
+            return OrderedDict()
+        return _construct(fname, node) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc)
@@ -69,27 +274,27 @@ def load_yaml(fname: str) -> JSON_TYPE:
 
 @overload
 def _add_reference(
-    obj: Union[list, NodeListClass], loader: yaml.SafeLoader, node: yaml.nodes.Node
+    obj: Union[list, NodeListClass], loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> NodeListClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: Union[str, NodeStrClass], loader: yaml.SafeLoader, node: yaml.nodes.Node
+    obj: Union[str, NodeStrClass], loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> NodeStrClass:
     ...
 
 
 @overload
 def _add_reference(
-    obj: DICT_T, loader: yaml.SafeLoader, node: yaml.nodes.Node
+    obj: DICT_T, loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> DICT_T:
     ...
 
 
 def _add_reference(  # type: ignore
-    obj, loader: SafeLineLoader, node: yaml.nodes.Node
+    obj, loader: FastSafeLoader, node: yaml.nodes.Node
 ):
     """Add file reference information to an object."""
     if isinstance(obj, list):
@@ -101,7 +306,7 @@ def _add_reference(  # type: ignore
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -131,7 +336,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
 
 
 def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -145,7 +350,7 @@ def _include_dir_named_yaml(
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -160,7 +365,7 @@ def _include_dir_merge_named_yaml(
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -172,7 +377,7 @@ def _include_dir_list_yaml(
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -186,7 +391,7 @@ def _include_dir_merge_list_yaml(
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _ordered_dict(loader: FastSafeLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
     loader.flatten_mapping(node)
     nodes = loader.construct_pairs(node)
@@ -198,14 +403,14 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
         try:
             hash(key)
         except TypeError:
-            fname = getattr(loader.stream, "name", "")
+            fname = loader.name
             raise yaml.MarkedYAMLError(
                 context=f'invalid key: "{key}"',
                 context_mark=yaml.Mark(fname, 0, line, -1, None, None),
             )
 
         if key in seen:
-            fname = getattr(loader.stream, "name", "")
+            fname = loader.name
             _LOGGER.warning(
                 'YAML file %s contains duplicate key "%s". ' "Check lines %d and %d.",
                 fname,
@@ -218,13 +423,13 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: FastSafeLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
@@ -264,7 +469,7 @@ def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     return secrets
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     secret_path = os.path.dirname(loader.name)
     while True:
@@ -310,18 +515,12 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     raise HomeAssistantError(f"Secret {node.value} not defined")
 
 
-yaml.SafeLoader.add_constructor("!include", _include_yaml)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-yaml.SafeLoader.add_constructor("!env_var", _env_var_yaml)
-yaml.SafeLoader.add_constructor("!secret", secret_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-yaml.SafeLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
+add_constructor("!include", _include_yaml)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict)
+add_constructor(yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq)
+add_constructor("!env_var", _env_var_yaml)
+add_constructor("!secret", secret_yaml)
+add_constructor("!include_dir_list", _include_dir_list_yaml)
+add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
+add_constructor("!include_dir_named", _include_dir_named_yaml)
+add_constructor("!include_dir_merge_named", _include_dir_merge_named_yaml)
@@ -7,6 +7,8 @@ from homeassistant.const import HTTP_INTERNAL_SERVER_ERROR
 from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
+from tests.async_mock import patch
+
 # An infinitesimally small time-delta.
 EPSILON_DELTA = 0.0000000001
 
@@ -41,6 +43,8 @@ async def test_fetching_url_and_caching(aioclient_mock, hass, hass_client):
     assert aioclient_mock.call_count == 1
 
 
+# Do not share frames between the requests
+@patch("homeassistant.components.buienradar.camera.BuienradarCam.frame_interval", 0)
 async def test_expire_delta(aioclient_mock, hass, hass_client):
     """Test that the cache expires after delta."""
     aioclient_mock.get(radar_map_url(), text="hello world")
@@ -154,6 +158,8 @@ async def test_failure_response_not_cached(aioclient_mock, hass, hass_client):
     assert aioclient_mock.call_count == 2
 
 
+# Do not share frames between the requests
+@patch("homeassistant.components.buienradar.camera.BuienradarCam.frame_interval", 0)
 async def test_last_modified_updates(aioclient_mock, hass, hass_client):
     """Test that it does respect HTTP not modified."""
     # Build Last-Modified header value
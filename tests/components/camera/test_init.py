@@ -1,6 +1,7 @@
 """The tests for the camera component."""
 import asyncio
 import base64
+from datetime import timedelta
 import io
 
 import pytest
@@ -13,6 +14,7 @@ from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import ATTR_ENTITY_ID, EVENT_HOMEASSISTANT_START
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import PropertyMock, mock_open, patch
 from tests.components.camera import common
@@ -359,3 +361,61 @@ async def test_record_service(hass, mock_camera, mock_stream):
         # So long as we call stream.record, the rest should be covered
         # by those tests.
         assert mock_record_service.called
+
+
+async def test_get_image_shares_frames(hass, image_mock_url):
+    """Test viewers of a camera share one fetch per frame interval."""
+    fetched = asyncio.Event()
+
+    async def camera_image(*args):
+        await fetched.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=camera_image,
+    ) as mock_image:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        fetched.set()
+        images = await asyncio.gather(*tasks)
+        assert len(mock_image.mock_calls) == 1
+        assert all(image.content is images[0].content for image in images)
+
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"Test"
+        assert len(mock_image.mock_calls) == 1
+
+        with patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=dt_util.utcnow() + timedelta(seconds=1),
+        ):
+            await camera.async_get_image(hass, "camera.demo_camera")
+        assert len(mock_image.mock_calls) == 2
+
+
+async def test_get_image_timeout_keeps_shared_fetch(hass, image_mock_url):
+    """Test a viewer timing out does not cancel the fetch of others."""
+    fetched = asyncio.Event()
+
+    async def camera_image(*args):
+        await fetched.wait()
+        return b"Test"
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=camera_image,
+    ) as mock_image:
+        task = hass.async_create_task(
+            camera.async_get_image(hass, "camera.demo_camera")
+        )
+        with pytest.raises(HomeAssistantError):
+            await camera.async_get_image(hass, "camera.demo_camera", timeout=0)
+        fetched.set()
+        image = await task
+
+    assert image.content == b"Test"
+    assert len(mock_image.mock_calls) == 1
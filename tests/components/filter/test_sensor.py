@@ -103,44 +103,41 @@ class TestFilterSensor(unittest.TestCase):
                 ],
             },
         }
-        t_0 = dt_util.utcnow() - timedelta(minutes=1)
-        t_1 = dt_util.utcnow() - timedelta(minutes=2)
-        t_2 = dt_util.utcnow() - timedelta(minutes=3)
-        t_3 = dt_util.utcnow() - timedelta(minutes=4)
+        t_0 = dt_util.utcnow() - timedelta(minutes=4)
+        t_1 = dt_util.utcnow() - timedelta(minutes=3)
+        t_2 = dt_util.utcnow() - timedelta(minutes=2)
+        t_3 = dt_util.utcnow() - timedelta(minutes=1)
 
         if missing:
-            fake_states = {}
+            fake_states = []
         else:
-            fake_states = {
-                "sensor.test_monitored": [
-                    ha.State("sensor.test_monitored", 18.0, last_changed=t_0),
-                    ha.State("sensor.test_monitored", "unknown", last_changed=t_1),
-                    ha.State("sensor.test_monitored", 19.0, last_changed=t_2),
-                    ha.State("sensor.test_monitored", 18.2, last_changed=t_3),
-                ]
-            }
+            fake_states = [
+                ("18.0", t_0),
+                ("unknown", t_1),
+                ("19.0", t_2),
+                ("18.2", t_3),
+            ]
 
         with patch(
-            "homeassistant.components.history.state_changes_during_period",
+            "homeassistant.components.filter.sensor.async_load_recent_states",
             return_value=fake_states,
-        ):
-            with patch(
-                "homeassistant.components.history.get_last_state_changes",
-                return_value=fake_states,
-            ):
-                with assert_setup_component(1, "sensor"):
-                    assert setup_component(self.hass, "sensor", config)
-                    self.hass.block_till_done()
-
-                for value in self.values:
-                    self.hass.states.set(config["sensor"]["entity_id"], value.state)
-                    self.hass.block_till_done()
-
-                state = self.hass.states.get("sensor.test")
-                if missing:
-                    assert "18.05" == state.state
-                else:
-                    assert "17.05" == state.state
+        ) as mock_load:
+            with assert_setup_component(1, "sensor"):
+                assert setup_component(self.hass, "sensor", config)
+                self.hass.block_till_done()
+
+            assert mock_load.call_count == 1
+            assert mock_load.call_args[1]["limit"] == 10
+
+            for value in self.values:
+                self.hass.states.set(config["sensor"]["entity_id"], value.state)
+                self.hass.block_till_done()
+
+            state = self.hass.states.get("sensor.test")
+            if missing:
+                assert "18.05" == state.state
+            else:
+                assert "17.05" == state.state
 
     def test_chain_history_missing(self):
         """Test if filter chaining works when recorder is enabled but the source is not recorded."""
@@ -158,32 +155,24 @@ class TestFilterSensor(unittest.TestCase):
                 "filters": [{"filter": "time_throttle", "window_size": "00:01"}],
             },
         }
-        t_0 = dt_util.utcnow() - timedelta(minutes=1)
-        t_1 = dt_util.utcnow() - timedelta(minutes=2)
-        t_2 = dt_util.utcnow() - timedelta(minutes=3)
-
-        fake_states = {
-            "sensor.test_monitored": [
-                ha.State("sensor.test_monitored", 18.0, last_changed=t_0),
-                ha.State("sensor.test_monitored", 19.0, last_changed=t_1),
-                ha.State("sensor.test_monitored", 18.2, last_changed=t_2),
-            ]
-        }
+        t_0 = dt_util.utcnow() - timedelta(seconds=50)
+        t_1 = dt_util.utcnow() - timedelta(seconds=40)
+        t_2 = dt_util.utcnow() - timedelta(seconds=30)
+
+        fake_states = [("18.0", t_0), ("19.0", t_1), ("18.2", t_2)]
         with patch(
-            "homeassistant.components.history.state_changes_during_period",
+            "homeassistant.components.filter.sensor.async_load_recent_states",
             return_value=fake_states,
-        ):
-            with patch(
-                "homeassistant.components.history.get_last_state_changes",
-                return_value=fake_states,
-            ):
-                with assert_setup_component(1, "sensor"):
-                    assert setup_component(self.hass, "sensor", config)
-                    self.hass.block_till_done()
-
+        ) as mock_load:
+            with assert_setup_component(1, "sensor"):
+                assert setup_component(self.hass, "sensor", config)
                 self.hass.block_till_done()
-                state = self.hass.states.get("sensor.test")
-                assert "18.0" == state.state
+
+            self.hass.block_till_done()
+            assert mock_load.call_count == 1
+            assert mock_load.call_args[1]["include_start_state"]
+            state = self.hass.states.get("sensor.test")
+            assert "18.0" == state.state
 
     def test_outlier(self):
         """Test if outlier filter works."""
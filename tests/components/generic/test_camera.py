@@ -1,9 +1,11 @@
 """The tests for generic camera component."""
 import asyncio
+from datetime import timedelta
 
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.const import HTTP_INTERNAL_SERVER_ERROR, HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import patch
 
@@ -36,7 +38,15 @@ async def test_fetching_url(aioclient_mock, hass, hass_client):
     body = await resp.text()
     assert body == "hello world"
 
+    # The frame is shared with viewers within the frame interval
     resp = await client.get("/api/camera_proxy/camera.config_test")
+    assert aioclient_mock.call_count == 1
+
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow() + timedelta(seconds=1),
+    ):
+        resp = await client.get("/api/camera_proxy/camera.config_test")
     assert aioclient_mock.call_count == 2
 
 
@@ -114,6 +124,9 @@ async def test_limit_refetch(aioclient_mock, hass, hass_client):
         },
     )
     await hass.async_block_till_done()
+    # Do not share frames between the requests
+    camera = hass.data["camera"].get_entity("camera.config_test")
+    camera._frame_interval = 0
 
     client = await hass_client()
 
@@ -2,11 +2,20 @@
 # pylint: disable=protected-access,invalid-name
 from copy import copy
 from datetime import timedelta
+from functools import partial
+import itertools
 import json
 import unittest
 
 from homeassistant.components import history, recorder
-from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder import util as recorder_util
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import (
+    Events,
+    StateCheckpoints,
+    process_timestamp,
+)
+from homeassistant.components.recorder.util import session_scope
 import homeassistant.core as ha
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.setup import async_setup_component, setup_component
@@ -14,6 +23,7 @@ import homeassistant.util.dt as dt_util
 
 from tests.async_mock import patch, sentinel
 from tests.common import (
+    fire_time_changed,
     get_test_home_assistant,
     init_recorder_component,
     mock_state_change_event,
@@ -33,9 +43,9 @@ class TestComponentHistory(unittest.TestCase):
         """Stop everything that was started."""
         self.hass.stop()
 
-    def init_recorder(self):
+    def init_recorder(self, config=None):
         """Initialize the recorder."""
-        init_recorder_component(self.hass)
+        init_recorder_component(self.hass, config)
         self.hass.start()
         wait_recording_done(self.hass)
 
@@ -113,6 +123,91 @@ class TestComponentHistory(unittest.TestCase):
 
         assert history.get_state(self.hass, time_before_recorder_ran, "demo.id") is None
 
+    def test_get_states_from_checkpoint(self):
+        """Test getting states at a point in time after a checkpoint."""
+        self.init_recorder()
+        now = dt_util.utcnow()
+
+        def set_state(entity_id, state, point):
+            """Record a state at a point in time."""
+            with patch(
+                "homeassistant.components.recorder.dt_util.utcnow", return_value=point
+            ):
+                mock_state_change_event(self.hass, ha.State(entity_id, state))
+                wait_recording_done(self.hass)
+
+        set_state("test.one", "on", now)
+        set_state("test.two", "on", now)
+
+        checkpoint = now + recorder.CHECKPOINT_INTERVAL + timedelta(minutes=1)
+        fire_time_changed(self.hass, checkpoint)
+        wait_recording_done(self.hass)
+
+        with session_scope(hass=self.hass) as session:
+            assert {
+                row.entity_id: process_timestamp(row.created)
+                for row in session.query(StateCheckpoints)
+            } == {"test.one": checkpoint, "test.two": checkpoint}
+
+        set_state("test.one", "off", checkpoint + timedelta(minutes=1))
+        point = checkpoint + timedelta(minutes=2)
+
+        states = {
+            state.entity_id: state.state
+            for state in history.get_states(self.hass, point)
+        }
+        assert states == {"test.one": "off", "test.two": "on"}
+
+        states = history.get_states(self.hass, point, ["test.one", "test.two"])
+        assert sorted(state.entity_id for state in states) == ["test.one", "test.two"]
+
+        # The entity_ids restriction is applied to the states since the checkpoint
+        states = history.get_states(self.hass, point, ["test.one", "test.missing"])
+        assert [state.entity_id for state in states] == ["test.one"]
+
+        states = history.get_states(self.hass, point, ["test.two", "test.missing"])
+        assert [state.entity_id for state in states] == ["test.two"]
+
+        before_checkpoint = {
+            state.entity_id: state.state
+            for state in history.get_states(self.hass, now + timedelta(seconds=1))
+        }
+        assert before_checkpoint == {"test.one": "on", "test.two": "on"}
+
+    def test_get_states_from_checkpoint_after_reopen(self):
+        """Test a checkpoint covers entities not changed since a reopen."""
+        self.init_recorder({"batch_writes": True})
+        now = dt_util.utcnow()
+
+        def set_state(entity_id, state, point):
+            """Record a state at a point in time."""
+            with patch(
+                "homeassistant.components.recorder.dt_util.utcnow", return_value=point
+            ):
+                mock_state_change_event(self.hass, ha.State(entity_id, state))
+                wait_recording_done(self.hass)
+
+        set_state("test.one", "on", now)
+        set_state("test.two", "on", now)
+
+        # Take the id of the next event so the batch fails and is dropped
+        instance = self.hass.data[DATA_INSTANCE]
+        with session_scope(hass=self.hass) as session:
+            session.add(Events(event_id=instance._next_event_id, event_type="taken"))
+        set_state("test.one", "off", now + timedelta(minutes=1))
+
+        set_state("test.one", "off", now + timedelta(minutes=2))
+        checkpoint = now + recorder.CHECKPOINT_INTERVAL + timedelta(minutes=1)
+        fire_time_changed(self.hass, checkpoint)
+        wait_recording_done(self.hass)
+
+        point = checkpoint + timedelta(minutes=1)
+        states = {
+            state.entity_id: state.state
+            for state in history.get_states(self.hass, point)
+        }
+        assert states == {"test.one": "off", "test.two": "on"}
+
     def test_state_changes_during_period(self):
         """Test state change during period."""
         self.init_recorder()
@@ -235,6 +330,72 @@ class TestComponentHistory(unittest.TestCase):
         )
         assert states == hist
 
+    def test_stream_significant_states(self):
+        """Test streaming the significant states one entity at a time."""
+        zero, four, _ = self.record_states()
+        # Entities without changes after the start time are kept in order
+        entity_ids = [
+            "media_player.test3",
+            "thermostat.test2",
+            "media_player.test",
+            "thermostat.test",
+        ]
+        cases = itertools.product(
+            (zero, four - timedelta(seconds=1)), (None, entity_ids), (False, True)
+        )
+        for start, ids, minimal_response in cases:
+            hist = history.get_significant_states(
+                self.hass,
+                start,
+                four,
+                ids,
+                filters=history.Filters(),
+                minimal_response=minimal_response,
+            )
+            streamed = list(
+                history._stream_significant_states(
+                    self.hass,
+                    start,
+                    four,
+                    ids,
+                    filters=history.Filters(),
+                    minimal_response=minimal_response,
+                )
+            )
+
+            assert streamed == list(hist.values())
+
+    def test_stream_significant_states_in_pages(self):
+        """Test the states are streamed before all rows are read."""
+        zero, four, _ = self.record_states()
+        fetched = []
+        original_execute = recorder_util.execute
+
+        def execute(query):
+            """Record the number of rows read per page."""
+            rows = original_execute(query)
+            fetched.append(len(rows))
+            return rows
+
+        with patch.object(recorder_util, "execute", side_effect=execute), patch.object(
+            history, "execute_pages", partial(recorder_util.execute_pages, page_size=2),
+        ):
+            streamed = history._stream_significant_states(
+                self.hass, zero, four, filters=history.Filters()
+            )
+            first = next(streamed)
+            pages_before_first = len(fetched)
+            rest = list(streamed)
+
+        # Only the pages up to the end of the first entity were read
+        assert pages_before_first < len(fetched)
+        assert max(fetched) == 2
+        assert [first] + rest == list(
+            history.get_significant_states(
+                self.hass, zero, four, filters=history.Filters()
+            ).values()
+        )
+
     def test_get_significant_states_minimal_response(self):
         """Test that only significant states are returned.
 
@@ -149,6 +149,143 @@ class TestHistoryStatsSensor(unittest.TestCase):
         assert sensor3.state == 2
         assert sensor4.state == 50
 
+    def test_measure_incremental(self):
+        """Test the history is only read again when the period moves back."""
+        t0 = dt_util.utcnow() - timedelta(minutes=40)
+        t1 = t0 + timedelta(minutes=20)
+        t2 = dt_util.utcnow() - timedelta(minutes=10)
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "on", last_changed=t0),
+                ha.State("binary_sensor.test_id", "off", last_changed=t1),
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "Test"
+        )
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ) as mock_changes:
+            sensor.update()
+            assert sensor.state == 1
+            assert round(sensor.value, 2) == 0.33
+
+            # Live state changes are added to the loaded history
+            sensor._pending_changes.append((t1.timestamp(), False))
+            sensor._pending_changes.append((t2.timestamp(), True))
+            sensor.update()
+            assert sensor.state == 2
+            assert round(sensor.value, 2) == 0.5
+            assert mock_changes.call_count == 1
+
+            # A period starting earlier needs older history
+            sensor._start = Template("{{ as_timestamp(now()) - 7200 }}", self.hass)
+            sensor.update()
+            assert mock_changes.call_count == 2
+
+        assert sensor.state == 1
+
+    def test_measure_pending_before_load(self):
+        """Test changes made before the history is loaded are not lost."""
+        t0 = dt_util.utcnow() - timedelta(minutes=40)
+        t1 = dt_util.utcnow() - timedelta(minutes=10)
+
+        # The change at t1 is not committed by the recorder yet
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "off", last_changed=t0),
+            ]
+        }
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "Test"
+        )
+        sensor._pending_changes.append((t1.timestamp(), True))
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ):
+            sensor.update()
+
+        assert sensor.state == 1
+        assert round(sensor.value, 2) == 0.17
+
+    def test_measure_current_state_not_recorded(self):
+        """Test the current state is used when it is not recorded yet."""
+        t0 = dt_util.utcnow() - timedelta(minutes=40)
+        t1 = dt_util.utcnow() - timedelta(minutes=10)
+
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "off", last_changed=t0),
+            ]
+        }
+        with patch("homeassistant.core.dt_util.utcnow", return_value=t1):
+            self.hass.states.set("binary_sensor.test_id", "on")
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "Test"
+        )
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ):
+            sensor.update()
+
+        assert sensor.state == 1
+        assert round(sensor.value, 2) == 0.17
+
+    def test_measure_changes_not_recorded(self):
+        """Test changes older than the current state are merged in order."""
+        t0 = dt_util.utcnow() - timedelta(minutes=40)
+        t1 = dt_util.utcnow() - timedelta(minutes=30)
+        t2 = dt_util.utcnow() - timedelta(minutes=20)
+        t3 = dt_util.utcnow() - timedelta(minutes=10)
+
+        # None of the changes are committed by the recorder yet
+        fake_states = {
+            "binary_sensor.test_id": [
+                ha.State("binary_sensor.test_id", "off", last_changed=t0),
+            ]
+        }
+        for point, state in ((t1, "on"), (t2, "off"), (t3, "on")):
+            with patch("homeassistant.core.dt_util.utcnow", return_value=point):
+                self.hass.states.set("binary_sensor.test_id", state)
+
+        start = Template("{{ as_timestamp(now()) - 3600 }}", self.hass)
+        end = Template("{{ now() }}", self.hass)
+
+        sensor = HistoryStatsSensor(
+            self.hass, "binary_sensor.test_id", "on", start, end, None, "count", "Test"
+        )
+        sensor._pending_changes.extend(
+            [(t1.timestamp(), True), (t2.timestamp(), False), (t3.timestamp(), True)]
+        )
+
+        with patch(
+            "homeassistant.components.history.state_changes_during_period",
+            return_value=fake_states,
+        ):
+            sensor.update()
+
+        assert sensor.state == 2
+        assert round(sensor.value, 2) == 0.33
+
     def test_wrong_date(self):
         """Test when start or end value is not a timestamp or a date."""
         good = Template("{{ now() }}", self.hass)
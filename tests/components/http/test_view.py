@@ -1,4 +1,5 @@
 """Tests for Home Assistant View."""
+from aiohttp import web
 from aiohttp.web_exceptions import (
     HTTPBadRequest,
     HTTPInternalServerError,
@@ -69,3 +70,52 @@ async def test_not_running(mock_request_with_stopping):
         Mock(requires_auth=False), AsyncMock(side_effect=Unauthorized)
     )(mock_request_with_stopping)
     assert response.status == 503
+
+
+async def test_json_stream(hass, aiohttp_client):
+    """Test streaming a JSON list in chunks."""
+
+    def produce(count):
+        """Yield the items of the stream."""
+        for idx in range(count):
+            yield {"idx": idx}
+
+    async def handler(request):
+        """Stream the requested number of items."""
+        return await HomeAssistantView.json_stream(
+            request, produce, int(request.query["count"])
+        )
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.get("/", params={"count": 40})
+    assert resp.status == 200
+    assert await resp.json() == [{"idx": idx} for idx in range(40)]
+
+    resp = await client.get("/", params={"count": 0})
+    assert resp.status == 200
+    assert await resp.json() == []
+
+
+async def test_json_stream_error(hass, aiohttp_client, caplog):
+    """Test an error before anything was streamed returns a server error."""
+
+    def produce():
+        """Fail to produce the first item."""
+        yield float("NaN")
+
+    async def handler(request):
+        """Stream invalid JSON."""
+        return await HomeAssistantView.json_stream(request, produce)
+
+    app = web.Application()
+    app["hass"] = hass
+    app.router.add_get("/", handler)
+    client = await aiohttp_client(app)
+
+    resp = await client.get("/")
+    assert resp.status == 500
+    assert "Error while streaming /" in caplog.text
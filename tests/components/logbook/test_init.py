@@ -13,11 +13,18 @@ import voluptuous as vol
 from homeassistant.components import logbook, recorder, sun
 from homeassistant.components.alexa.smart_home import EVENT_ALEXA_SMART_HOME
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
-from homeassistant.components.recorder.models import process_timestamp_to_utc_isoformat
+from homeassistant.components.recorder import util as recorder_util
+from homeassistant.components.recorder.models import (
+    States,
+    process_timestamp_to_utc_isoformat,
+)
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.script import EVENT_SCRIPT_STARTED
 from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
     ATTR_ENTITY_ID,
     ATTR_NAME,
+    ATTR_UNIT_OF_MEASUREMENT,
     CONF_DOMAINS,
     CONF_ENTITIES,
     EVENT_HOMEASSISTANT_START,
@@ -102,6 +109,37 @@ class TestComponentLogbook(unittest.TestCase):
         assert last_call.data.get(logbook.ATTR_DOMAIN) == "switch"
         assert last_call.data.get(logbook.ATTR_ENTITY_ID) == "switch.test_switch"
 
+    def test_get_events_in_pages(self):
+        """Test the events are read in pages of the given size."""
+        for index in range(5):
+            self.hass.services.call(
+                logbook.DOMAIN,
+                "log",
+                {
+                    logbook.ATTR_NAME: "Alarm",
+                    logbook.ATTR_MESSAGE: str(index),
+                    logbook.ATTR_DOMAIN: "switch",
+                },
+                True,
+            )
+        self.hass.block_till_done()
+        self.hass.data[recorder.DATA_INSTANCE].block_till_done()
+
+        with patch.object(
+            logbook, "execute_pages", partial(recorder_util.execute_pages, page_size=2)
+        ), patch.object(
+            recorder_util, "execute", wraps=recorder_util.execute
+        ) as mock_execute:
+            events = logbook._get_events(
+                self.hass,
+                {},
+                dt_util.utcnow() - timedelta(hours=1),
+                dt_util.utcnow() + timedelta(hours=1),
+            )
+
+        assert [event["message"] for event in events] == ["0", "1", "2", "3", "4"]
+        assert mock_execute.call_count == 3
+
     def test_service_call_create_log_book_entry_no_message(self):
         """Test if service call create log book entry without message."""
         calls = []
@@ -1431,6 +1469,8 @@ class TestComponentLogbook(unittest.TestCase):
                 "entity_id"
                 "domain"
                 "attributes"
+                "has_unit_of_measurement"
+                "device_class"
                 "state_id",
                 "old_state_id",
             ],
@@ -1439,6 +1479,8 @@ class TestComponentLogbook(unittest.TestCase):
         row.event_type = EVENT_STATE_CHANGED
         row.event_data = "{}"
         row.attributes = attributes_json
+        row.has_unit_of_measurement = ATTR_UNIT_OF_MEASUREMENT in attributes
+        row.device_class = attributes.get(ATTR_DEVICE_CLASS)
         row.time_fired = event_time_fired
         row.state = new_state and new_state.get("state")
         row.entity_id = entity_id
@@ -1826,6 +1868,50 @@ async def test_filter_continuous_sensor_values(hass, hass_client):
     assert response_json[1]["entity_id"] == entity_id_third
 
 
+async def test_filter_continuous_sensor_values_before_v10(hass, hass_client):
+    """Test remove continuous sensor events stored before schema v10."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    entity_id_test = "switch.test"
+    hass.states.async_set(entity_id_test, STATE_OFF)
+    hass.states.async_set(entity_id_test, STATE_ON)
+    entity_id_second = "sensor.bla"
+    hass.states.async_set(entity_id_second, STATE_OFF, {"unit_of_measurement": "foo"})
+    hass.states.async_set(entity_id_second, STATE_ON, {"unit_of_measurement": "foo"})
+    entity_id_third = "binary_sensor.door"
+    hass.states.async_set(entity_id_third, STATE_OFF, {"device_class": "door"})
+    hass.states.async_set(entity_id_third, STATE_ON, {"device_class": "door"})
+
+    await hass.async_add_job(partial(trigger_db_commit, hass))
+    await hass.async_block_till_done()
+    await hass.async_add_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    def clear_logbook_columns():
+        """Clear the columns that are not set on states stored before v10."""
+        with session_scope(hass=hass) as session:
+            session.query(States).update(
+                {States.has_unit_of_measurement: None, States.device_class: None}
+            )
+
+    await hass.async_add_executor_job(clear_logbook_columns)
+
+    client = await hass_client()
+
+    # Today time 00:00:00
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day)
+
+    response = await client.get(f"/api/logbook/{start_date.isoformat()}")
+    assert response.status == 200
+    response_json = await response.json()
+
+    assert len(response_json) == 2
+    assert response_json[0]["entity_id"] == entity_id_test
+    assert response_json[1]["entity_id"] == entity_id_third
+
+
 class MockLazyEventPartialState(ha.Event):
     """Minimal mock of a Lazy event."""
 
@@ -331,6 +331,35 @@ async def test_subscribe_topic(hass, mqtt_mock, calls, record_calls):
     assert len(calls) == 1
 
 
+async def test_subscribe_overlapping_filters(hass, mqtt_mock, calls, record_calls):
+    """Test overlapping filters all match and can be removed independently."""
+    unsub_exact = await mqtt.async_subscribe(hass, "test/state", record_calls)
+    await mqtt.async_subscribe(hass, "test/+", record_calls)
+    unsub_subtree = await mqtt.async_subscribe(hass, "test/#", record_calls)
+    await mqtt.async_subscribe(hass, "test/#", record_calls, encoding=None)
+
+    async_fire_mqtt_message(hass, "test/state", "test-payload")
+
+    await hass.async_block_till_done()
+    assert len(calls) == 4
+    assert sorted(call[0].subscribed_topic for call in calls) == [
+        "test/#",
+        "test/#",
+        "test/+",
+        "test/state",
+    ]
+    assert [call[0].payload for call in calls].count(b"test-payload") == 1
+
+    unsub_exact()
+    unsub_subtree()
+    calls.clear()
+
+    async_fire_mqtt_message(hass, "test/state", "test-payload")
+
+    await hass.async_block_till_done()
+    assert sorted(call[0].subscribed_topic for call in calls) == ["test/#", "test/+"]
+
+
 async def test_subscribe_deprecated(hass, mqtt_mock):
     """Test the subscription of a topic using deprecated callback signature."""
     calls = []
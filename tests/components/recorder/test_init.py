@@ -357,6 +357,112 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_batch_writes_sets_old_state(hass_recorder):
+    """Test batched writes assign ids and link the old state."""
+    hass = hass_recorder({"batch_writes": True})
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {})
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+    hass.states.set("test.two", "off", {})
+    hass.states.remove("test.one")
+    wait_recording_done(hass)
+
+    instance = hass.data[DATA_INSTANCE]
+    assert instance.last_commit_rows == 4
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).order_by(States.state_id))
+        assert len(states) == 5
+        assert [state.entity_id for state in states] == [
+            "test.one",
+            "test.two",
+            "test.one",
+            "test.two",
+            "test.one",
+        ]
+        assert states[0].old_state_id is None
+        assert states[1].old_state_id is None
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[1].state_id
+        assert states[4].old_state_id == states[2].state_id
+        assert states[4].state == ""
+
+        for state in states:
+            event = session.query(Events).get(state.event_id)
+            assert event.event_type == "state_changed"
+
+    hass.states.set("test.one", "on", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).order_by(States.state_id.desc()))
+        assert states[0].entity_id == "test.one"
+        assert states[0].old_state_id == states[1].state_id
+
+
+def test_batch_writes_drop_failed_rows(hass_recorder):
+    """Test rows that cannot be inserted do not block later commits."""
+    hass = hass_recorder({"batch_writes": True})
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "on", {})
+    wait_recording_done(hass)
+
+    instance = hass.data[DATA_INSTANCE]
+    # Take the id the next batched event will use
+    with session_scope(hass=hass) as session:
+        session.add(Events(event_id=instance._next_event_id, event_type="taken"))
+
+    hass.states.set("test.one", "off", {})
+    wait_recording_done(hass)
+    assert instance._pending_events == []
+    assert instance._pending_states == []
+
+    hass.states.set("test.one", "on", {})
+    hass.states.set("test.two", "off", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).order_by(States.state_id))
+        assert [(state.entity_id, state.state) for state in states] == [
+            ("test.one", "on"),
+            ("test.two", "on"),
+            ("test.one", "on"),
+            ("test.two", "off"),
+        ]
+        # The new states link to the committed rows, not the dropped one
+        assert states[2].old_state_id == states[0].state_id
+        assert states[3].old_state_id == states[1].state_id
+
+
+def test_batch_writes_sync_postgresql_sequences(hass_recorder):
+    """Test the id sequences are advanced past the ids of batched writes."""
+    hass = hass_recorder({"batch_writes": True})
+    instance = hass.data[DATA_INSTANCE]
+    instance._next_event_id = 11
+    instance._next_state_id = 6
+    instance._pending_events = [{}]
+    instance._pending_states = [{}]
+
+    with patch.object(instance, "engine") as mock_engine, patch.object(
+        instance, "event_session"
+    ) as mock_session:
+        instance._sync_id_sequences()
+        assert mock_session.execute.call_count == 0
+
+        mock_engine.dialect.name = "postgresql"
+        instance._sync_id_sequences()
+
+    assert [call[0][1] for call in mock_session.execute.call_args_list] == [
+        {"table": "events", "column": "event_id", "last_id": 10},
+        {"table": "states", "column": "state_id", "last_id": 5},
+    ]
+    instance._pending_events = []
+    instance._pending_states = []
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -20,6 +20,8 @@ import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt
 
+from tests.async_mock import patch
+
 ENGINE = None
 SESSION = None
 
@@ -73,6 +75,74 @@ class TestStates(unittest.TestCase):
         state.context = ha.Context(id=None)
         assert state == States.from_event(event).to_native()
 
+    def test_from_event_reuses_attributes_json(self):
+        """Test shared attributes are not encoded again."""
+        attributes_cache = {}
+        state = ha.State("sensor.temperature", "18", {"unit": "C"})
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        )
+        db_state = States.from_event(event, attributes_cache)
+        assert db_state.attributes == '{"unit": "C"}'
+
+        state2 = ha.State("sensor.temperature", "19", state.attributes)
+        event2 = ha.Event(
+            EVENT_STATE_CHANGED,
+            {
+                "entity_id": "sensor.temperature",
+                "old_state": state,
+                "new_state": state2,
+            },
+        )
+        with patch("homeassistant.components.recorder.models.json.dumps") as dumps:
+            db_state2 = States.from_event(event2, attributes_cache)
+        assert len(dumps.mock_calls) == 0
+        assert db_state2.attributes is db_state.attributes
+
+        event3 = ha.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.temperature", "old_state": state2, "new_state": None},
+        )
+        States.from_event(event3, attributes_cache)
+        assert attributes_cache == {}
+
+    def test_from_event_logbook_attributes(self):
+        """Test the attributes the logbook filters on are stored in columns."""
+        state = ha.State(
+            "sensor.temperature",
+            "18",
+            {"unit_of_measurement": "°C", "device_class": "temperature"},
+        )
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        )
+        db_state = States.from_event(event)
+
+        assert db_state.has_unit_of_measurement is True
+        assert db_state.device_class == "temperature"
+
+        state = ha.State("binary_sensor.door", "on")
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "binary_sensor.door", "old_state": None, "new_state": state},
+        )
+        db_state = States.from_event(event)
+
+        assert db_state.has_unit_of_measurement is False
+        assert db_state.device_class is None
+
+        state = ha.State("sensor.custom", "1", {"device_class": "x" * 65})
+        event = ha.Event(
+            EVENT_STATE_CHANGED,
+            {"entity_id": "sensor.custom", "old_state": None, "new_state": state},
+        )
+        db_state = States.from_event(event)
+
+        assert db_state.device_class is None
+        assert db_state.to_native().attributes == {"device_class": "x" * 65}
+
     def test_from_event_to_delete_state(self):
         """Test converting deleting state event to db state."""
         event = ha.Event(
@@ -164,6 +164,34 @@ class TestRecorderPurge(unittest.TestCase):
             assert finished
             assert events.count() == 2
 
+    def test_purge_in_row_batches(self):
+        """Test purging is split in batches of a bounded number of rows."""
+        self._add_test_events()
+        self._add_test_states()
+        instance = self.hass.data[DATA_INSTANCE]
+
+        with session_scope(hass=self.hass) as session, patch(
+            "homeassistant.components.recorder.purge.MAX_ROWS_TO_PURGE", 1
+        ):
+            states = session.query(States)
+            events = session.query(Events).filter(Events.event_type.like("EVENT_TEST%"))
+
+            # One state per batch, the events wait for the states
+            assert not purge_old_data(instance, 4, repack=False)
+            assert states.count() == 5
+            assert events.count() == 6
+            assert instance.purge_progress.states == 1
+            assert instance.purge_progress.batches == 1
+
+            batches = 1
+            while not purge_old_data(instance, 4, repack=False):
+                batches += 1
+
+            assert states.count() == 2
+            assert events.count() == 2
+            assert instance.purge_progress is None
+            assert batches > 4
+
     def test_purge_method(self):
         """Test purge method."""
         service_data = {"keep_days": 4}
@@ -224,6 +252,6 @@ class TestRecorderPurge(unittest.TestCase):
                 self.hass.block_till_done()
                 self.hass.data[DATA_INSTANCE].block_till_done()
                 assert (
-                    mock_logger.debug.mock_calls[5][1][0]
+                    mock_logger.debug.mock_calls[6][1][0]
                     == "Vacuuming SQL DB to free space"
                 )
@@ -3,6 +3,9 @@ import pytest
 
 from homeassistant.components.recorder import util
 from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import States
+
+from .common import wait_recording_done
 
 from tests.async_mock import MagicMock, patch
 from tests.common import get_test_home_assistant, init_recorder_component
@@ -60,3 +63,37 @@ def test_recorder_bad_execute(hass_recorder):
         util.execute((mck1,), to_native=True)
 
     assert e_mock.call_count == 2
+
+
+def test_execute_pages(hass_recorder):
+    """Test the pages of a query are read when they are needed."""
+    hass = hass_recorder()
+    for state in ("1", "2", "3", "4", "5"):
+        hass.states.set("sensor.one", state)
+        hass.states.set("sensor.two", state)
+    wait_recording_done(hass)
+
+    def build_query(session):
+        """Return the query of all states."""
+        return session.query(States.entity_id, States.state, States.state_id)
+
+    with patch.object(util, "execute", wraps=util.execute) as mock_execute:
+        rows = util.execute_pages(
+            hass, build_query, (States.entity_id, States.state_id), page_size=4
+        )
+        assert next(rows).state == "1"
+        assert mock_execute.call_count == 1
+        rows = [next(rows)] + list(rows)
+        assert mock_execute.call_count == 3
+
+    assert [(row.entity_id, row.state) for row in rows] == [
+        ("sensor.one", "2"),
+        ("sensor.one", "3"),
+        ("sensor.one", "4"),
+        ("sensor.one", "5"),
+        ("sensor.two", "1"),
+        ("sensor.two", "2"),
+        ("sensor.two", "3"),
+        ("sensor.two", "4"),
+        ("sensor.two", "5"),
+    ]
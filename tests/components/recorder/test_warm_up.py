@@ -0,0 +1,122 @@
+"""The tests for the recorder warm up loader."""
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import union_all
+from sqlalchemy.dialects import sqlite
+
+from homeassistant.components.recorder import warm_up
+from homeassistant.util import dt as dt_util
+
+from .common import wait_recording_done
+
+from tests.async_mock import patch
+from tests.common import get_test_home_assistant, init_recorder_component
+
+
+@pytest.fixture
+def hass_recorder():
+    """Home Assistant fixture with in-memory recorder."""
+    hass = get_test_home_assistant()
+    init_recorder_component(hass)
+    hass.start()
+    hass.block_till_done()
+    yield hass
+    hass.stop()
+
+
+def _record_states(hass):
+    """Record states of two sensors, one minute apart."""
+    start = dt_util.utcnow() - timedelta(minutes=10)
+    points = [start + timedelta(minutes=minute) for minute in range(5)]
+    states = [
+        ("sensor.one", "1", {}),
+        ("sensor.one", "1", {"changed": True}),
+        ("sensor.two", "10", {}),
+        ("sensor.one", "2", {}),
+        ("sensor.one", "3", {}),
+    ]
+
+    for point, (entity_id, state, attributes) in zip(points, states):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=point
+        ):
+            hass.states.set(entity_id, state, attributes)
+            wait_recording_done(hass)
+
+    return points
+
+
+def test_load_recent_states(hass_recorder):
+    """Test the windows of several requests are loaded in one query."""
+    hass = hass_recorder
+    points = _record_states(hass)
+
+    async def load_all():
+        return await asyncio.gather(
+            warm_up.async_load_recent_states(hass, "sensor.one", limit=2),
+            warm_up.async_load_recent_states(
+                hass, "sensor.one", limit=3, changes_only=True
+            ),
+            warm_up.async_load_recent_states(
+                hass,
+                "sensor.one",
+                start_time=points[2],
+                changes_only=True,
+                include_start_state=True,
+            ),
+            warm_up.async_load_recent_states(hass, "sensor.two", start_time=points[3]),
+            warm_up.async_load_recent_states(hass, "sensor.one", limit=2),
+        )
+
+    with patch.object(
+        warm_up, "load_recent_states", wraps=warm_up.load_recent_states
+    ) as mock_load:
+        results = asyncio.run_coroutine_threadsafe(load_all(), hass.loop).result()
+
+    assert mock_load.call_count == 1
+    # Identical requests are only queried once
+    assert len(mock_load.call_args[0][1]) == 4
+
+    assert results[0] == [("2", points[3]), ("3", points[4])]
+    assert results[1] == [("1", points[0]), ("2", points[3]), ("3", points[4])]
+    assert results[2] == [("1", points[2]), ("2", points[3]), ("3", points[4])]
+    assert results[3] == []
+    assert results[4] == results[0]
+
+
+def test_load_recent_states_error(hass_recorder):
+    """Test a failing query is raised to all requests of the batch."""
+    hass = hass_recorder
+
+    with patch.object(
+        warm_up, "load_recent_states", side_effect=ValueError("Boom")
+    ), pytest.raises(ValueError):
+        asyncio.run_coroutine_threadsafe(
+            warm_up.async_load_recent_states(hass, "sensor.one", limit=2), hass.loop
+        ).result()
+
+
+def test_load_recent_states_chunks(hass_recorder):
+    """Test many requests are split in queries within the SQLite limits."""
+    hass = hass_recorder
+    points = _record_states(hass)
+    requests = [
+        warm_up.WarmUpRequest(
+            "sensor.one", points[2] - timedelta(seconds=index), 5, True, True
+        )
+        for index in range(250)
+    ]
+
+    chunks = list(warm_up._chunk_queries(requests, sqlite.dialect()))
+    assert len(chunks) > 2
+    for queries in chunks:
+        params = union_all(*queries).compile(dialect=sqlite.dialect()).params
+        assert len(params) <= warm_up.MAX_BIND_PARAMETERS
+    assert sum(len(queries) for queries in chunks) == 2 * len(requests)
+
+    results = warm_up.load_recent_states(hass, requests)
+    assert len(results) == 250
+    assert results[0] == [("1", points[2]), ("2", points[3]), ("3", points[4])]
+    assert results[-1][1:] == results[0][1:]
@@ -1,10 +1,12 @@
 """The tests for hls streams."""
 from datetime import timedelta
+from io import BytesIO
 from urllib.parse import urlparse
 
 import pytest
 
 from homeassistant.components.stream import request_stream
+from homeassistant.components.stream.core import Segment
 from homeassistant.const import HTTP_NOT_FOUND
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -114,3 +116,29 @@ async def test_stream_ended(hass):
 
     # Stop stream, if it hasn't quit already
     stream.stop()
+
+
+async def test_segment_ring(hass):
+    """Test the segments kept by an output are limited by count and size."""
+    await async_setup_component(
+        hass, "stream", {"stream": {"max_segments": 3, "max_segment_bytes": 10}}
+    )
+
+    stream = preload_stream(hass, "rtsp://my.video")
+    track = stream.add_provider("hls")
+
+    for sequence in range(1, 5):
+        track.put(Segment(sequence, BytesIO(b"abcd"), 2))
+
+    assert track.segments == [3, 4]
+    assert track.buffer_size == 8
+    assert stream.buffer_size == 8
+
+    segment = track.get_segment(4)
+    assert isinstance(segment.data, memoryview)
+    assert segment.data == b"abcd"
+
+    track.put(Segment(5, BytesIO(b"a" * 20), 2))
+    assert track.segments == [5]
+
+    stream.stop()
@@ -13,6 +13,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 
+from tests.async_mock import patch
 from tests.common import async_mock_service
 
 
@@ -515,3 +516,62 @@ async def test_manifest_get(hass, websocket_client):
     assert msg["type"] == const.TYPE_RESULT
     assert not msg["success"]
     assert msg["error"]["code"] == "not_found"
+
+
+async def test_setup_timeline(hass, websocket_client, hass_admin_user):
+    """Test getting the setup timeline."""
+    await async_setup_component(hass, "persistent_notification", {})
+
+    await websocket_client.send_json({"id": 5, "type": "setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert {
+        item["phase"]
+        for item in msg["result"]
+        if item["domain"] == "persistent_notification"
+    } == {"manifest", "import", "setup"}
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "setup_timeline", "format": "chrome_trace"}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["traceEvents"]
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 7, "type": "setup_timeline"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_poll_stats(hass, websocket_client, hass_admin_user):
+    """Test getting the poll statistics."""
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_get_poll_scheduler"
+    ) as mock_scheduler:
+        mock_scheduler.return_value.async_stats.return_value = {
+            "sensor.demo": {"polls": 1}
+        }
+        await websocket_client.send_json({"id": 5, "type": "poll_stats"})
+
+        msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {"sensor.demo": {"polls": 1}}
+
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 6, "type": "poll_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
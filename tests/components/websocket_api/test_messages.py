@@ -0,0 +1,31 @@
+"""Test Websocket API messages module."""
+import json
+
+from homeassistant.components.websocket_api.messages import cached_event_message
+from homeassistant.core import Event, State
+
+
+def test_cached_event_message():
+    """Test the event message is serialized once and the id is spliced in."""
+    state = State("light.window", "on", {"color": "red"})
+    event = Event("state_changed", {"entity_id": "light.window", "new_state": state})
+
+    first = cached_event_message(1, event)
+    second = cached_event_message(20, event)
+
+    assert json.loads(first)["id"] == 1
+    assert json.loads(second)["id"] == 20
+    assert json.loads(first)["event"] == json.loads(second)["event"]
+    assert json.loads(second)["event"]["data"]["new_state"]["state"] == "on"
+
+    other = Event("state_changed", {"entity_id": "light.window"})
+    assert "new_state" not in json.loads(cached_event_message(1, other))["event"]
+
+
+def test_cached_event_message_unserializable():
+    """Test an unserializable event message is returned as a dict."""
+    event = Event("test_event", {"bad": object()})
+
+    message = cached_event_message(1, event)
+
+    assert message == {"id": 1, "type": "event", "event": event}
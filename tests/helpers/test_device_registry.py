@@ -824,3 +824,42 @@ async def test_restore_simple_device(hass, registry, update_events):
     assert update_events[2]["device_id"] == entry2.id
     assert update_events[3]["action"] == "create"
     assert update_events[3]["device_id"] == entry3.id
+
+
+async def test_indexes_follow_updates(registry):
+    """Test the lookup indexes stay consistent through update and remove."""
+    entry = registry.async_get_or_create(
+        config_entry_id="1234",
+        connections={(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+        identifiers={("bridgeid", "0123")},
+    )
+    registry.async_update_device(
+        entry.id, area_id="kitchen", new_identifiers={("bridgeid", "4567")}
+    )
+
+    assert registry.async_get_device({("bridgeid", "0123")}, set()) is None
+    assert registry.async_get_device({("bridgeid", "4567")}, set()).id == entry.id
+    assert [
+        device.id
+        for device in device_registry.async_entries_for_area(registry, "kitchen")
+    ] == [entry.id]
+
+    registry.async_clear_area_id("kitchen")
+
+    assert device_registry.async_entries_for_area(registry, "kitchen") == []
+
+    registry.async_remove_device(entry.id)
+
+    assert device_registry.async_entries_for_config_entry(registry, "1234") == []
+    assert (
+        registry.async_get_device(
+            set(), {(device_registry.CONNECTION_NETWORK_MAC, "12:34:56:ab:cd:ef")},
+        )
+        is None
+    )
+    assert (
+        registry.async_get_or_create(
+            config_entry_id="1234", identifiers={("bridgeid", "4567")}
+        ).id
+        == entry.id
+    )
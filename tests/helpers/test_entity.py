@@ -6,9 +6,11 @@ import threading
 
 import pytest
 
+from homeassistant.config import DATA_CUSTOMIZE
 from homeassistant.const import ATTR_DEVICE_CLASS, STATE_UNAVAILABLE
 from homeassistant.core import Context
 from homeassistant.helpers import entity, entity_registry
+from homeassistant.helpers.entity_values import EntityValues
 
 from tests.async_mock import MagicMock, PropertyMock, patch
 from tests.common import get_test_home_assistant, mock_registry
@@ -690,3 +692,50 @@ async def test_warn_slow_write_state_custom_component(hass, caplog):
         "(<class 'custom_components.bla.sensor.test_warn_slow_write_state_custom_component.<locals>.CustomComponentEntity'>) "
         "took 10.000 seconds. Please report it to the custom component author."
     ) in caplog.text
+
+
+async def test_cache_static_attributes(hass):
+    """Test static attributes are only read again when invalidated."""
+
+    class CachedEntity(entity.Entity):
+        """Entity that caches its static attributes."""
+
+        cache_static_attributes = True
+        entity_id = "hello.world"
+        icon = "mdi:one"
+        reads = 0
+
+        @property
+        def state(self):
+            """Return the state."""
+            return self.reads
+
+        @property
+        def supported_features(self):
+            """Count the reads of a static attribute."""
+            self.reads += 1
+            return 1
+
+    ent = CachedEntity()
+    ent.hass = hass
+
+    ent.async_write_ha_state()
+    ent.async_write_ha_state()
+
+    state = hass.states.get("hello.world")
+    assert ent.reads == 1
+    assert state.attributes["icon"] == "mdi:one"
+
+    ent.icon = "mdi:two"
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["icon"] == "mdi:one"
+
+    ent.async_invalidate_static_attributes()
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["icon"] == "mdi:two"
+    assert ent.reads == 2
+
+    hass.data[DATA_CUSTOMIZE] = EntityValues({"hello.world": {"icon": "mdi:three"}})
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world").attributes["icon"] == "mdi:three"
+    assert ent.reads == 3
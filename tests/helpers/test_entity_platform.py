@@ -8,7 +8,7 @@ import pytest
 from homeassistant.const import UNIT_PERCENTAGE
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
-from homeassistant.helpers import entity_platform, entity_registry
+from homeassistant.helpers import entity_platform, entity_registry, poll_scheduler
 from homeassistant.helpers.entity import async_generate_entity_id
 from homeassistant.helpers.entity_component import (
     DEFAULT_SCAN_INTERVAL,
@@ -53,6 +53,28 @@ async def test_polling_only_updates_entities_it_should_poll(hass):
     assert poll_ent.async_update.called
 
 
+async def test_polling_starts_when_entity_should_poll(hass):
+    """Test an entity is polled once it switches to polling."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+
+    ent = MockEntity(should_poll=False)
+    ent.async_update = Mock()
+
+    await component.async_add_entities([ent])
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    await hass.async_block_till_done()
+
+    assert not ent.async_update.called
+
+    ent._values["should_poll"] = True
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    await hass.async_block_till_done()
+
+    assert ent.async_update.called
+
+
 async def test_polling_updates_entities_with_exception(hass):
     """Test the updated entities that not break with an exception."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
@@ -90,6 +112,92 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_spreads_entities_over_interval(hass):
+    """Test entities of a platform are polled in their own slot."""
+    scan_interval = timedelta(seconds=30)
+    component = EntityComponent(_LOGGER, DOMAIN, hass, scan_interval)
+
+    early = MockEntity(should_poll=True, entity_id="test_domain.early")
+    early.async_update = Mock(return_value=None)
+    late = MockEntity(should_poll=True, entity_id="test_domain.late")
+    late.async_update = Mock(return_value=None)
+
+    early_offset = poll_scheduler.poll_offset(early.entity_id, scan_interval)
+    late_offset = poll_scheduler.poll_offset(late.entity_id, scan_interval)
+    if early_offset < late_offset:
+        early, late = late, early
+        early_offset, late_offset = late_offset, early_offset
+
+    now = dt_util.utcnow()
+    with patch("homeassistant.util.dt.utcnow", return_value=now):
+        await component.async_add_entities([early, late])
+
+    early.async_update.reset_mock()
+    late.async_update.reset_mock()
+
+    async_fire_time_changed(hass, now + scan_interval - early_offset)
+    await hass.async_block_till_done()
+
+    assert early.async_update.called
+    assert not late.async_update.called
+
+    async_fire_time_changed(hass, now + scan_interval - late_offset)
+    await hass.async_block_till_done()
+
+    assert len(early.async_update.mock_calls) == 1
+    assert len(late.async_update.mock_calls) == 1
+
+    platform = component._platforms[DOMAIN]
+    assert platform.poll_stats.polls == 2
+    assert poll_scheduler.async_get_poll_scheduler(hass).async_stats() == {
+        f"{DOMAIN}.{DOMAIN}": platform.poll_stats.as_dict()
+    }
+
+
+async def test_polling_skips_when_update_overruns(hass, caplog):
+    """Test an entity is not polled again while its last poll is running."""
+    scan_interval = timedelta(seconds=10)
+    component = EntityComponent(_LOGGER, DOMAIN, hass, scan_interval)
+    release = asyncio.Event()
+    updates = []
+
+    async def slow_update():
+        """Mock an update that does not finish in time."""
+        updates.append(None)
+        await release.wait()
+
+    ent = MockEntity(should_poll=True)
+    ent.async_update = slow_update
+    ent2 = MockEntity(should_poll=True)
+    ent2.async_update = slow_update
+
+    await component.async_add_entities([ent, ent2], False)
+
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + scan_interval)
+    await asyncio.sleep(0)
+    async_fire_time_changed(hass, now + 2 * scan_interval)
+    await asyncio.sleep(0)
+
+    assert len(updates) == 2
+    platform = component._platforms[DOMAIN]
+    assert platform.poll_stats.skipped == 2
+    # The warning is logged once for the platform
+    assert caplog.text.count("took longer than the scheduled update interval") == 1
+
+    release.set()
+    await hass.async_block_till_done()
+
+    assert platform.poll_stats.polls == 2
+
+    await platform.async_remove_entity(ent.entity_id)
+    await platform.async_remove_entity(ent2.entity_id)
+    async_fire_time_changed(hass, now + 4 * scan_interval)
+    await hass.async_block_till_done()
+
+    assert len(updates) == 2
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -135,7 +243,7 @@ async def test_update_state_adds_entities_with_update_before_add_false(hass):
     assert not ent.update.called
 
 
-@patch("homeassistant.helpers.entity_platform.async_track_time_interval")
+@patch("homeassistant.helpers.entity_platform.async_get_poll_scheduler")
 async def test_set_scan_interval_via_platform(mock_track, hass):
     """Test the setting of the scan interval via platform."""
 
@@ -153,8 +261,9 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
     component.setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
-    assert mock_track.called
-    assert timedelta(seconds=30) == mock_track.call_args[0][2]
+    add_poll = mock_track.return_value.async_add
+    assert add_poll.called
+    assert timedelta(seconds=30) == add_poll.call_args[0][0].scan_interval
 
 
 async def test_adding_entities_with_generator_and_thread_callback(hass):
@@ -648,3 +648,38 @@ async def test_async_get_device_class_lookup(hass):
             ("sensor", "battery"): "sensor.vacuum_battery",
         },
     }
+
+
+async def test_indexes_follow_updates(registry):
+    """Test the lookup indexes stay consistent through update and remove."""
+    config_entry = MockConfigEntry(entry_id="entry-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=config_entry, device_id="device-1"
+    )
+
+    assert registry.async_get_entity_id("light", "hue", "1234") == entry.entity_id
+    assert [
+        e.entity_id
+        for e in entity_registry.async_entries_for_device(registry, "device-1")
+    ] == [entry.entity_id]
+
+    registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=config_entry, device_id="device-2"
+    )
+    updated = registry.async_update_entity(
+        entry.entity_id, new_entity_id="light.renamed", new_unique_id="5678"
+    )
+
+    assert registry.async_get_entity_id("light", "hue", "1234") is None
+    assert registry.async_get_entity_id("light", "hue", "5678") == "light.renamed"
+    assert entity_registry.async_entries_for_device(registry, "device-1") == []
+    assert entity_registry.async_entries_for_device(registry, "device-2") == [updated]
+    assert entity_registry.async_entries_for_config_entry(registry, "entry-1") == [
+        updated
+    ]
+
+    registry.async_remove("light.renamed")
+
+    assert registry.async_get_entity_id("light", "hue", "5678") is None
+    assert entity_registry.async_entries_for_device(registry, "device-2") == []
+    assert entity_registry.async_entries_for_config_entry(registry, "entry-1") == []
@@ -6,7 +6,7 @@ from astral import Astral
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_TIME_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.helpers.event import (
@@ -19,6 +19,7 @@ from homeassistant.helpers.event import (
     async_track_sunrise,
     async_track_sunset,
     async_track_template,
+    async_track_template_result,
     async_track_time_change,
     async_track_time_interval,
     async_track_utc_time_change,
@@ -319,6 +320,86 @@ async def test_track_template(hass):
     assert len(wildercard_runs) == 2
 
 
+async def test_track_template_result(hass):
+    """Test tracking only the entities a template accessed."""
+    runs = []
+
+    template = Template(
+        "{{ states.sensor | selectattr('state', 'eq', 'on') | list | count }}", hass
+    )
+
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("switch.one", "on")
+
+    @ha.callback
+    def result_callback(event, updated_template, last_result, result):
+        runs.append((event.data["entity_id"], last_result, result))
+
+    info = async_track_template_result(hass, template, result_callback)
+    assert info.last_result == "1"
+
+    # Not a sensor, no render
+    hass.states.async_set("switch.one", "off")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("sensor.one", "off")
+    await hass.async_block_till_done()
+    assert runs == [("sensor.one", "1", "0")]
+
+    # A new sensor changes what the template iterates
+    hass.states.async_set("sensor.two", "on")
+    await hass.async_block_till_done()
+    assert runs[-1] == ("sensor.two", "0", "1")
+
+    hass.states.async_set("sensor.two", "off")
+    await hass.async_block_till_done()
+    assert runs[-1] == ("sensor.two", "1", "0")
+    assert len(runs) == 3
+
+    info.async_remove()
+    hass.states.async_set("sensor.two", "on")
+    await hass.async_block_till_done()
+    assert len(runs) == 3
+
+
+async def test_track_template_result_follows_accessed_entities(hass):
+    """Test the tracked entities follow the branches taken by the template."""
+    runs = []
+
+    template = Template(
+        "{{ states('sensor.a') if is_state('switch.test', 'on') "
+        "else states('sensor.b') }}",
+        hass,
+    )
+
+    hass.states.async_set("switch.test", "on")
+    hass.states.async_set("sensor.a", "a")
+    hass.states.async_set("sensor.b", "b")
+
+    @ha.callback
+    def result_callback(event, updated_template, last_result, result):
+        runs.append(result)
+
+    async_track_template_result(hass, template, result_callback)
+
+    hass.states.async_set("sensor.b", "b2")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("switch.test", "off")
+    await hass.async_block_till_done()
+    assert runs == ["b2"]
+
+    hass.states.async_set("sensor.a", "a2")
+    await hass.async_block_till_done()
+    assert runs == ["b2"]
+
+    hass.states.async_set("sensor.b", "b3")
+    await hass.async_block_till_done()
+    assert runs == ["b2", "b3"]
+
+
 async def test_track_same_state_simple_trigger(hass):
     """Test track_same_change with trigger simple."""
     thread_runs = []
@@ -799,6 +880,74 @@ async def test_periodic_task_clock_rollback(hass):
     assert len(specific_runs) == 4
 
 
+async def test_periodic_tasks_share_time_listener(hass):
+    """Test time patterns are fired from a single time changed listener."""
+    hourly_runs = []
+    daily_runs = []
+    listeners = hass.bus.async_listeners().get(EVENT_TIME_CHANGED, 0)
+
+    unsub_hourly = async_track_utc_time_change(
+        hass, lambda x: hourly_runs.append(x), minute=0, second=0
+    )
+    unsub_daily = async_track_utc_time_change(
+        hass, lambda x: daily_runs.append(x), hour=3, minute=0, second=0
+    )
+    assert hass.bus.async_listeners()[EVENT_TIME_CHANGED] == listeners + 1
+
+    async_fire_time_changed(hass, datetime(2014, 5, 24, 2, 0, 0))
+    await hass.async_block_till_done()
+    assert len(hourly_runs) == 1
+    assert len(daily_runs) == 0
+
+    async_fire_time_changed(hass, datetime(2014, 5, 24, 3, 0, 0))
+    await hass.async_block_till_done()
+    assert len(hourly_runs) == 2
+    assert len(daily_runs) == 1
+
+    unsub_hourly()
+
+    async_fire_time_changed(hass, datetime(2014, 5, 25, 3, 0, 0))
+    await hass.async_block_till_done()
+    assert len(hourly_runs) == 2
+    assert len(daily_runs) == 2
+
+    unsub_daily()
+    assert hass.bus.async_listeners().get(EVENT_TIME_CHANGED, 0) == listeners
+
+
+async def test_periodic_task_unsubscribe_from_action(hass):
+    """Test time patterns removed by an action that is being fired."""
+    kept_runs = []
+
+    @callback
+    def remove_others(now):
+        """Remove the other patterns."""
+        for unsub in unsubs:
+            unsub()
+
+    @callback
+    def keep(now):
+        """Record a run."""
+        kept_runs.append(now)
+
+    unsub_remover = async_track_utc_time_change(hass, remove_others, second="*")
+    unsub_kept = async_track_utc_time_change(hass, keep, second="*")
+    unsubs = [
+        async_track_utc_time_change(hass, lambda x: None, second="*") for _ in range(4)
+    ]
+
+    async_fire_time_changed(hass, datetime(2014, 5, 24, 12, 0, 0))
+    await hass.async_block_till_done()
+    assert len(kept_runs) == 1
+
+    async_fire_time_changed(hass, datetime(2014, 5, 24, 12, 0, 1))
+    await hass.async_block_till_done()
+    assert len(kept_runs) == 2
+
+    unsub_remover()
+    unsub_kept()
+
+
 async def test_periodic_task_duplicate_time(hass):
     """Test periodic tasks not triggering on duplicate time."""
     specific_runs = []
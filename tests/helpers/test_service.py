@@ -573,6 +573,35 @@ async def test_call_with_omit_entity_id(hass, mock_handle_entity_call, mock_enti
     assert len(mock_handle_entity_call.mock_calls) == 0
 
 
+async def test_call_context_user_removed(
+    hass, hass_read_only_user, mock_handle_entity_call, mock_entities
+):
+    """Check a cached user is forgotten once it is removed."""
+    hass_read_only_user.groups = []
+    hass_read_only_user.invalidate_permission_cache()
+    call = ha.ServiceCall(
+        "test_domain",
+        "test_service",
+        {"entity_id": "light.kitchen"},
+        context=ha.Context(user_id=hass_read_only_user.id),
+    )
+
+    with pytest.raises(exceptions.Unauthorized):
+        await service.entity_service_call(
+            hass, [Mock(entities=mock_entities)], Mock(), call
+        )
+
+    await hass.auth.async_remove_user(hass_read_only_user)
+    await hass.async_block_till_done()
+
+    with pytest.raises(exceptions.UnknownUser):
+        await service.entity_service_call(
+            hass, [Mock(entities=mock_entities)], Mock(), call
+        )
+
+    assert len(mock_handle_entity_call.mock_calls) == 0
+
+
 async def test_register_admin_service(hass, hass_read_only_user, hass_admin_user):
     """Test the register admin service."""
     calls = []
@@ -1872,3 +1872,35 @@ def test_render_complex_handling_non_template_values(hass):
     assert template.render_complex(
         {True: 1, False: template.Template("{{ hello }}", hass)}, {"hello": 2}
     ) == {True: 1, False: "2"}
+
+
+def test_compile_cache_shared_between_templates(hass):
+    """Test equal template sources are compiled once per environment."""
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    tpl2 = template.Template("{{ 1 + 1 }}", hass)
+
+    assert tpl.async_render() == "2"
+    env = hass.data[template._ENVIRONMENT]
+    misses = env.cache_misses
+    hits = env.cache_hits
+
+    assert tpl2.async_render() == "2"
+    assert env.cache_misses == misses
+    assert env.cache_hits == hits + 1
+    assert tpl2._compiled is tpl._compiled
+
+
+def test_compile_cache_evicts_least_recently_used(hass):
+    """Test the compile cache is bounded."""
+    env = template.TemplateEnvironment(hass)
+
+    with patch.object(template, "COMPILE_CACHE_SIZE", 2):
+        env.compile_cached("{{ 1 }}")
+        env.compile_cached("{{ 2 }}")
+        env.compile_cached("{{ 1 }}")
+        env.compile_cached("{{ 3 }}")
+
+    assert list(env.template_cache) == ["{{ 1 }}", "{{ 3 }}"]
+    assert env.cache_hits == 1
+    assert env.cache_misses == 3
+    assert env.compile_time > 0
@@ -10,7 +10,9 @@ import pytest
 from homeassistant import bootstrap, core
 import homeassistant.config as config_util
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import async_get_setup_trace, async_setup_component
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import load_json
 
 from tests.async_mock import patch
 from tests.common import (
@@ -580,3 +582,20 @@ async def test_setup_safe_mode_if_no_frontend(
     assert hass.config.skip_pip
     assert hass.config.internal_url == "http://192.168.1.100:8123"
     assert hass.config.external_url == "https://abcdef.ui.nabu.casa"
+
+
+async def test_write_setup_trace(hass, tmpdir, caplog):
+    """Test the setup trace is written to the config dir when debugging."""
+    hass.config.config_dir = str(tmpdir)
+    trace_path = os.path.join(str(tmpdir), bootstrap.SETUP_TRACE_FILENAME)
+    await async_setup_component(hass, "persistent_notification", {})
+
+    caplog.set_level(logging.INFO, logger="homeassistant.bootstrap")
+    await bootstrap._async_write_setup_trace(hass)
+
+    assert not os.path.exists(trace_path)
+
+    caplog.set_level(logging.DEBUG, logger="homeassistant.bootstrap")
+    await bootstrap._async_write_setup_trace(hass)
+
+    assert load_json(trace_path) == async_get_setup_trace(hass)
@@ -112,6 +112,47 @@ def test_async_add_job_add_threaded_job_to_pool():
     assert len(hass.loop.run_in_executor.mock_calls) == 1
 
 
+def test_hassjob_job_type():
+    """Test the job type of a HassJob is determined once on creation."""
+
+    async def coro_job():
+        pass
+
+    @ha.callback
+    def callback_job():
+        pass
+
+    def executor_job():
+        pass
+
+    assert ha.HassJob(coro_job).job_type == ha.HassJobType.Coroutinefunction
+    assert (
+        ha.HassJob(functools.partial(coro_job)).job_type
+        == ha.HassJobType.Coroutinefunction
+    )
+    assert ha.HassJob(callback_job).job_type == ha.HassJobType.Callback
+    assert ha.HassJob(executor_job).job_type == ha.HassJobType.Executor
+
+
+async def test_bus_classifies_listener_once(hass):
+    """Test that listeners are not inspected again on every event."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        calls.append(event)
+
+    hass.bus.async_listen("test_event", listener)
+
+    with patch("homeassistant.core.is_callback") as mock_is_callback:
+        hass.bus.async_fire("test_event")
+        hass.bus.async_fire("test_event")
+        await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert len(mock_is_callback.mock_calls) == 0
+
+
 def test_async_create_task_schedule_coroutine(loop):
     """Test that we schedule coroutines and add jobs to the job pool."""
     hass = MagicMock(loop=MagicMock(wraps=loop))
@@ -596,6 +637,21 @@ class TestStateMachine(unittest.TestCase):
         states = sorted(state.entity_id for state in self.states.all())
         assert ["light.bowl", "switch.ac"] == states
 
+    def test_all_domain_filter(self):
+        """Test getting all states of a domain."""
+        self.states.set("light.Desk", "off")
+        states = sorted(state.entity_id for state in self.states.all("Light"))
+        assert ["light.bowl", "light.desk"] == states
+
+        self.states.set("light.desk", "on")
+        assert self.states.all("light")[1].state == "on"
+
+        self.states.remove("light.bowl")
+        self.states.remove("light.desk")
+        assert self.states.all("light") == []
+        assert self.states.entity_ids("light") == []
+        assert self.states.entity_ids("switch") == ["switch.ac"]
+
     def test_remove(self):
         """Test remove method."""
         events = []
@@ -670,6 +726,24 @@ class TestStateMachine(unittest.TestCase):
         self.hass.block_till_done()
         assert len(events) == 1
 
+    def test_unchanged_attributes_are_shared(self):
+        """Test that unchanged attributes are shared with the new state."""
+        self.states.set("light.bowl", "on", {"brightness": 100})
+        state = self.states.get("light.bowl")
+
+        self.states.set("light.bowl", "off", {"brightness": 100})
+        state2 = self.states.get("light.bowl")
+        assert state2.attributes is state.attributes
+
+        self.states.set("light.bowl", "on", state2.attributes)
+        state3 = self.states.get("light.bowl")
+        assert state3.attributes is state.attributes
+
+        self.states.set("light.bowl", "on", {"brightness": 50})
+        state4 = self.states.get("light.bowl")
+        assert state4.attributes is not state.attributes
+        assert state4.attributes == {"brightness": 50}
+
 
 def test_service_call_repr():
     """Test ServiceCall repr."""
@@ -1,4 +1,9 @@
 """Test to verify that we can load components."""
+import asyncio
+import sys
+import threading
+from types import ModuleType
+
 import pytest
 
 from homeassistant.components import http, hue
@@ -157,6 +162,116 @@ async def test_get_integration_custom_component(hass):
     assert integration.name == "Test Package"
 
 
+async def test_preload_integration(hass):
+    """Test importing an integration and its platforms in the executor."""
+    # Resolving a legacy integration imports the component itself
+    integration = await loader.async_get_integration(hass, "test_embedded")
+    sys.modules.pop("custom_components.test_embedded.switch", None)
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        await integration.async_preload(["switch"])
+
+    assert len(mock_executor.mock_calls) == 1
+    assert "custom_components.test_embedded.switch" in sys.modules
+    assert hass.data[loader.DATA_IMPORT_TIMES]["test_embedded"] > 0
+    assert integration.get_platform("switch") is not None
+
+
+async def test_preload_integration_import_error(hass):
+    """Test import errors are raised when getting the component."""
+    integration = loader.Integration(
+        hass,
+        "custom_components.does_not_exist",
+        None,
+        {"domain": "does_not_exist", "name": "Does not exist"},
+    )
+
+    await integration.async_preload()
+
+    with pytest.raises(ImportError):
+        integration.get_component()
+
+
+async def test_preload_waits_for_pending_import(hass):
+    """Test a module that is still being imported is waited for."""
+    integration = loader.Integration(
+        hass,
+        "custom_components.slow_import",
+        None,
+        {"domain": "slow_import", "name": "Slow import"},
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_preload(name):
+        # The module is in sys.modules while it is being initialized
+        sys.modules[name] = ModuleType(name)
+        started.set()
+        release.wait()
+        return 0.1
+
+    try:
+        with patch("homeassistant.loader._preload_module", slow_preload):
+            first = hass.async_create_task(integration.async_preload())
+            await hass.async_add_executor_job(started.wait)
+            second = hass.async_create_task(integration.async_preload())
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+            assert not second.done()
+
+            release.set()
+            await asyncio.gather(first, second)
+    finally:
+        release.set()
+        sys.modules.pop("custom_components.slow_import", None)
+
+    assert hass.data[loader.DATA_IMPORT_TIMES]["slow_import"] == 0.1
+
+
+async def test_preload_integrations_dependency_order(hass):
+    """Test integrations are imported after their dependencies."""
+    mod1 = mock_integration(hass, MockModule("mod1"))
+    mod2 = mock_integration(hass, MockModule("mod2", ["mod1"]))
+    mod3 = mock_integration(hass, MockModule("mod3", ["mod2"]))
+    order = []
+
+    async def mock_preload(self, platforms=()):
+        await asyncio.sleep(0)
+        order.append(self.domain)
+
+    with patch.object(loader.Integration, "async_preload", mock_preload):
+        await loader.async_preload_integrations(hass, [mod3, mod2, mod1])
+
+    assert order == ["mod1", "mod2", "mod3"]
+
+
+async def test_preload_integrations_skips_requirements(hass):
+    """Test integrations with requirements are not imported before setup."""
+    hass.config.skip_pip = False
+    mod1 = mock_integration(hass, MockModule("mod1", requirements=["req==1.0"]))
+    mod2 = mock_integration(hass, MockModule("mod2", ["mod1"]))
+    mod3 = mock_integration(hass, MockModule("mod3"))
+    preloaded = []
+
+    async def mock_preload(self, platforms=()):
+        preloaded.append(self.domain)
+
+    with patch.object(loader.Integration, "async_preload", mock_preload):
+        await loader.async_preload_integrations(hass, [mod1, mod2, mod3])
+
+    assert preloaded == ["mod3"]
+
+    hass.config.skip_pip = True
+    preloaded.clear()
+
+    with patch.object(loader.Integration, "async_preload", mock_preload):
+        await loader.async_preload_integrations(hass, [mod1, mod2, mod3])
+
+    assert sorted(preloaded) == ["mod1", "mod2", "mod3"]
+
+
 def test_integration_properties(hass):
     """Test integration properties."""
     integration = loader.Integration(
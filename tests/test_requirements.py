@@ -1,13 +1,17 @@
 """Test requirements module."""
 import os
 from pathlib import Path
+import sys
 
 import pytest
 
 from homeassistant import loader, setup
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.requirements import (
     CONSTRAINT_FILE,
+    DATA_PKG_CACHE,
     PROGRESS_FILE,
+    STORAGE_KEY,
     RequirementsNotFound,
     _install,
     async_get_integration_with_requirements,
@@ -94,6 +98,79 @@ async def test_install_missing_package(hass):
     assert len(mock_inst.mock_calls) == 1
 
 
+async def test_satisfied_requirements_are_stored(hass, hass_storage):
+    """Test satisfied requirements are not checked again for the same packages."""
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value="abc"
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+
+    # Write the delayed save
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    assert hass_storage[STORAGE_KEY]["data"] == {
+        "fingerprint": "abc",
+        "requirements": ["hello==1.0.0"],
+    }
+
+
+async def test_stored_requirements_need_same_fingerprint(hass, hass_storage):
+    """Test stored requirements are dropped when the packages changed."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "key": STORAGE_KEY,
+        "data": {"fingerprint": "abc", "requirements": ["hello==1.0.0"]},
+    }
+
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value="abc"
+    ), patch("homeassistant.util.package.is_installed") as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 0
+
+    hass.data.pop(DATA_PKG_CACHE)
+
+    with patch(
+        "homeassistant.util.package.environment_fingerprint", return_value="def"
+    ), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+
+
+async def test_stored_requirements_survive_config_dir_changes(
+    hass, hass_storage, tmp_path
+):
+    """Test files changing in the config dir keep the stored requirements."""
+    hass.config.config_dir = str(tmp_path)
+    os.utime(tmp_path, (0, 0))
+
+    with patch.object(sys, "path", [str(tmp_path), ""] + sys.path), patch(
+        "homeassistant.util.package.is_installed", return_value=True
+    ) as mock_is_installed:
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+        # Write the delayed save
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        hass.data.pop(DATA_PKG_CACHE)
+
+        wal_path = tmp_path / "home-assistant_v2.db-wal"
+        wal_path.touch()
+        wal_path.unlink()
+        await async_process_requirements(hass, "test_component", ["hello==1.0.0"])
+
+    assert len(mock_is_installed.mock_calls) == 1
+
+
 async def test_get_integration_with_requirements(hass):
     """Check getting an integration with loaded requirements."""
     hass.config.skip_pip = False
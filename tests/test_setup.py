@@ -587,3 +587,48 @@ async def test_parallel_entry_setup(hass):
     await setup.async_setup_component(hass, "comp", {})
 
     assert calls == [1, 2, 1, 2]
+
+
+async def test_setup_timeline(hass):
+    """Test the setup phases of an integration are recorded."""
+    MockConfigEntry(domain="comp", data={"value": 1}).add_to_hass(hass)
+
+    async def mock_async_setup_entry(hass, entry):
+        """Mock setting up an entry."""
+        return True
+
+    mock_integration(
+        hass, MockModule("comp", async_setup_entry=mock_async_setup_entry),
+    )
+    mock_entity_platform(hass, "config_flow.comp", None)
+    await setup.async_setup_component(hass, "comp", {})
+
+    timeline = setup.async_get_setup_timeline(hass)
+    phases = [item["phase"] for item in timeline if item["domain"] == "comp"]
+    assert phases == [
+        setup.PHASE_MANIFEST,
+        setup.PHASE_IMPORT,
+        setup.PHASE_SETUP,
+        setup.PHASE_SETUP_ENTRY,
+    ]
+    assert timeline[0]["start"] == 0
+    assert all(item["start"] <= item["end"] for item in timeline)
+
+    trace = setup.async_get_setup_trace(hass)
+    assert trace["traceEvents"][0] == {
+        "name": "thread_name",
+        "ph": "M",
+        "pid": 1,
+        "tid": 1,
+        "args": {"name": "comp"},
+    }
+    assert [event["name"] for event in trace["traceEvents"][1:]] == phases
+
+
+async def test_setup_timeline_finished(hass):
+    """Test setup phases after startup are not recorded."""
+    setup.async_finish_setup_timeline(hass)
+    mock_integration(hass, MockModule("comp"))
+    await setup.async_setup_component(hass, "comp", {})
+
+    assert setup.async_get_setup_timeline(hass) == []
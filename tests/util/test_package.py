@@ -248,3 +248,21 @@ def test_check_package_global():
 def test_check_package_zip():
     """Test for an installed zip package."""
     assert not package.is_installed(TEST_ZIP_REQ)
+
+
+def test_environment_fingerprint(tmp_path):
+    """Test the fingerprint only changes when packages change."""
+    config_dir = tmp_path / "config"
+    deps_dir = config_dir / "deps"
+    deps_dir.mkdir(parents=True)
+    os.utime(config_dir, (0, 0))
+    os.utime(deps_dir, (0, 0))
+
+    with patch.object(sys, "path", [str(config_dir), ""] + sys.path):
+        fingerprint = package.environment_fingerprint(str(deps_dir))
+
+        (config_dir / "home-assistant_v2.db-wal").touch()
+        assert package.environment_fingerprint(str(deps_dir)) == fingerprint
+
+        (deps_dir / "hello").mkdir()
+        assert package.environment_fingerprint(str(deps_dir)) != fingerprint
@@ -461,3 +461,76 @@ def test_duplicate_key(caplog):
     with patch_yaml_files(files):
         load_yaml_config_file(YAML_CONFIG_FILE)
     assert "contains duplicate key" in caplog.text
+
+
+def test_node_cache(tmp_path):
+    """Test only changed files are parsed again when the node cache is used."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text("light: !include light.yaml\nsensor:\n  - platform: demo\n")
+    light_path = tmp_path / "light.yaml"
+    light_path.write_text("- platform: hue\n")
+    (tmp_path / yaml.SECRET_YAML).write_text("password: pwd\n")
+    cache_path = str(tmp_path / "cache" / "yaml_node_cache")
+
+    with patch.object(
+        yaml_loader, "_compose", wraps=yaml_loader._compose
+    ) as mock_compose:
+        conf = load_yaml_config_file(
+            str(config_path), yaml_loader.YamlNodeCache(cache_path)
+        )
+        assert mock_compose.call_count == 2
+        assert os.path.isfile(cache_path)
+
+        # A new instance uses the entries written by the previous one.
+        mock_compose.reset_mock()
+        cache = yaml_loader.YamlNodeCache(cache_path)
+        assert load_yaml_config_file(str(config_path), cache) == conf
+        assert mock_compose.call_count == 0
+
+        # Files with a different size or modification time are only parsed
+        # again when their contents changed.
+        os.utime(light_path, ns=(0, 0))
+        assert load_yaml_config_file(str(config_path), cache) == conf
+        assert mock_compose.call_count == 0
+
+        light_path.write_text("- platform: hue\n- platform: !secret password\n")
+        conf = load_yaml_config_file(str(config_path), cache)
+        assert mock_compose.call_count == 2
+        assert mock_compose.call_args_list[0][0][0] == str(light_path)
+        assert mock_compose.call_args_list[1][0][0].endswith(yaml.SECRET_YAML)
+
+    assert conf["light"] == [{"platform": "hue"}, {"platform": "pwd"}]
+    assert conf["light"][1].__config_file__ == str(light_path)
+    assert conf["light"][1].__line__ == 1
+    assert conf["sensor"][0].__line__ == 2
+    assert str(tmp_path / yaml.SECRET_YAML) not in cache._entries
+    yaml.clear_secret_cache()
+
+
+def test_node_cache_drops_unused_and_invalid(tmp_path):
+    """Test files no longer included are dropped and broken caches ignored."""
+    config_path = tmp_path / YAML_CONFIG_FILE
+    config_path.write_text("light: !include light.yaml\n")
+    (tmp_path / "light.yaml").write_text("- platform: hue\n")
+    cache_path = tmp_path / "yaml_node_cache"
+
+    cache = yaml_loader.YamlNodeCache(str(cache_path))
+    load_yaml_config_file(str(config_path), cache)
+    assert len(cache._entries) == 2
+
+    config_path.write_text("light:\n")
+    load_yaml_config_file(str(config_path), cache)
+    assert list(cache._entries) == [str(config_path)]
+
+    cache_path.write_bytes(b"not a pickle")
+    cache = yaml_loader.YamlNodeCache(str(cache_path))
+    assert load_yaml_config_file(str(config_path), cache) == {"light": {}}
+
+    # The entries are not unpickled when the header does not match
+    cache_path.write_bytes(
+        b"home-assistant-yaml-node-cache 0 python\n" + cache_path.read_bytes()
+    )
+    with patch.object(yaml_loader.pickle, "load") as mock_load:
+        cache = yaml_loader.YamlNodeCache(str(cache_path))
+        assert load_yaml_config_file(str(config_path), cache) == {"light": {}}
+    assert not mock_load.called